@@ -48,6 +48,9 @@
 
 # general
 import datetime
+import functools
+import heapq
+import math
 import sys
 
 import numpy as np
@@ -61,12 +64,14 @@ from .elements.timed_effects import usage_habit
 from .events import event_effect
 from .util import base_parts
 from .util import central_data_store
+from .util import expiry_list
 from .util import fifo_queue
 from .util import number_output
 from .util import rnd_wrapper
 from .util import settings
 
 # 1. Global vars ===============================================================
+_TIME_RESOLUTION = datetime.timedelta(microseconds=1)  # smallest representable time difference
 
 
 # 1.1 Classes ------------------------------------------------------------------
@@ -93,12 +98,21 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         self.status                        = None
         self.next_status_change            = None
 
+        # integer codes of the above (strings only used for output & lookups)
+        self.__type_code                   = 0      # code of current_type (see life_style_habits_list_keys)
+        self.__status_code                 = 0      # code of status (see life_style_habits_list_status)
+        self.__valid_codes                 = {None: 0}  # habit 'only_valid' -> code
+        self.__valid_now                   = [True]     # per 'only_valid' code: matches the current status
+
         # Usage stuff ----------------------------------------------------------
 
         # list of usage habits (including those from events)
-        self.usage_habits_add       = []    # usage habits for addition
-        self.usage_habits_mult      = []    # usage habits for multiplication
+        self.usage_habits_add       = expiry_list.ExpiryList()  # usage habits for addition
+        self.usage_habits_mult      = expiry_list.ExpiryList()  # usage habits for multiplication
         self.usage_habits_templates = []    # templates for specific usage behaviors
+        self.__pending_cycles       = []    # heap of the next cycles of cyclical templates:
+        # (start_tp, counter, template, limit_tp, time_step, previous cycle habit)
+        self.__pending_counter      = 0     # tie breaker for the heap
         self.sw_probability         = None  # probability record
 
         # Wait until -----------------------------------------------------------
@@ -123,6 +137,19 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         # Holding results ------------------------------------------------------
         self.__probabilities        = []    # probabilities for current timestep
 
+        # Next use sampling ----------------------------------------------------
+        self.__sample_next_use      = False  # whether uses get pre-sampled for constant probabilities
+        self.__next_use             = {}     # per appliance: (timepoint, probability, per_step).
+        # If per_step is 'True', a random number is drawn every timestep until
+        # timepoint. Otherwise, if probability is not 'None', the appliance is
+        # used at that timepoint, else the probability is re-evaluated then.
+        self.__wake_calendar        = None   # model-wide calendar, to sleep until the next thing to do
+
+        # Struct-of-arrays engine ----------------------------------------------
+        self.__population           = None   # population state holding the next status change
+        self.__batch_transitions    = False  # status changes done by the population state
+        self.__pop_index            = -1
+
 
     @classmethod
     def loadFromFileData(cls, agent_data: io_agent.IOAgent,
@@ -178,19 +205,31 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
     def add_usage_habit(self,
                         habit: usage_habit.UsageHabit,
-                        during_runtime=False):
+                        during_runtime=False,
+                        previous: usage_habit.UsageHabit = None):
+        """
+        previous - if given, the habit gets placed directly after it (keeps the order of
+                   cyclical habits the same as if all cycles were added at once)
+        """
+
+        habit.valid_code = self.__get_valid_code(habit.only_valid)
+
+        # any pre-sampled use of the appliance isn't valid anymore
+        self.reset_next_use(habit.appliance)
 
         if (habit.habit_type == 'add'):
-            self.usage_habits_add.append(habit)
+            self.usage_habits_add.insert_after(previous, habit, habit.end_time)
             if (during_runtime):
-                self.usage_habits_add[-1].register(self)
-                self.usage_habits_add[-1].connect_uids()
+                habit.register(self)
+                habit.connect_uids()
+                self.__watch_function(habit)
 
         elif (habit.habit_type == 'mult'):
-            self.usage_habits_mult.append(habit)
+            self.usage_habits_mult.insert_after(previous, habit, habit.end_time)
             if (during_runtime):
-                self.usage_habits_mult[-1].register(self)
-                self.usage_habits_mult[-1].connect_uids()
+                habit.register(self)
+                habit.connect_uids()
+                self.__watch_function(habit)
 
         else:
             print('\nagent.add_usage_habit:')
@@ -209,17 +248,24 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
                                       end_tp: datetime.datetime,
                                       habit_type: str, only_valid: str,
                                       arr_x: np.array, arr_y: np.array,
-                                      time_step: int):
+                                      time_step: int,
+                                      previous: usage_habit.UsageHabit = None):
         """
         ToDo
             - refactor to take directly the template object
+
+        Returns:
+
+        habit - the created usage habit
         """
 
         #
         habit_template = usage_habit.UsageHabit(name, uniqueID, start_tp,
                                                 end_tp, habit_type, only_valid)
         habit_template.gen_data('linear', [arr_x, arr_y], time_step)
-        self.add_usage_habit(habit_template)
+        self.add_usage_habit(habit_template, previous=previous)
+
+        return habit_template
 
 
     def add_timeseries_former(self, target: str, var, val):
@@ -249,6 +295,9 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         self.register_tree_node(parent_obj)
         self.base_register(directory + '/agent_' + self.get_node_name(), cds,
                            cfg)
+        self.__sample_next_use    = cfg.sample_next_use
+        self.__batch_transitions  = cfg.batch_transitions
+        self.__wake_calendar   = cds.get_wake_calendar()
 
         for habit in self.usage_habits_add:
             habit.register(self)
@@ -275,8 +324,7 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
         # set initial status
         active_habit            = self.lifestyle_habits['initial']
-        self.current_type       = 'initial'
-        self.status             = active_habit.habit_status
+        self.__set_status('initial')
         self.next_type          = active_habit.next_type.choose_alternative(cds)
         self.next_status_change = active_habit.get_activation_tp(
             active_habit.min_duration, cds.get_current_model_time(),
@@ -312,7 +360,9 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
         # set initial probabilities to zero to avoid a mess with registering or not
         # => initial probabilities might be wrong
-        self.__probabilities  = [0.0] * len(list_appliances)
+        # (kept directly in the writer's row buffer)
+        self.__probabilities  = self.sw_probability.row
+        self.__probabilities[:] = 0.0
 
 
     def connect_uids(self):
@@ -323,9 +373,11 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
         for habit in self.usage_habits_add:
             habit.connect_uids()
+            self.__watch_function(habit)
 
         for habit in self.usage_habits_mult:
             habit.connect_uids()
+            self.__watch_function(habit)
 
         for life_status in self.lifestyle_habits.values():
             life_status.connect_uids()
@@ -347,12 +399,19 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         #         print(item)
         #     exit(255)
 
-        return (string +
-                str(self.life_style_habits_list_keys[self.current_type]) +
-                ';' + str(self.life_style_habits_list_status[self.status]) +
+        return (string + str(self.__type_code) + ';' + str(self.__status_code) +
                 ';')
 
 
+    def get_status_codes(self):
+        """
+        Returns:
+
+        (code of current lifecycle habit, code of status), see the LegendInfo files
+        """
+        return self.__type_code, self.__status_code
+
+
     def write_blocking(self, string: str):
         string = ''
 
@@ -381,10 +440,6 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
                                 current_tp=current_tp)
 
 
-    def update_storages(self, current_tp: datetime.datetime):
-        self.update_storage_values(current_tp)
-
-
     def update(self, list_appliances: list,
                cds: central_data_store.CentralDataStore, func_add_event_queue):
         """
@@ -400,37 +455,18 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
             ts              - ts_trapeze object to 
         """
 
-        # main status ..........................................................
-        if (self.next_status_change <= cds.get_current_model_time()):
-            active_habit            = self.lifestyle_habits[self.next_type]
-            self.current_type       = self.next_type
-            self.status             = active_habit.habit_status
-            self.next_type          = active_habit.next_type.choose_alternative(cds)
-            next_habit              = self.lifestyle_habits[self.next_type]
-            self.next_status_change = next_habit.get_activation_tp(
-                active_habit.min_duration, cds.get_current_model_time(),
-                cds.get_current_model_day())
+        # next cycles of cyclical habits
+        self.__add_pending_cycles(cds.get_current_model_time())
 
-            self.activate_usage_habits(cds)
-            active_habit.check_event_starts('Activate', func_add_event_queue,
-                                            cds.get_current_model_time())
+        # main status (if not done for all agents at once) .....................
+        if (self.next_status_change <= cds.get_current_model_time()
+                and not self.__batch_transitions):
+            self.begin_status_change(cds)
+            self.finish_status_change(cds, func_add_event_queue)
 
         # cleanup of overdue habits ............................................
-        habit_list = [
-            elem for elem in self.usage_habits_add
-            if elem.is_valid(cds.get_current_model_time()) is True
-        ]
-        if (len(habit_list) is not len(
-                self.usage_habits_add)):  # saves unnecessary memory copying
-            self.usage_habits_add = habit_list.copy()
-
-        habit_list = [
-            elem for elem in self.usage_habits_mult
-            if elem.is_valid(cds.get_current_model_time()) is True
-        ]
-        if (len(habit_list) is not len(
-                self.usage_habits_mult)):  # saves unnecessary memory copying
-            self.usage_habits_mult = habit_list.copy()
+        self.usage_habits_add.remove_expired(cds.get_current_model_time())
+        self.usage_habits_mult.remove_expired(cds.get_current_model_time())
 
 
         # usage probability (and output) .......................................
@@ -439,17 +475,27 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
             if not (self.busy_with == device
                     or self.action_queue.is_in(device)):
 
-                rand = rnd_wrapper.rnd_get_random_number()
-                val = self.get_probability(device,
-                                           cds.get_current_model_time(),
-                                           cds.get_compute_interval_sec())
-                if (val > rand):
-                    self.action_queue.append(device)
-                    self.__probabilities[i] = val
+                if (self.__sample_next_use):
+                    val = self.__get_next_use(device, cds)
+                    if (val is not None):
+                        self.action_queue.append(device)
+                        self.__probabilities[i] = val
+
+                else:
+                    rand = rnd_wrapper.rnd_get_random_number()
+                    val = self.get_probability(device,
+                                               cds.get_current_model_time(),
+                                               cds.get_compute_interval_sec())
+                    if (val > rand):
+                        self.action_queue.append(device)
+                        self.__probabilities[i] = val
 
             else:
                 self.__probabilities[i] = 0.0
 
+                # re-sample once the appliance is available to the agent again
+                self.__next_use.pop(device, None)
+
         # if self.action_queue.size() > 0:
         #     print('Queue:', self.action_queue.size(),
         #           cds.get_current_model_time(), self.busy_with,
@@ -457,25 +503,29 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
         # override by deferred appliance usage or being busy
         # blocks any other 'wants' or actions
-        if self.busy_until is None:
-            return self.action_queue
-
-        else:
-
+        impulses = self.action_queue
+        if (self.busy_until is not None):
             if (self.busy_until < cds.get_current_model_time()):
                 self.busy_until = None
                 self.busy_with = None
-                return self.action_queue
             else:
-                return None
+                impulses = None
+
+        # nothing changes until the next use or status change: sleep until then
+        if (self.__sample_next_use):
+            next_tp = cds.get_current_model_time() + cds.get_compute_interval()
+            wake_tp = self.__get_wake_tp(list_appliances, next_tp)
+            if (wake_tp > next_tp):
+                self.__wake_calendar.schedule(self, wake_tp)
+
+        return impulses
 
 
     def record_status(self, cds: central_data_store.CentralDataStore,
                       cfg: settings.Config):
 
-        self.sw_probability.write_record(np.array(self.__probabilities),
-                                         cds.get_current_model_time(),
-                                         cds.get_last_model_time())
+        self.sw_probability.write_row(cds.get_current_model_time(),
+                                      cds.get_last_model_time())
 
         self.base_log(cds.get_current_model_time(), cds.get_last_model_time())
 
@@ -486,6 +536,7 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         """
         self.sw_probability.close(current_tp)
         self.close_storages(current_tp)
+        self.close_passed_times(current_tp)
 
 
     def get_probability(self, appliance_name: str,
@@ -505,8 +556,7 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         probability_mult = 1.0
         for habit in self.usage_habits_mult:
             if (appliance_name == habit.appliance):
-                if (habit.only_valid is None
-                        or self.__check_status_part(habit.only_valid)):
+                if (self.__valid_now[habit.valid_code]):
                     val = habit.get_probability(current_tp, time_step)
                     probability_mult *= val  # careful, numbers can get big really fast...
 
@@ -518,8 +568,7 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         probability_add = 0.0
         for habit in self.usage_habits_add:
             if (appliance_name == habit.appliance):
-                if (habit.only_valid is None
-                        or self.__check_status_part(habit.only_valid)):
+                if (self.__valid_now[habit.valid_code]):
                     val = habit.get_probability(current_tp, time_step)
                     if (val != 0.0):
                         probability_add += val
@@ -527,6 +576,50 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         return probability_add * probability_mult
 
 
+    def begin_status_change(self, cds: central_data_store.CentralDataStore):
+        """
+        First part of the status change: moves on to the next lifecycle habit and
+        chooses the one after.
+
+        Returns:
+
+        next_habit - the lifecycle habit after, whose activation time is still to be
+                     drawn (see finish_status_change)
+        """
+        active_habit      = self.lifestyle_habits[self.next_type]
+        self.__set_status(self.next_type)
+        self.next_type    = active_habit.next_type.choose_alternative(cds)
+
+        return self.lifestyle_habits[self.next_type]
+
+
+    def finish_status_change(self, cds: central_data_store.CentralDataStore,
+                             func_add_event_queue,
+                             activation_tp: datetime.timedelta = None):
+        """
+        Second part of the status change: sets the timepoint of the next one and
+        activates the usage habits of the new status.
+
+        activation_tp - already drawn activation time (since the start of the day) of
+                        the next habit. If 'None', it gets drawn here.
+        """
+        active_habit            = self.lifestyle_habits[self.current_type]
+        next_habit              = self.lifestyle_habits[self.next_type]
+        self.next_status_change = next_habit.get_activation_tp(
+            active_habit.min_duration, cds.get_current_model_time(),
+            cds.get_current_model_day(), activation_tp)
+
+        self.__next_use = {}
+        if (self.__wake_calendar is not None):
+            self.__wake_calendar.cancel(self)
+        if (self.__population is not None):
+            self.__population.set_agent_next_change(self.__pop_index,
+                                                    self.next_status_change)
+        self.activate_usage_habits(cds)
+        active_habit.check_event_starts('Activate', func_add_event_queue,
+                                        cds.get_current_model_time())
+
+
     def set_wait_until(self, date_time: datetime.datetime, impulse: str, ts):
         """
         Sets until when the daemon has to wait for an appliance to be free.
@@ -551,19 +644,24 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         self.action_queue.remove_item(busy_with)
 
 
+    def bind_population(self, population, index: int):
+        """
+        Hands the next status change over to the population state (engine 'arrays'),
+        where the due agents get found for all at once (see batch_transitions).
+        """
+        self.__population = population
+        self.__pop_index  = index
+
+        population.set_agent_next_change(index, self.next_status_change)
+
+
     def activate_usage_habits(self, cds: central_data_store.CentralDataStore):
         """
         Check which usage habit templates should be active and sets them up.
         """
         # remove the existing ones
-        self.usage_habits_add = [
-            item for item in self.usage_habits_add
-            if item.is_valid(cds.get_current_model_time())
-        ]
-        self.usage_habits_mult = [
-            item for item in self.usage_habits_mult
-            if item.is_valid(cds.get_current_model_time())
-        ]
+        self.usage_habits_add.remove_expired(cds.get_current_model_time())
+        self.usage_habits_mult.remove_expired(cds.get_current_model_time())
 
         # setup the new ones
         for habit in self.usage_habits_templates:
@@ -578,44 +676,22 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
         """
         Turns a habit template into an active habit.
         """
-        if (self.__check_status_part(habit.only_valid)
-                or habit.only_valid is None):
+        if (self.__valid_now[self.__get_valid_code(habit.only_valid)]):
 
+            # cyclical ones: only the first cycle, the next ones get added when due
             if habit.typus == 'Cyclical_Global':
                 diff_seconds = current_tp - start_tp
                 start_time = current_tp - datetime.timedelta(seconds=(
                     diff_seconds.total_seconds() % habit.habit_length))
 
-                while True:
-                    end_time = min(
-                        start_time +
-                        datetime.timedelta(seconds=habit.habit_length),
-                        self.next_status_change)
-                    self.add_usage_habit_from_template(
-                        habit.name, habit.uniqueID, start_time, end_time,
-                        habit.habit_type, habit.only_valid, habit.arr_x,
-                        habit.arr_y, time_step)
-                    start_time = end_time
-
-                    if end_time >= self.next_status_change:
-                        break
+                self.__add_cycle(habit, start_time, self.next_status_change,
+                                 time_step)
 
             elif habit.typus == 'Cyclical':
                 start_time = current_tp
 
-                while True:
-                    end_time = min(
-                        start_time +
-                        datetime.timedelta(seconds=habit.habit_length),
-                        self.next_status_change)
-                    self.add_usage_habit_from_template(
-                        habit.name, habit.uniqueID, start_time, end_time,
-                        habit.habit_type, habit.only_valid, habit.arr_x,
-                        habit.arr_y, time_step)
-                    start_time = end_time
-
-                    if end_time >= self.next_status_change:
-                        break
+                self.__add_cycle(habit, start_time, self.next_status_change,
+                                 time_step)
 
             elif habit.typus == 'Start':
                 start_time = current_tp + datetime.timedelta(
@@ -652,6 +728,37 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
                 sys.exit(255)
 
 
+    def __add_pending_cycles(self, current_tp: datetime.datetime):
+        """
+        Adds the cycles of cyclical usage habit templates which are due.
+        """
+        while (self.__pending_cycles
+               and self.__pending_cycles[0][0] <= current_tp):
+            start_time, _, habit, limit_tp, time_step, previous = heapq.heappop(
+                self.__pending_cycles)
+            self.__add_cycle(habit, start_time, limit_tp, time_step, previous)
+
+
+    def __add_cycle(self, habit: usage_template.UsageTemplate,
+                    start_time: datetime.datetime, limit_tp: datetime.datetime,
+                    time_step: int, previous: usage_habit.UsageHabit = None):
+        """
+        Adds one cycle of a cyclical usage habit template and schedules the next one, as
+        long as limit_tp (the status change at activation) isn't reached.
+        """
+        end_time = min(start_time + datetime.timedelta(seconds=habit.habit_length),
+                       limit_tp)
+        cycle = self.add_usage_habit_from_template(
+            habit.name, habit.uniqueID, start_time, end_time, habit.habit_type,
+            habit.only_valid, habit.arr_x, habit.arr_y, time_step, previous)
+
+        if (end_time < limit_tp):
+            self.__pending_counter += 1
+            heapq.heappush(self.__pending_cycles,
+                           (end_time, self.__pending_counter, habit, limit_tp,
+                            time_step, cycle))
+
+
     def exec_event(self,
                    action: list,
                    effect: event_effect.EventEffect,
@@ -678,6 +785,10 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
             [int, sec] Current model timestep. Only works for static one.
         """
 
+        # pre-sampled uses might not be valid anymore
+        self.__next_use = {}
+        self.__wake_calendar.cancel(self)
+
         # check for non-final item
         sub_parts = action[0].split("_")
         if (sub_parts[0] in self._TARGETABLE_CHILD_OBJECTS):
@@ -706,33 +817,24 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
             elif (action[1] == 'del'):
 
-                # deal with addition habits
+                # deal with addition & multiplication habits
                 if (effect[-1:] == '_'):
-                    pattern_list = [
-                        elem for elem in self.usage_habits_add
-                        if elem.get_node_id()[0:len(effect)] is not effect
-                    ]
+                    def keep(node_id):
+                        return not node_id.startswith(effect)
                 else:  # above implies: not general del
-                    pattern_list = [
-                        elem for elem in self.usage_habits_add
-                        if elem.get_node_id() is not effect
-                    ]
+                    def keep(node_id):
+                        return node_id != effect
 
-                self.usage_habits_add = pattern_list.copy()
+                self.usage_habits_add.filter(
+                    lambda elem: keep(elem.get_node_id()))
+                self.usage_habits_mult.filter(
+                    lambda elem: keep(elem.get_node_id()))
 
-                # deal with multiplication habits
-                if (effect[-1:] == '_'):
-                    pattern_list = [
-                        elem for elem in self.usage_habits_mult
-                        if elem.get_node_id()[0:len(effect)] is not effect
-                    ]
-                else:  # above implies: not general del
-                    pattern_list = [
-                        elem for elem in self.usage_habits_mult
-                        if elem.get_node_id() is not effect
-                    ]
-
-                self.usage_habits_mult = pattern_list.copy()
+                # cycles not yet added (would get the template's name)
+                self.__pending_cycles = [
+                    entry for entry in self.__pending_cycles
+                    if keep('$usagehabit_' + entry[2].name)]
+                heapq.heapify(self.__pending_cycles)
 
             else:
                 print('\nagent.exec_event: Unsupported action-type: #' +
@@ -794,8 +896,196 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
             exit(255)
 
 
+    def __get_next_use(self, appliance_name: str,
+                       cds: central_data_store.CentralDataStore):
+        """
+        Checks whether the appliance gets used at the current timepoint. While the
+        probability stays constant, the timepoint of the next use is sampled in one go
+        (geometric distribution) instead of drawing a random number every timestep.
+
+        Returns:
+
+        probability - the probability of the appliance being used, if it is used at the
+                      current timepoint. Otherwise 'None'.
+        """
+        current_tp = cds.get_current_model_time()
+        interval   = cds.get_compute_interval()
+
+        # pre-sampled
+        entry = self.__next_use.get(appliance_name)
+        if (entry is not None):
+            if (current_tp < entry[0]):
+                if (entry[2]):
+                    return self.__get_step_use(appliance_name, cds)
+                return None
+
+            del self.__next_use[appliance_name]
+            if (entry[1] is not None):
+                return entry[1]
+
+        constant_until, constant = self.__get_constant_until(
+            appliance_name, current_tp, cds.get_compute_interval_sec())
+
+        # not constant: check every timestep
+        if not (constant):
+            self.__next_use[appliance_name] = (constant_until, None, True)
+            return self.__get_step_use(appliance_name, cds)
+
+        val = self.get_probability(appliance_name, current_tp,
+                                   cds.get_compute_interval_sec())
+
+        if (val >= 1.0):
+            return val
+
+        # number of timesteps (incl. the current one) the probability stays constant
+        num_constant = max(1, -((current_tp - constant_until) // interval))
+        constant_until = current_tp + num_constant * interval
+
+        if (val <= 0.0):
+            self.__next_use[appliance_name] = (constant_until, None, False)
+            return None
+
+        # number of timesteps without use before the next use
+        num_unused = int(math.log(1.0 - rnd_wrapper.rnd_get_random_number())
+                         / math.log(1.0 - val))
+
+        if (num_unused == 0):
+            return val
+        elif (num_unused < num_constant):
+            self.__next_use[appliance_name] = (current_tp + num_unused * interval,
+                                               val, False)
+        else:
+            self.__next_use[appliance_name] = (constant_until, None, False)
+
+        return None
+
+
+    def __get_step_use(self, appliance_name: str,
+                       cds: central_data_store.CentralDataStore):
+        """
+        Checks for the use of the appliance for the current timestep only.
+        """
+        val = self.get_probability(appliance_name, cds.get_current_model_time(),
+                                   cds.get_compute_interval_sec())
+        if (val > rnd_wrapper.rnd_get_random_number()):
+            return val
+
+        return None
+
+
+    def __get_constant_until(self, appliance_name: str,
+                             current_tp: datetime.datetime, time_step: int):
+        """
+        Gets until when the probability of using the given appliance stays constant.
+
+        Returns:
+
+        until    - timepoint before which the probability is constant (or, if not
+                   constant, before which it needs to be checked every timestep)
+        constant - whether the probability is constant
+        """
+        until    = self.next_status_change
+        constant = True
+
+        for habits in [self.usage_habits_mult, self.usage_habits_add]:
+            for habit in habits:
+                if (appliance_name == habit.appliance):
+                    if (self.__valid_now[habit.valid_code]):
+                        habit_until = habit.get_constant_until(current_tp,
+                                                               time_step)
+                        if (habit_until is None):
+                            constant    = False
+                            habit_until = habit.end_time + _TIME_RESOLUTION
+                        until = min(until, habit_until)
+
+        # not yet added cycles of cyclical habits
+        for entry in self.__pending_cycles:
+            habit = entry[2]
+            if (appliance_name == habit.uniqueID):
+                if (self.__valid_now[self.__get_valid_code(habit.only_valid)]):
+                    until = min(until, entry[0])
+
+        return until, constant
+
+
+    def __get_wake_tp(self, list_appliances: list, next_tp: datetime.datetime):
+        """
+        Gets the timepoint at which the agent needs to be updated next. Covers the
+        status change, the end of being busy, habits starting/ending/changing and the
+        pre-sampled next uses.
+        """
+        # queued wants are retried every timestep
+        if (self.action_queue.size() > 0):
+            return next_tp
+
+        wake_tp = self.next_status_change
+        if (self.__pending_cycles):
+            wake_tp = min(wake_tp, self.__pending_cycles[0][0])
+        if (self.busy_until is not None):
+            wake_tp = min(wake_tp, self.busy_until + _TIME_RESOLUTION)
+
+        for device in list_appliances:
+            if (device == self.busy_with):
+                continue
+
+            entry = self.__next_use.get(device)
+            if (entry is None or entry[2]):
+                return next_tp
+            wake_tp = min(wake_tp, entry[0])
+
+        return max(wake_tp, next_tp)
+
+
+    def reset_next_use(self, appliance_name: str):
+        """
+        Drops the pre-sampled use of the appliance (e.g. as its probability changed).
+        """
+        self.__next_use.pop(appliance_name, None)
+        if (self.__wake_calendar is not None):
+            self.__wake_calendar.cancel(self)
+
+
+    def __watch_function(self, habit: usage_habit.UsageHabit):
+        # unpredicted changes of a 'function' habit's value reset the pre-sampled use
+        habit.add_watcher((id(self), habit.appliance),
+                          functools.partial(self.reset_next_use,
+                                            habit.appliance))
+
+
+    def __set_status(self, habit_key: str):
+        """
+        Sets the current lifecycle habit (and with it the status) incl. their codes.
+        """
+        self.current_type  = habit_key
+        self.status        = self.lifestyle_habits[habit_key].habit_status
+        self.__type_code   = self.life_style_habits_list_keys[habit_key]
+        self.__status_code = self.life_style_habits_list_status[self.status]
+
+        # which 'only_valid' settings match the new status
+        for only_valid, code in self.__valid_codes.items():
+            self.__valid_now[code] = self.__check_status_part(only_valid)
+
+
+    def __get_valid_code(self, only_valid: str):
+        """
+        Gets the code for the 'only_valid' setting of a habit. New ones get added.
+        """
+        code = self.__valid_codes.get(only_valid)
+        if (code is None):
+            code = len(self.__valid_codes)
+            self.__valid_codes[only_valid] = code
+            self.__valid_now.append(self.__check_status_part(only_valid))
+
+        return code
+
+
     def __check_status_part(self, check_against):
-        if (self.status[0:len(check_against)] == check_against):
+        # matches the start of the status string. 'None': always valid
+        if (check_against is None):
+            return True
+        elif (self.status is None):
+            return False
+        elif (self.status[0:len(check_against)] == check_against):
             return True
         else:
             return False
@@ -873,7 +1163,7 @@ class Agent(base_parts.BaseParts):  # class for each consumer unit / household
 
         f.write("\n\n" + "  " * level + f"  Num Time Series Former:          {len(self.__timeseries_formers)}")
         f.write("\n" + "  " * level + f"  Num Probabilities:               {len(self.__probabilities)}")
-        f.write("\n" + "  " * level + f"  Probabilities:                   {self.__probabilities}")
+        f.write("\n" + "  " * level + f"  Probabilities:                   {[float(x) for x in self.__probabilities]}")
 
         f.write("\n" + "  " * level + f"  Current Habit:                   {self.current_type}")
         f.write("\n" + "  " * level + f"  Current Habit Status:            {self.status}")
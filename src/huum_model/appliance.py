@@ -54,6 +54,8 @@ from .util import base_parts
 from .util import central_data_store
 from .util import settings
 from .util import number_output
+from .util import activation_log
+from .util import output_selection
 
 from huum_io import appliance as io_appliance
 
@@ -90,9 +92,15 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
         self.list_ts_type  = set([])
         self.sw_ts_output  = None               # output: timeseries
         self.sw_activation = None               # output: write activation times to file
+        self.__activation_log = None            # output: activation ticks (setting 'activation_format')
+        self.__aggregations = []                # (aggregation, its columns for the output values)
         self.__array_usage = None               # fixed size list to hold demand values for output
         self._is_activated = np.array([0.0])    # switch whether this appliance was actived this timestep
 
+        # struct-of-arrays engine: if set, holds the runtime data of the patterns
+        self.__population  = None
+        self.__pop_index   = -1
+
         # debug vars
         self.__num_last    = 0
 
@@ -132,6 +140,17 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
         self.usage_pattern.append(pattern)
         self.list_ts_type.add(pattern.data_type)
 
+        if (self.__population is not None):
+            self.__population.add_pattern(pattern, self.__pop_index)
+
+
+    def bind_population(self, population, index: int):
+        """
+        Hands the runtime data over to the population state (engine 'arrays').
+        """
+        self.__population = population
+        self.__pop_index  = index
+
 
     def initialize(self, directory: str, parent_obj,
                    cds: central_data_store.CentralDataStore,
@@ -157,21 +176,38 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
             self.sw_ts_output = number_output.NumberOutput(
                 directory + '_' + self.get_node_name() + '_outputTS.csv',
                 len(self.list_ts_type), self.list_ts_type, cfg.log_TS_outputs,
-                cds.get_single_file_ts(), self.get_full_node_id())
+                cds.get_single_file_ts(), self.get_full_node_id(),
+                resample=cfg.get_output_resample(),
+                resample_how=cfg.output_resample_how)
 
-            # setup output list size
-            self.__array_usage = [0.0] * len(self.list_ts_type)
+            # output values (kept directly in the writer's row buffer)
+            self.__array_usage = self.sw_ts_output.row
+
+            # totals
+            for aggregation in cds.get_aggregations():
+                columns = aggregation.register(self, list(self.list_ts_type))
+                if (columns is not None):
+                    self.__aggregations.append((aggregation, columns))
 
         else:
             print('\nappliance.Appliance: Warning')
             print(f'Appliance {self.get_node_name()} has no output ts types setup')
 
         # setup activation output
+        log_csv = cfg.log_activation and cfg.activation_format == 'csv'
         self.sw_activation = number_output.NumberOutput(
             directory + '_' + self.get_node_name() + '_applianceActivation.csv',
-            1, ['Appliance_Activation'], cfg.log_activation,
+            1, ['Appliance_Activation'], log_csv,
             cds.get_single_file_ts(), self.get_full_node_id())
 
+        if (cfg.log_activation and not log_csv and not cfg.headless
+                and cfg.logging_type != 'none'
+                and output_selection.is_selected(self.get_full_node_id())):
+            self.__activation_log = activation_log.ActivationLog(
+                directory + '_' + self.get_node_name() + '_applianceActivation.npz',
+                cfg.activation_format, cfg.datum_start,
+                cds.get_compute_interval())
+
     def connect_uids(self):
         """
         Overridden function implementation.
@@ -186,13 +222,13 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
                                 current_tp=current_tp)
 
 
-    def update_storages(self, current_tp: datetime.datetime):
-        self.update_storage_values(current_tp)
-
-
     def update(self, current_tp: datetime.datetime,
                last_tp: datetime.datetime):
 
+        # done for all appliances at once by the population state
+        if (self.__population is not None):
+            return
+
         for pattern in self.usage_pattern:
             pattern.update(current_tp)
 
@@ -204,7 +240,14 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
             self.__num_last = len(self.usage_pattern)
 
         # usage values
-        if (len(self.list_ts_type) > 0):
+        if (self.__population is not None):
+            if (len(self.list_ts_type) > 0):
+                self.__population.get_usage(self.__pop_index,
+                                            out=self.__array_usage)
+                self.sw_ts_output.write_row(cds.get_current_model_time(),
+                                            cds.get_last_model_time())
+
+        elif (len(self.list_ts_type) > 0):
 
             for i, item in enumerate(self.list_ts_type):
                 val = 0.0
@@ -214,13 +257,18 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
 
                 self.__array_usage[i] = val
 
-            self.sw_ts_output.write_record(np.array(self.__array_usage),
-                                           cds.get_current_model_time(),
-                                           cds.get_last_model_time())
-
-        self.sw_activation.write_record(self._is_activated,
-                                        cds.get_current_model_time(),
+            self.sw_ts_output.write_row(cds.get_current_model_time(),
                                         cds.get_last_model_time())
+
+        for aggregation, columns in self.__aggregations:
+            aggregation.add(columns, self.__array_usage)
+
+        if (self.__activation_log is None):
+            self.sw_activation.write_record(self._is_activated,
+                                            cds.get_current_model_time(),
+                                            cds.get_last_model_time())
+        elif (self._is_activated[0] and output_selection.is_open()):
+            self.__activation_log.record(cds.get_current_model_time())
         self._is_activated[0] = 0.0
 
         # control status
@@ -241,6 +289,8 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
         if (len(self.list_ts_type) > 0):
             self.sw_ts_output.close(current_tp)
         self.sw_activation.close(current_tp)
+        if (self.__activation_log is not None):
+            self.__activation_log.close(current_tp)
         self.close_storages(current_tp)
 
 
@@ -256,6 +306,9 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
             if (self.blocked_until < current_tp):
                 self.blocked_until = None
                 self.blocked_by    = None
+                if (self.__population is not None):
+                    self.__population.set_appliance_blocked(self.__pop_index,
+                                                            None)
 
         return self.blocked_until
 
@@ -276,6 +329,9 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
         self.blocked_until = current_tp + self.block_length_patterns
         self.blocked_by    = daemon
         agent_block_length = current_tp + self.block_length_appliance
+        if (self.__population is not None):
+            self.__population.set_appliance_blocked(self.__pop_index,
+                                                    self.blocked_until)
 
         for pattern in self.usage_pattern:
             pattern.activate(current_tp, current_tp + pattern.get_timespan())
@@ -324,6 +380,10 @@ class Appliance(base_parts.BaseParts):  # holds all relevant appliance info
                 pattern_list = [
                     elem for elem in self.usage_pattern if elem.name != effect
                 ]
+                if (self.__population is not None):
+                    for elem in self.usage_pattern:
+                        if (elem.name == effect):
+                            elem.remove_from_population()
                 self.usage_pattern = pattern_list.copy()
 
             else:
@@ -46,6 +46,7 @@ from . import agent
 from . import room
 from .util import base_parts
 from .util import central_data_store
+from .util import code_output
 from .util import settings
 from .util import string_output
 from huum_io import consumer_unit as io_consumer_unit
@@ -72,6 +73,8 @@ class ConsumerUnit(base_parts.BaseParts
         self.appliance_classes = [
         ]  # list of appliance classes present in this consumer unit.
         self.__string_wants = ''
+        self.__categorical = False  # daemon logs as integer codes (code_output)
+        self.__appliance_codes = {None: 0}  # appliance class -> code, for wants & blocking
 
         self.sw_wants = None  # writing deduplicator: daemon: wants
         self.sw_lifecycle = None  # writing deduplicator: daemon: lifecycle
@@ -132,7 +135,8 @@ class ConsumerUnit(base_parts.BaseParts
         # setup appliances info
         self.sw_appliances = string_output.StringOutput(
             consumer_unit_prefix + self.get_node_name() +
-            '_appliances_control.csv', cfg.log_appliances)
+            '_appliances_control.csv', cfg.log_appliances,
+            self.get_full_node_id())
 
         if not (self.sw_appliances.get_file() is None):
             self.sw_appliances.get_file().write('Time;')
@@ -157,25 +161,61 @@ class ConsumerUnit(base_parts.BaseParts
         # Daemons --------------------------------------------------------------
 
         # setup daemon info
-        self.sw_wants = string_output.StringOutput(
-            consumer_unit_prefix + self.get_node_name() + '_persons_wants.csv',
-            cfg.log_wants)
+        self.__categorical = cfg.log_categorical
+        if (self.__categorical):
+            num_agents = len(self.agents)
+            for code, app_class in enumerate(self.appliance_classes, 1):
+                self.__appliance_codes[app_class] = code
+
+            self.sw_wants = code_output.CodeOutput(
+                consumer_unit_prefix + self.get_node_name() +
+                '_persons_wants.csv', cfg.log_wants, num_agents,
+                source_id=self.get_full_node_id())
+
+            self.sw_lifecycle = code_output.CodeOutput(
+                consumer_unit_prefix + self.get_node_name() +
+                '_persons_lifecycle.csv', cfg.log_lifecycle, 2 * num_agents,
+                source_id=self.get_full_node_id())
+
+            self.sw_blocking = code_output.CodeOutput(
+                consumer_unit_prefix + self.get_node_name() +
+                '_persons_blocking.csv', cfg.log_blocking, 3 * num_agents,
+                t_start=cds.get_model_start_time(),
+                time_columns=[3 * i + j for i in range(num_agents)
+                              for j in (1, 2)],
+                source_id=self.get_full_node_id())
 
-        self.sw_lifecycle = string_output.StringOutput(
-            consumer_unit_prefix + self.get_node_name() +
-            '_persons_lifecycle.csv', cfg.log_lifecycle)
+        else:
+            self.sw_wants = string_output.StringOutput(
+                consumer_unit_prefix + self.get_node_name() +
+                '_persons_wants.csv', cfg.log_wants, self.get_full_node_id())
 
-        self.sw_blocking = string_output.StringOutput(
-            consumer_unit_prefix + self.get_node_name() +
-            '_persons_blocking.csv', cfg.log_blocking)
+            self.sw_lifecycle = string_output.StringOutput(
+                consumer_unit_prefix + self.get_node_name() +
+                '_persons_lifecycle.csv', cfg.log_lifecycle,
+                self.get_full_node_id())
+
+            self.sw_blocking = string_output.StringOutput(
+                consumer_unit_prefix + self.get_node_name() +
+                '_persons_blocking.csv', cfg.log_blocking,
+                self.get_full_node_id())
 
         if not (cfg.headless or cfg.logging_type == 'none'):
-            if (cfg.log_lifecycle):
-                self.sw_lifecycle.get_file().write('Time;')
-            if (cfg.log_wants):
-                self.sw_wants.get_file().write('Time;')
-            if (cfg.log_blocking):
-                self.sw_blocking.get_file().write('Time;')
+            self.sw_lifecycle.direct_write('Time;')
+            self.sw_wants.direct_write('Time;')
+            self.sw_blocking.direct_write('Time;')
+
+            # write appliance legend
+            if (self.__categorical
+                    and not (self.sw_wants.get_file() is None
+                             and self.sw_blocking.get_file() is None)):
+                f = open(
+                    consumer_unit_prefix + 'LegendInfo_' +
+                    self.get_node_name() + '_appliances.csv', 'w')
+                f.write('Id;Appliance;\n')
+                for key, value in self.__appliance_codes.items():
+                    f.write(str(value) + ';' + str(key) + ';\n')
+                f.close()
 
         # do daemon init
         for daemon in self.agents:
@@ -185,6 +225,11 @@ class ConsumerUnit(base_parts.BaseParts
                               consumer_unit_prefix,
                               self.unique_appliances.keys(), self, cds, cfg)
 
+        # finish the headers
+        if (self.__categorical):
+            for writer in [self.sw_lifecycle, self.sw_wants, self.sw_blocking]:
+                writer.direct_write('\n')
+
     def connect_uids(self):
         """
         Overridden function implementation.
@@ -207,13 +252,6 @@ class ConsumerUnit(base_parts.BaseParts
         for daemon in self.agents:
             daemon.update_events(current_tp, func_add_event_queue_item)
 
-    def update_storages(self, current_tp: datetime.datetime):
-        self.update_storage_values(current_tp)
-        for chamber in self.rooms:
-            chamber.update_storages(current_tp)
-        for daemon in self.agents:
-            daemon.update_storages(current_tp)
-
     def update(self, cds: central_data_store.CentralDataStore,
                cfg: settings.Config, func_add_event_queue_item):
         """
@@ -227,9 +265,15 @@ class ConsumerUnit(base_parts.BaseParts
 
         # Get what the deamons want --------------------------------------------
         self.__string_wants = ''
-        for daemon in self.agents:
-            impulses = daemon.update(self.appliance_classes, cds,
-                                     func_add_event_queue_item)
+        calendar = cds.get_wake_calendar()
+        for index, daemon in enumerate(self.agents):
+
+            # sleeping agents have nothing to do
+            if (calendar.is_sleeping(daemon)):
+                impulses = None
+            else:
+                impulses = daemon.update(self.appliance_classes, cds,
+                                         func_add_event_queue_item)
             # print('\n', cds.get_current_model_time(), impulses)
 
             # checking for appliance usage
@@ -256,7 +300,9 @@ class ConsumerUnit(base_parts.BaseParts
             # for write
             if not (cfg.headless or cfg.logging_type == 'none'
                     or not cfg.log_wants):
-                if (impulse is not None):
+                if (self.__categorical):
+                    self.sw_wants.row[index] = self.__appliance_codes[impulse]
+                elif (impulse is not None):
                     self.__string_wants += impulse + ';'
                 else:
                     self.__string_wants += 'None;'
@@ -269,7 +315,10 @@ class ConsumerUnit(base_parts.BaseParts
             chamber.record_status(cds, cfg)
 
         # daemons
-        if not (cfg.headless or cfg.logging_type == 'none'):
+        if (self.__categorical):
+            self.__record_status_codes(cds, cfg)
+
+        elif not (cfg.headless or cfg.logging_type == 'none'):
 
             if (cfg.log_lifecycle):
                 string_status = ''
@@ -304,6 +353,39 @@ class ConsumerUnit(base_parts.BaseParts
             self.base_log(cds.get_current_model_time(),
                           cds.get_last_model_time())
 
+    def __record_status_codes(self, cds: central_data_store.CentralDataStore,
+                              cfg: settings.Config):
+        """
+        record_status for the integer coded daemon logs (setting 'log_categorical').
+        """
+        if not (cfg.headless or cfg.logging_type == 'none'):
+
+            row_status   = self.sw_lifecycle.row
+            row_blocking = self.sw_blocking.row
+            for index, daemon in enumerate(self.agents):
+                daemon.record_status(cds, cfg)
+
+                # extra daemon info
+                if (cfg.log_lifecycle):
+                    row_status[2 * index:2 * index + 2] = daemon.get_status_codes()
+                if (cfg.log_blocking):
+                    row_blocking[3 * index:3 * index + 3] = (
+                        self.__appliance_codes[daemon.wait_for_what],
+                        self.sw_blocking.to_code(daemon.wait_until),
+                        self.sw_blocking.to_code(daemon.busy_until))
+
+            # write daemon status ----------------------------------------------
+            self.sw_lifecycle.write(cds.get_current_model_time(),
+                                    cds.get_last_model_time())
+            self.sw_wants.write(cds.get_current_model_time(),
+                                cds.get_last_model_time())
+            self.sw_blocking.write(cds.get_current_model_time(),
+                                   cds.get_last_model_time())
+
+            # Deal with storages, etc ------------------------------------------
+            self.base_log(cds.get_current_model_time(),
+                          cds.get_last_model_time())
+
     def close(self, current_tp: datetime.datetime):
         for daemon in self.agents:
             daemon.close(current_tp)
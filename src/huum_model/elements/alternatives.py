@@ -36,6 +36,7 @@
 
 # 0. Imports ===================================================================
 from ..util import central_data_store
+from ..util import flyweight
 
 # 1. Global vars ===============================================================
 
@@ -61,18 +62,29 @@ class Alternatives:  # class for dealing with when there is a list to choose fro
         condition - what to test against
         value     - return value, if it passes
         """
-        self.Alternatives.append([name, condition, value])
+        self.Alternatives.append([name, condition, value.lower()])
 
         
     def choose_alternative(self, cds: central_data_store.CentralDataStore):
         """
         Returns the chosen alternative
         """
+        flags = cds.get_calendar_flags()
         for choice in self.Alternatives:
-            if (choice[1].evaluate(cds)):
-                return choice[2].lower()
+            if (choice[1].matches(flags)):
+                return choice[2]
 
-        return self.default.lower()
+        return self.default
+
+
+    def share(self):
+        """
+        Returns the shared instance with the same content. Only to be called once all
+        alternatives are added.
+        """
+        key = tuple((name, id(condition), value)
+                    for name, condition, value in self.Alternatives)
+        return flyweight.share(self, (self.default, key))
 
 
 # 2. Functions =================================================================
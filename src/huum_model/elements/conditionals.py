@@ -42,7 +42,9 @@ import sys
 import time
 
 # internal
+from ..util import calendar_table
 from ..util import central_data_store
+from ..util import flyweight
 
 # 1. Global vars ===============================================================
 
@@ -52,23 +54,52 @@ class Condition:  # data structure to deal with a condition
     
     def __init__(self, variable, operator, value):
         """
-        variable - what to check for
-        operator - comparison operator
+        variable - what to check for. Supported: $weekday (e.g. 'Monday'), $month (e.g.
+                   'January' or 1), $holiday (public holiday, 'True' or 'False'),
+                   $season ('winter', 'spring', 'summer' or 'autumn')
+        operator - comparison operator ('==' or '!=')
         value    - what value to compare to
-        model    - link to main model
         """
         self.variable = variable.lower()
         self.operator = operator.lower()
         self.value    = value
 
+        # compile into a bitmask of the calendar table
+        self.mask     = 0       # calendar properties (bits) to check for
+        self.negate   = False   # whether the check gets inverted
+
+        if (self.operator == '!='):
+            self.negate = True
+        elif (self.operator != '=='):
+            print('\nCondition.__init__: Error: Variable: ', self.variable,
+                  ' unsupported operator: ', self.operator)
+            sys.exit(255)
+
         # do variable specific stuff
         if (self.variable == '$weekday'):
-            if (self.operator == '=='):
-                self.value = time.strptime(value, '%A').tm_wday
+            self.value = time.strptime(value, '%A').tm_wday
+            self.mask  = calendar_table.get_weekday_mask(self.value)
+
+        elif (self.variable == '$month'):
+            if (isinstance(value, str) and not value.isdigit()):
+                self.value = time.strptime(value, '%B').tm_mon
             else:
-                print('\nCondition.__init__: Error: Variable: ', self.variable,
-                      ' unsupported operator: ', self.operator)
+                self.value = int(value)
+            self.mask = calendar_table.get_month_mask(self.value)
+
+        elif (self.variable == '$holiday'):
+            self.value = str(value).lower() in ['true', 'yes', '1']
+            self.mask  = calendar_table.get_holiday_mask()
+            if not (self.value):
+                self.negate = not self.negate
+
+        elif (self.variable == '$season'):
+            self.value = str(value).lower()
+            if not (self.value in calendar_table.SEASONS):
+                print('\nCondition.__init__: Error: Unknown season: ', value)
+                print('Supported:', calendar_table.SEASONS)
                 sys.exit(255)
+            self.mask = calendar_table.get_season_mask(self.value)
 
         else:
             print('\nCondition.__init__: Error: Unknown Variable: ',
@@ -80,24 +111,21 @@ class Condition:  # data structure to deal with a condition
     def fromString(cls, condition_data):
         cls = Condition(condition_data.what, condition_data.type,
                         condition_data.value)
-        return cls
+        return flyweight.share(cls, (cls.variable, cls.operator, cls.value))
 
         
     def evaluate(self, cds: central_data_store.CentralDataStore):
         """
         Evaluates whether the condition is true
         """
-        if (self.variable == '$weekday'):
-            if (self.value == cds.get_current_model_dayOfWeek()):
-                return True
-        
-        elif(self.variable != ''):
-            print('\nError: conditionals.evaluate:')
-            print(f'Unsupported variable type: {self.variable}')
-            print()
-            exit(255)
+        return self.matches(cds.get_calendar_flags())
+
 
-        return False
+    def matches(self, flags: int):
+        """
+        Evaluates the condition against the calendar properties (bitmask) of a day.
+        """
+        return ((flags & self.mask) != 0) != self.negate
 
 
 # 2. Functions =================================================================
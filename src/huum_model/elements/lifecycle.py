@@ -86,6 +86,7 @@ class Habit(base_data.BaseData,
         for alt in file_data.next:
             cond = conditionals.Condition.fromString(alt.condition)
             possibilities.add_alternative(alt.target, cond, alt.target)
+        possibilities = possibilities.share()
 
         # generate lifestyle habit
         prob = probability_type.ProbabilityType.fromFileData(
@@ -115,25 +116,28 @@ class Habit(base_data.BaseData,
 
 
     def get_activation_tp(self, min_duration, current_tp: datetime.datetime,
-                          current_day: datetime.datetime):
+                          current_day: datetime.datetime,
+                          activation_tp: datetime.timedelta = None):
         """
         Returns the next activation timepoint.
 
-        min_duration - minimum duration for habit
+        min_duration  - minimum duration for habit
+        activation_tp - already drawn activation time (since the start of the day). If
+                        'None', it gets drawn from the probability type.
         """
 
+        if (activation_tp is None):
+            activation_tp = self.probability_type.get_activation_tp()
+
         # prep minimum length
         minimum_extend = current_tp + datetime.timedelta(
             seconds=min_duration) - current_day
 
         # default given interval
         if (self.min_duration > 0):
-            time_target = max(
-                minimum_extend,
-                self.probability_type.get_activation_tp()) + current_day
+            time_target = max(minimum_extend, activation_tp) + current_day
         else:
-            time_target = self.probability_type.get_activation_tp(
-            ) + current_day
+            time_target = activation_tp + current_day
 
         # sanity check that next TP isn't in the past
         if (current_tp > time_target):
@@ -51,7 +51,9 @@ import datetime
 import sys
 
 # internal
+from ..util import flyweight
 from ..util import rnd_wrapper
+from ..util import tick_memo
 
 
 # 1. Global vars ===============================================================
@@ -88,6 +90,10 @@ class ProbabilityType:     # class to wrap all supported probabilities
             print(file_data)
             exit(255)
 
+        # function ones get linked to their parent object
+        if (file_data.type != 'Function'):
+            cls = flyweight.share(cls, (cls.__type, cls.__a, cls.__b, cls.__c))
+
         return cls
 
 
@@ -113,6 +119,29 @@ class ProbabilityType:     # class to wrap all supported probabilities
             sys.exit(255)
 
 
+    def get_activation_tps(self, num: int):
+        """
+        Draws num activation timepoints at once (one vectorised draw).
+
+        Returns:
+
+        tps - list of the activation timepoints (since the start of the day)
+        """
+        if (self.__type == 'Constant'):
+            return [datetime.timedelta(seconds=self.__a)] * num
+
+        elif (self.__type == 'Uniform'):
+            values = rnd_wrapper.rnd_get_uniform_dist_array(self.__a, self.__b, num)
+
+        elif (self.__type == 'Gauss'):
+            values = rnd_wrapper.rnd_get_gauss_dist_array(self.__a, self.__b, num)
+
+        else:   # no batch version
+            return [self.get_activation_tp() for _ in range(num)]
+
+        return [datetime.timedelta(seconds=val) for val in values.tolist()]
+
+
     def get_probability_value(self, current_tp: datetime.datetime):
         if (self.__type == 'Constant'):
             return self.__a
@@ -124,17 +153,7 @@ class ProbabilityType:     # class to wrap all supported probabilities
             return rnd_wrapper.rnd_get_gauss_dist(self.__a, self.__b)
 
         elif (self.__type == 'Function'):
-
-            if (self.__func is None):
-                returned_obj = self.__b.get_uid_target_obj(self.__a)
-                if (len(returned_obj) != 1):
-                    print('\nError: probability_type.get_probability_value:')
-                    print('Target for functions returns more than one object')
-                    print(f'Target: {self.__a.lower()}')
-                    exit(255)
-                self.__func = returned_obj[0]
-
-            return self.__func(current_tp)
+            return tick_memo.call(self.__get_func(), current_tp)
 
         else:
             print('\nError: Probability_Type.get_probability_value:')
@@ -142,6 +161,52 @@ class ProbabilityType:     # class to wrap all supported probabilities
             sys.exit(255)
 
 
+    def get_constant_until(self, current_tp: datetime.datetime):
+        """
+        Gets until when get_probability_value stays the same.
+
+        Returns:
+
+        until - timepoint before which the value is constant. Returns 'None' if it isn't
+                known in advance (random values, functions whose owner can't predict
+                them).
+        """
+        if (self.__type == 'Constant'):
+            return datetime.datetime.max
+
+        elif (self.__type == 'Function'):
+            owner = getattr(self.__get_func(), '__self__', None)
+            if (hasattr(owner, 'get_constant_until')):
+                return owner.get_constant_until(current_tp)
+
+        return None
+
+
+    def add_watcher(self, key, func):
+        """
+        For type 'Function': registers the callback for changes of the function's value,
+        which weren't predicted by get_constant_until (if supported by its owner).
+        """
+        if (self.__type == 'Function'):
+            owner = getattr(self.__get_func(), '__self__', None)
+            if (hasattr(owner, 'add_watcher')):
+                owner.add_watcher(key, func)
+
+
+    def __get_func(self):
+        # the function of type 'Function', resolved on first use
+        if (self.__func is None):
+            returned_obj = self.__b.get_uid_target_obj(self.__a)
+            if (len(returned_obj) != 1):
+                print('\nError: probability_type.get_probability_value:')
+                print('Target for functions returns more than one object')
+                print(f'Target: {self.__a.lower()}')
+                exit(255)
+            self.__func = returned_obj[0]
+
+        return self.__func
+
+
 
 # 2. Functions =================================================================
 
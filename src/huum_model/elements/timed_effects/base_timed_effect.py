@@ -47,6 +47,10 @@ class BaseTimedEffect:  # class for each type of usage habit - probability
         self._time_end   = time_end
 
 
+    def get_time_end(self):
+        return self._time_end
+
+
     def is_valid(self, current_time):
         """
         Checks if the object is still valid. 
@@ -45,13 +45,19 @@
 
 # Internal
 from ...graph import base_connection
+from ...util import array_cache
 from ...util import central_data_store
+from ...util import tick_memo
 
 # External
 import datetime
+import math
 import numpy as np
 
 # 1. Global vars ===============================================================
+_TIME_RESOLUTION = datetime.timedelta(microseconds=1)  # smallest representable time difference
+_LINEAR_DATA     = array_cache.ArrayCache()            # interpolated data (and its change positions),
+# key: (x-values, y-values, time_step). Shared read-only between all habits
 
 
 # 1.1 Classes ------------------------------------------------------------------
@@ -80,6 +86,7 @@ class UsageHabit(base_connection.BaseConnection
             self.only_valid = None
 
         self.appliance  = appliance.lower()     # name of target appliance
+        self.valid_code = 0                     # code of only_valid, set by the agent using it
         self.start_time = start_time            # probability from when onwards it affects the appliance
         self.end_time   = end_time              # probability until when it affects the appliance
         self.habit_type = habit_type.lower()    # what kind of habit it is 'add'itive or 'mult'iplicative
@@ -88,7 +95,10 @@ class UsageHabit(base_connection.BaseConnection
 
         self._data_type = None                  # data type of this usage habit
         self._func      = None                  # function for data type 'function'
+        self._func_owner = None                 # object the function belongs to
         self._val_const = None                  # constant value given
+        self._data_changes = None               # positions in data where the value changes (for 'linear').
+        # Might go beyond the end of data, as it is shared with longer habits
 
         # set stuff which can be set
         if (habit_type == 'add'):
@@ -158,8 +168,22 @@ class UsageHabit(base_connection.BaseConnection
             # get needed array size
             interval   = self.end_time - self.start_time
             array_size = int(interval.total_seconds()) / time_step
-            x          = np.arange(0, array_size * time_step, time_step)
-            self.data  = np.interp(x, val[0], val[1])
+            num_values = max(0, math.ceil(array_size))
+
+            # shorter habits (e.g. cut off by a status change) use the start of the array
+            x_values = np.asarray(val[0])
+            y_values = np.asarray(val[1])
+            key      = (x_values.dtype.str, x_values.tobytes(),
+                        y_values.dtype.str, y_values.tobytes(), time_step)
+            entry    = _LINEAR_DATA.get(key)
+            if (entry is None or entry[0].size < num_values):
+                x     = np.arange(0, array_size * time_step, time_step)
+                data  = np.interp(x, x_values, y_values)
+                entry = _LINEAR_DATA.put(key, data,
+                                         np.flatnonzero(np.diff(data)) + 1)
+
+            self.data          = entry[0][:num_values]
+            self._data_changes = entry[1]
 
         elif (self._data_type == 'function'):
             self.data = val
@@ -203,7 +227,17 @@ class UsageHabit(base_connection.BaseConnection
                 f'\nCurrent ID:   {self.get_full_node_id()}'
                 f'\nQuery string: {self.data}')
 
-            self._func = uid_obj[0]
+            self._func       = uid_obj[0]
+            self._func_owner = getattr(self._func, '__self__', None)
+
+
+    def add_watcher(self, key, func):
+        """
+        For data type 'function': registers the callback for changes of the function's
+        value, which weren't predicted by get_constant_until (if supported by its owner).
+        """
+        if (hasattr(self._func_owner, 'add_watcher')):
+            self._func_owner.add_watcher(key, func)
 
 
     def get_probability(self, current_tp: datetime.datetime, time_step: int):
@@ -240,7 +274,7 @@ class UsageHabit(base_connection.BaseConnection
                 return float(self.data[int(diff_entry)])
 
         elif (self._data_type == 'function'):
-            return self._func(self.only_valid)
+            return tick_memo.call(self._func, self.only_valid)
 
         else:
             print('Error: UsageHabit.get_probability')
@@ -248,6 +282,53 @@ class UsageHabit(base_connection.BaseConnection
             exit(255)
 
 
+    def get_constant_until(self, current_tp: datetime.datetime,
+                           time_step: int):
+        """
+        Gets until when the probability stays the same as for the current timepoint.
+
+        Returns:
+
+        until - timepoint before which the probability is constant. Returns 'None' if the
+                probability isn't known in advance (data type 'function', if its owner
+                can't predict it).
+        """
+        if (self.start_time > current_tp):
+            return self.start_time
+
+        # valid including the end time itself
+        end_time = self.end_time + _TIME_RESOLUTION
+
+        if (self._data_type == 'constant'):
+            return end_time
+
+        elif (self._data_type == 'linear'):
+            diff       = current_tp - self.start_time
+            diff_entry = int(diff.total_seconds() / float(time_step))
+
+            if (diff_entry >= self.data.size):
+                return end_time
+
+            pos = np.searchsorted(self._data_changes, diff_entry, side='right')
+            if (pos < self._data_changes.size):
+                next_entry = min(int(self._data_changes[pos]), self.data.size)
+            else:
+                next_entry = self.data.size
+
+            return min(end_time, self.start_time +
+                       datetime.timedelta(seconds=next_entry * time_step))
+
+        elif (hasattr(self._func_owner, 'get_constant_until')):
+            until = self._func_owner.get_constant_until(current_tp,
+                                                        self.only_valid)
+            if (until is None):
+                return None
+            return min(end_time, until)
+
+        else:
+            return None
+
+
     def is_valid(self, current_tp: datetime.datetime):
         # checks whether the usage habit is still valid
         if (self.end_time < current_tp):
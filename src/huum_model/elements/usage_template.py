@@ -43,6 +43,8 @@
 # 0. Imports ===================================================================
 import numpy as np
 
+from ..util import flyweight
+
 # 1. Global vars ===============================================================
 
 
@@ -91,7 +93,11 @@ class UsageTemplate:
                             habit_type=file_data.computation_type,
                             time_buffer=int(file_data.buffer))
 
-        return cls
+        return flyweight.share(cls, (cls.name, cls.uniqueID, cls.only_valid,
+                                     cls.typus, cls.habit_length,
+                                     flyweight.content_key(cls.arr_x),
+                                     flyweight.content_key(cls.arr_y),
+                                     cls.habit_type, cls.time_buffer))
 
 
     def output_overview(self, f, level: int = -1):
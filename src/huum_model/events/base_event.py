@@ -114,8 +114,12 @@ class BaseEvent(object):   # class to be extended for each node
         time_start - (refactor to using __**kwargs__) start time to be passed on
         """
         for happening in self.__events:
-            if (happening.get_probability(event_type, current_tp) >=
-                    rnd_wrapper.rnd_get_random_number()):
+            if (event_type == 'Probability'):
+                starts = happening.check_start(current_tp)
+            else:
+                starts = (happening.get_probability(event_type, current_tp) >=
+                          rnd_wrapper.rnd_get_random_number())
+            if (starts):
                 happening.activate(func_add_event_queue, time_start=time_start)
 
 
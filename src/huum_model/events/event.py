@@ -47,11 +47,13 @@
 
 # Internal
 from ..util import base_data
+from ..util import rnd_wrapper
 from ..elements import probability_type as prob_type
 from . import event_effect
 
 # External
 import datetime
+import math
 
 # 1. Global vars ===============================================================
 
@@ -62,6 +64,10 @@ class Event(base_data.BaseData):  # class to hold event relevant data
     _TARGETABLE_CHILD_OBJECTS = [
     ]  # which child objects are targetable. Needs to be set in each class extensions
 
+    # class variables (shared settings)
+    _sample_interval = None     # model timestep, if starts get pre-sampled (setting
+    # 'sample_next_use'), 'None': a random number is drawn every timestep
+
     def __init__(self,
                  name,
                  event_type,
@@ -81,6 +87,10 @@ class Event(base_data.BaseData):  # class to hold event relevant data
 
         self.__effects     = []
 
+        # pre-sampled start, see check_start
+        self.__next_check  = None   # no need to check before this timepoint
+        self.__next_hit    = False  # whether the event starts at __next_check
+
 
     @classmethod
     def loadFromFileData(cls, file_data, time_step: int):
@@ -132,6 +142,12 @@ class Event(base_data.BaseData):  # class to hold event relevant data
         for effect in self.__effects:
             effect.connect(self)
 
+        # unpredicted changes of a function probability reset the pre-sampled start
+        if (Event._sample_interval is not None and self.__probability is not None
+                and self.__event_type == 'Probability'):
+            self.__probability.add_watcher((id(self), 'event'),
+                                           self.reset_next_check)
+
 
     def check(self):
         if (self.__event_type == 'Probability'):
@@ -177,6 +193,67 @@ class Event(base_data.BaseData):  # class to hold event relevant data
         return prob
 
 
+    def check_start(self, current_tp: datetime.datetime):
+        """
+        Checks whether the event starts at current_tp (event type 'Probability'). With
+        pre-sampling, while the probability stays constant (see
+        ProbabilityType.get_constant_until), the timepoint of the next start is sampled in
+        one go (geometric distribution), as for the agents' appliance uses. Otherwise a
+        random number is drawn every timestep.
+        """
+        if (Event._sample_interval is None or not self.__active
+                or self.__event_type != 'Probability'):
+            return (self.get_probability('Probability', current_tp) >=
+                    rnd_wrapper.rnd_get_random_number())
+
+        # pre-sampled
+        if (self.__next_check is not None):
+            if (current_tp < self.__next_check):
+                return False
+
+            self.__next_check = None
+            if (self.__next_hit):
+                return True
+
+        until = self.__probability.get_constant_until(current_tp)
+        if (until is None):
+            return (self.__probability.get_probability_value(current_tp) >=
+                    rnd_wrapper.rnd_get_random_number())
+
+        val = self.__probability.get_probability_value(current_tp)
+        if (val >= 1.0):
+            return True
+
+        # number of timesteps (incl. the current one) the probability stays constant
+        interval     = Event._sample_interval
+        num_constant = max(1, -((current_tp - until) // interval))
+        if (until != datetime.datetime.max):
+            until = current_tp + num_constant * interval
+
+        self.__next_check = until
+        self.__next_hit   = False
+        if (val <= 0.0):
+            return False
+
+        # number of timesteps without a start before the next one
+        num_unused = int(math.log(1.0 - rnd_wrapper.rnd_get_random_number())
+                         / math.log(1.0 - val))
+
+        if (num_unused == 0):
+            self.__next_check = None
+            return True
+        elif (num_unused < num_constant):
+            self.__next_check = current_tp + num_unused * interval
+            self.__next_hit   = True
+
+        return False
+
+
+    def reset_next_check(self):
+        """ Drops the pre-sampled start (e.g. as the probability changed)."""
+        self.__next_check = None
+
+
     def activate(self, func_add_event_queue_item, time_start=None):
 
         for effect in self.__effects:
@@ -185,6 +262,11 @@ class Event(base_data.BaseData):  # class to hold event relevant data
         return
 
 
+    @classmethod
+    def setup_class_vars(cls, sample_interval: datetime.timedelta = None):
+        cls._sample_interval = sample_interval
+
+
     def exec_event(self,
                    action,
                    effect,
@@ -228,6 +310,7 @@ class Event(base_data.BaseData):  # class to hold event relevant data
         status - specific status (true/false)
         """
         self.__active = status
+        self.reset_next_check()
 
 
 # 2. Functions =================================================================
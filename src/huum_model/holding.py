@@ -117,11 +117,6 @@ class Holding(base_parts.BaseParts):  # holds the info for a whole property
         for cu in self.consumer_units:
             cu.update_events(current_tp, func_add_event_queue_item)
 
-    def update_storages(self, current_tp: datetime.datetime):
-        self.update_storage_values(current_tp)
-        for cu in self.consumer_units:
-            cu.update_storages(current_tp)
-
     def update(self, cds: central_data_store.CentralDataStore,
                cfg: settings.Config, func_add_event_queue):
         """
@@ -45,7 +45,9 @@ from tqdm import tqdm
 
 # internal
 from . import holding
+from . import population
 from .events import base_event
+from .events import event
 from .events import event_queue
 from .graph import base_connection
 from .translators.passed_time import base_passed_time
@@ -54,7 +56,13 @@ from .util import central_data_store
 from .util import rnd_wrapper
 from .util import settings
 from .util import string_output
+from .util import tick_memo
 from .util import number_output
+from .util import aggregation
+from .util import binary_output
+from .util import output_file
+from .util import output_selection
+from .util import sqlite_sink
 from huum_io import model
 
 # 1. Global vars ===============================================================
@@ -77,6 +85,7 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         self.cfg             = cfg
         self.__simtime       = None
         self._single_file_ts = None
+        self.population      = None   # struct-of-arrays state (engine 'arrays')
 
         # cleanup output folder
         if not (cfg.headless):
@@ -102,7 +111,9 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
             t_end=self.cfg.datum_end,
             time_step=time_step,
             log_passed_time=cfg.log_passed_time,
-            log_storages=cfg.log_storages)
+            log_storages=cfg.log_storages,
+            holidays=cfg.holidays,
+            lazy_storages=cfg.lazy_storages)
 
         # setups which can already be done now
         self.cds.set_current_model_time(self.cfg.datum_start)
@@ -139,6 +150,10 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         if (self.cfg.seed is not None):
             rnd_wrapper.rnd_set_seed(self.cfg.seed)
 
+        tick_memo.setup(self.cfg.memo_functions)
+        event.Event.setup_class_vars(
+            self.cds.get_compute_interval() if self.cfg.sample_next_use else None)
+
         if not (output_filter is None):
             self.cfg.logging_type = output_filter
 
@@ -156,12 +171,32 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
             self.cfg.log_probability = False
             self.cfg.log_TS_outputs  = True
 
+        output_file.setup(self.cfg.output_compression,
+                          self.cfg.output_compression_level,
+                          self.cfg.output_chunk_lines,
+                          self.cfg.output_partition, self.cfg.datum_start,
+                          self.cds.get_compute_interval(),
+                          self.cfg.output_prefix + '/manifest.csv')
+        sqlite_file = None
+        if (self.cfg.output_sqlite and not self.cfg.headless
+                and self.cfg.logging_type != 'none'
+                and not self.cfg.log_as_single):
+            sqlite_file = self.cfg.output_prefix + '/results.sqlite'
+        sqlite_sink.setup(sqlite_file, self.cfg.output_prefix + '/',
+                          self.cfg.datum_start, self.cds.get_compute_interval(),
+                          self.cfg.output_sqlite_batch)
+        binary_format = None
+        if (not self.cfg.headless and self.cfg.logging_type != 'none'
+                and not self.cfg.log_as_single):
+            binary_format = self.cfg.output_binary
+        binary_output.setup(binary_format, self.cfg.output_binary_dtype)
         string_output.setup_class_vars(self.cfg.get_headless,
                                        self.cfg.get_logging_type,
                                        self.cfg.get_log_as_single)
         number_output.setup_class_vars(self.cfg.get_headless,
                                        self.cfg.get_logging_type,
-                                       self.cfg.get_log_as_single)
+                                       self.cfg.get_log_as_single,
+                                       self.cfg.output_block_size)
 
         # setups for output
         if (self.cfg.log_TS_outputs and self.cfg.log_as_single):
@@ -170,13 +205,22 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
 
             else:
                 os.makedirs(self.cfg.output_prefix + '/', exist_ok=True)
-                self._single_file_ts = open(self.cfg.output_prefix + '/single_ts.csv', 'w')
+                self._single_file_ts = output_file.open_output(
+                    self.cfg.output_prefix + '/single_ts.csv')
                 self.cds.set_single_file_ts(self._single_file_ts)
                 self._single_file_ts.write('Time;')
 
         # main data setup ------------------------------------------------------
         self.__simtime = datetime.datetime.now()
 
+        # output selection
+        output_selection.setup(self.cfg.output_windows,
+                               self.cfg.output_entities)
+        if (self.cfg.output_sample is not None):
+            output_selection.sample_holdings(self.holdings,
+                                             self.cfg.output_sample,
+                                             self.cfg.seed)
+
         # data structure housekeeping ------------------------------------------
         self.set_root_node()
         self.setup_event_queue(self.get_node_name(), self.cfg)
@@ -184,6 +228,11 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         self.register_storages(self.cfg.output_prefix + '/main_model_',
                                self.cds, self.cfg)
 
+        self.cds.set_aggregations([
+            aggregation.Aggregation.fromDict(item)
+            for item in (self.cfg.aggregations or [])
+        ])
+
         for hold in self.holdings:
             if not (self.cfg.headless or self.cfg.logging_type == 'none'):
                 os.makedirs(self.cfg.output_prefix + '/', exist_ok=True)
@@ -191,11 +240,22 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
                 self.cfg.output_prefix + '/' + self.get_node_name() + '/',
                 self, self.cds, self.cfg)
 
+        self.cds.get_storage_bank().finalise()
+        for item in self.cds.get_aggregations():
+            item.open(self.cfg.output_prefix + '/', True,
+                      self.cfg.get_output_resample(),
+                      self.cfg.output_resample_how)
+
         # connect the UID to callbacks -----------------------------------------
         self.connect_events()
         for hold in self.holdings:
             hold.connect_uids()
 
+        # struct-of-arrays engine ----------------------------------------------
+        if (self.cfg.engine == 'arrays'):
+            self.population = population.PopulationState.compile(
+                self.holdings, self.cds.get_model_start_time())
+
         # logging
         if (self.cfg.log_as_single and not self.cfg.headless):
             if (self.cfg.log_TS_outputs and not self.cfg.headless):
@@ -251,11 +311,16 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         self.close_storages(self.cds.get_current_model_time())
         for hold in self.holdings:
             hold.close(self.cds.get_current_model_time())
+        for item in self.cds.get_aggregations():
+            item.close(self.cds.get_current_model_time())
 
         if (self.cfg.log_as_single):
             if (self.cfg.log_TS_outputs and not self.cfg.headless):
                 self.cds.get_single_file_ts().close()
 
+        output_file.close()
+        sqlite_sink.close()
+
 
 
     def __internal_run(self):
@@ -278,12 +343,19 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
             hold.update_events(self.cds.get_current_model_time(),
                                self.add_event_queue_item)
 
-        # update each storage
-        self.update_storage_values(self.cds.get_current_model_time())
-        for hold in self.holdings:
-            hold.update_storages(self.cds.get_current_model_time())
+        # update each storage (all at once, see storage_bank)
+        self.cds.get_storage_bank().update(self.cds.get_current_model_time())
+
+        # values of 'function' probabilities change with the storages (see tick_memo)
+        tick_memo.new_tick()
 
         # work the model itself
+        if (self.population is not None):
+            self.population.update(self.cds.get_current_model_time())
+            if (self.cfg.batch_transitions):
+                self.population.apply_transitions(self.cds,
+                                                  self.add_event_queue_item)
+        self.cds.get_wake_calendar().wake_due(self.cds.get_current_model_time())
         for hold in self.holdings:
             hold.update(self.cds, self.cfg, self.add_event_queue_item)
 
@@ -295,6 +367,10 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         """
         Records the model's status.
         """
+        if (self.population is not None):
+            self.population.compute_usage()
+
+        output_selection.update(self.cds.get_current_model_time())
 
         if (self.cfg.log_as_single):
             if (self.cfg.log_TS_outputs and not self.cfg.headless):
@@ -305,6 +381,10 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         for hold in self.holdings:
             hold.record_status(self.cds, self.cfg)
 
+        for item in self.cds.get_aggregations():
+            item.write(self.cds.get_current_model_time(),
+                       self.cds.get_last_model_time())
+
         self.log_storages(self.cds.get_current_model_time(),
                           self.cds.get_last_model_time())
         self.log_passed_times(self.cds.get_current_model_time(),
@@ -327,6 +407,16 @@ class Model(base_connection.BaseConnection, base_event.BaseEvent,
         return results
 
 
+    def return_aggregations(self):
+        """
+        Returns:
+
+        results - name -> results of each aggregation (headless)
+        """
+        return {item.name: item.get_results()
+                for item in self.cds.get_aggregations()}
+
+
     def _timespan_comp(self, what: str):
         time_diff = datetime.datetime.now() - self.__simtime
         print('Time taken to', what, 'was', time_diff.total_seconds(),
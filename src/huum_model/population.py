@@ -0,0 +1,335 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Struct-of-arrays state of the whole population (engine setting 'arrays').
+# The loaded object model gets compiled into flat numpy arrays (agent next
+# status change; appliance blocked until; usage pattern playback), which are
+# then advanced for all entities at once with vectorised kernels. The objects
+# stay the interface (and the reference implementation for engine 'objects'),
+# but hand their runtime data over to this state. The per agent logic (usage
+# probabilities, busy & waiting) stays with the agents.
+#
+# All timepoints are stored as integer microseconds since the model start,
+# 'NEVER' meaning not set.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+
+import numpy as np
+
+# 1. Global vars ===============================================================
+NEVER = np.iinfo(np.int64).max          # time code for 'not set'
+
+_TIME_RESOLUTION = datetime.timedelta(microseconds=1)
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class PopulationState:
+
+    def __init__(self, t_start: datetime.datetime):
+
+        self._t_start = t_start
+
+        # agents ---------------------------------------------------------------
+        self.agents              = []
+        self.agent_next_change   = np.zeros(0, dtype=np.int64)  # next status change
+
+        # appliances -----------------------------------------------------------
+        self.appliances            = []
+        self.appliance_blocked     = np.zeros(0, dtype=np.int64)  # blocked until
+        self.appliance_col_offset  = []                           # first usage column
+        self.appliance_ts_types    = []                           # usage column names
+        self.num_columns           = 0
+
+        # usage patterns -------------------------------------------------------
+        self.patterns        = []
+        self.pattern_data    = np.zeros(0)                  # all pattern arrays, concatenated
+        self.pattern_offset  = np.zeros(0, dtype=np.int64)  # start of each pattern in pattern_data
+        self.pattern_length  = np.zeros(0, dtype=np.int64)
+        self.pattern_start   = np.zeros(0, dtype=np.int64)  # playback start, NEVER: inactive
+        self.pattern_end     = np.zeros(0, dtype=np.int64)  # playback (hard) end
+        self.pattern_pos     = np.zeros(0, dtype=np.int64)  # playback position, -1: not started
+        self.pattern_column  = np.zeros(0, dtype=np.int64)  # usage column it contributes to
+
+        # usage values per appliance & ts type, see compute_usage
+        self.usage = np.zeros(0)
+
+        # collected while compiling, turned into the arrays by finalise
+        self._final          = False
+        self._appliance_rows = []   # blocked until (time code)
+        self._pattern_rows   = []   # (data, usage column)
+
+
+    @classmethod
+    def compile(cls, holdings: list, t_start: datetime.datetime):
+        """
+        Compiles the (initialized) object model into the struct-of-arrays state and
+        binds all agents, appliances and usage patterns to it.
+        """
+        cls = PopulationState(t_start)
+
+        for hold in holdings:
+            for cu in hold.consumer_units:
+                for daemon in cu.agents:
+                    cls.add_agent(daemon)
+                for chamber in cu.rooms:
+                    for device in chamber.appliances:
+                        cls.add_appliance(device)
+
+        cls.finalise()
+        return cls
+
+
+    def finalise(self):
+        """
+        Builds the state arrays from everything added so far and binds the agents,
+        appliances and usage patterns to them. Patterns added afterwards get appended
+        directly.
+        """
+        self.agent_next_change = np.full(len(self.agents), NEVER, dtype=np.int64)
+
+        self.appliance_blocked = np.array(self._appliance_rows, dtype=np.int64)
+        self.usage             = np.zeros(self.num_columns)
+
+        lengths             = [data.size for data, _ in self._pattern_rows]
+        num_patterns        = len(self._pattern_rows)
+        self.pattern_length = np.array(lengths, dtype=np.int64)
+        self.pattern_offset = np.zeros(num_patterns, dtype=np.int64)
+        np.cumsum(self.pattern_length[:-1], out=self.pattern_offset[1:])
+        self.pattern_data   = np.concatenate(
+            [np.zeros(0)] + [data for data, _ in self._pattern_rows])
+        self.pattern_start  = np.full(num_patterns, NEVER, dtype=np.int64)
+        self.pattern_end    = np.full(num_patterns, NEVER, dtype=np.int64)
+        self.pattern_pos    = np.full(num_patterns, -1, dtype=np.int64)
+        self.pattern_column = np.array(
+            [column for _, column in self._pattern_rows], dtype=np.int64)
+
+        self._final          = True
+        self._appliance_rows = []
+        self._pattern_rows   = []
+
+        for index, daemon in enumerate(self.agents):
+            daemon.bind_population(self, index)
+        for index, device in enumerate(self.appliances):
+            device.bind_population(self, index)
+        for index, pattern in enumerate(self.patterns):
+            pattern.bind_population(self, index)
+
+
+    # Time codes ---------------------------------------------------------------
+    def to_code(self, tp: datetime.datetime):
+        if (tp is None):
+            return NEVER
+        return (tp - self._t_start) // _TIME_RESOLUTION
+
+
+    # Agents -------------------------------------------------------------------
+    def add_agent(self, daemon):
+        """ Adds an agent (before finalise)."""
+        self.agents.append(daemon)
+
+
+    def set_agent_next_change(self, index: int, next_change: datetime.datetime):
+        self.agent_next_change[index] = self.to_code(next_change)
+
+
+    def get_due_agents(self, current_tp: datetime.datetime):
+        """ Indices of the agents whose status changes at or before current_tp."""
+        return np.flatnonzero(self.agent_next_change <= self.to_code(current_tp))
+
+
+    def apply_transitions(self, cds, func_add_event_queue_item):
+        """
+        Changes the status of all agents due at the current timepoint. The activation
+        timepoints of their next status get drawn at once per probability type.
+        """
+        due = self.get_due_agents(cds.get_current_model_time())
+        if (due.size == 0):
+            return
+
+        # group by the probability type of the next habit (shared between agents)
+        groups = {}
+        for index in due.tolist():
+            daemon     = self.agents[index]
+            next_habit = daemon.begin_status_change(cds)
+            prob_type  = next_habit.probability_type
+            if (id(prob_type) in groups):
+                groups[id(prob_type)][1].append(daemon)
+            else:
+                groups[id(prob_type)] = (prob_type, [daemon])
+
+        for prob_type, daemons in groups.values():
+            activation_tps = prob_type.get_activation_tps(len(daemons))
+            for daemon, activation_tp in zip(daemons, activation_tps):
+                daemon.finish_status_change(cds, func_add_event_queue_item,
+                                            activation_tp)
+
+
+    # Appliances ---------------------------------------------------------------
+    def add_appliance(self, device):
+        """ Adds an appliance & its usage patterns (before finalise)."""
+        index = len(self.appliances)
+        self.appliances.append(device)
+
+        self._appliance_rows.append(self.to_code(device.blocked_until))
+        ts_types = list(device.list_ts_type)
+        self.appliance_col_offset.append(self.num_columns)
+        self.appliance_ts_types.append(ts_types)
+        self.num_columns += len(ts_types)
+
+        for pattern in device.usage_pattern:
+            self.add_pattern(pattern, index)
+
+
+    def set_appliance_blocked(self, index: int,
+                              blocked_until: datetime.datetime):
+        self.appliance_blocked[index] = self.to_code(blocked_until)
+
+
+    def get_usage(self, index: int, out: np.ndarray = None):
+        """
+        Usage values of the appliance (per ts type, see get_ts_types), see compute_usage.
+
+        out - array to write the values into. If not given, a new one gets returned.
+        """
+        offset = self.appliance_col_offset[index]
+        values = self.usage[offset:offset + len(self.appliance_ts_types[index])]
+        if (out is None):
+            return values.copy()
+
+        np.copyto(out, values)
+        return out
+
+
+    def get_ts_types(self, index: int):
+        return self.appliance_ts_types[index]
+
+
+    # Usage patterns -----------------------------------------------------------
+    def add_pattern(self, pattern, appliance_index: int):
+        """ Adds a usage pattern of the given appliance. Takes over its runtime data."""
+        index = len(self.patterns)
+        self.patterns.append(pattern)
+
+        data     = pattern.get_array()
+        ts_types = self.appliance_ts_types[appliance_index]
+        if (pattern.data_type in ts_types):
+            column = (self.appliance_col_offset[appliance_index]
+                      + ts_types.index(pattern.data_type))
+        else:
+            column = self.num_columns   # not part of the output
+
+        if not (self._final):
+            self._pattern_rows.append((data, column))
+            return
+
+        # added while running (e.g. by an event)
+        self.pattern_offset = np.append(self.pattern_offset, self.pattern_data.size)
+        self.pattern_length = np.append(self.pattern_length, data.size)
+        self.pattern_data   = np.concatenate([self.pattern_data, data])
+        self.pattern_start  = np.append(self.pattern_start, NEVER)
+        self.pattern_end    = np.append(self.pattern_end, NEVER)
+        self.pattern_pos    = np.append(self.pattern_pos, -1)
+        self.pattern_column = np.append(self.pattern_column, column)
+
+        pattern.bind_population(self, index)
+
+
+    def remove_pattern(self, index: int):
+        """ Stops the pattern from contributing to any output."""
+        self.deactivate_pattern(index)
+        self.pattern_column[index] = self.num_columns
+
+
+    def activate_pattern(self, index: int, t_start: datetime.datetime,
+                         set_end: datetime.datetime):
+        self.pattern_start[index] = self.to_code(t_start)
+        self.pattern_end[index]   = self.to_code(set_end)
+        self.pattern_pos[index]   = -1
+
+
+    def deactivate_pattern(self, index: int):
+        self.pattern_start[index] = NEVER
+        self.pattern_end[index]   = NEVER
+        self.pattern_pos[index]   = -1
+
+
+    def get_pattern_value(self, index: int):
+        pos = self.pattern_pos[index]
+        if (0 <= pos < self.pattern_length[index]):
+            return self.pattern_data[self.pattern_offset[index] + pos]
+
+        return 0.0
+
+
+    # Kernels ------------------------------------------------------------------
+    def update(self, current_tp: datetime.datetime):
+        """
+        Advances the usage patterns of all appliances to current_tp. Same logic as
+        SpacedArray.update.
+        """
+        now = self.to_code(current_tp)
+
+        # pattern playback
+        active  = self.pattern_start != NEVER
+        expired = active & (now > self.pattern_end)
+        running = active & ~expired & (now >= self.pattern_start)
+
+        self.pattern_pos[running] += 1
+        self.pattern_start[expired] = NEVER
+        self.pattern_end[expired]   = NEVER
+        self.pattern_pos[expired]   = -1
+
+
+    def compute_usage(self):
+        """
+        Computes the usage values of all appliances (sum of all patterns per appliance &
+        ts type). Same logic as Appliance.record_status, so needs to be called after the
+        agents used the appliances.
+        """
+        pos    = self.pattern_pos
+        valid  = (pos >= 0) & (pos < self.pattern_length)
+        values = np.zeros(len(self.patterns))
+        values[valid] = self.pattern_data[self.pattern_offset[valid] + pos[valid]]
+
+        self.usage = np.bincount(self.pattern_column, weights=values,
+                                 minlength=self.num_columns + 1)[:self.num_columns]
+
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
@@ -117,12 +117,6 @@ class Room(base_parts.BaseParts):  # class for each consumer unit / household
             device.update_events(current_tp, func_add_event_queue_item)
 
 
-    def update_storages(self, current_tp: datetime.datetime):
-        self.update_storage_values(current_tp)
-        for device in self.appliances:
-            device.update_storages(current_tp)
-
-
     def update(self, current_tp: datetime.datetime,
                last_tp: datetime.datetime):
         for device in self.appliances:
@@ -50,7 +50,6 @@ from . import passed_time
 
 # External
 import datetime
-import numpy as np
 
 
 # 1. Global vars ===============================================================
@@ -63,7 +62,6 @@ class BasePassedTime(object):   # class to be extended for each node
         self.__passed_time       = []
         self.__log_passed_time   = None
         self.__sw_passed_time    = None     # string de-duplicator for passed_time overview output
-        self.__array_passed_time = []
 
 
     def load_timed_storages(self, data_pt, start_tp: datetime.datetime):
@@ -111,12 +109,13 @@ class BasePassedTime(object):   # class to be extended for each node
         # register
         for passed_time_storage in self.__passed_time:
             passed_time_storage.register(self, start_tp)
+            if (cfg.lookup_tables):
+                passed_time_storage.build_lookups(cds.get_compute_interval_sec())
 
         # output
         self.__log_passed_time = cfg.get_log_passed_time
         if (len(self.__passed_time) > 0 and self.__log_passed_time()):
             header = []
-            self.__array_passed_time = [None] * len(self.__passed_time)
             for passed_time_storage in self.__passed_time:
                 header.append(passed_time_storage.get_node_name())
 
@@ -130,12 +129,11 @@ class BasePassedTime(object):   # class to be extended for each node
                          last_time: datetime.datetime):
         if (len(self.__passed_time) > 0 and self.__log_passed_time()):
 
+            row = self.__sw_passed_time.row
             for i, passed_time_storage in enumerate(self.__passed_time):
-                self.__array_passed_time[
-                    i] = passed_time_storage.get_timespan_seconds(current_time)
+                row[i] = passed_time_storage.get_timespan_seconds(current_time)
 
-            self.__sw_passed_time.write_record(
-                np.array(self.__array_passed_time), current_time, last_time)
+            self.__sw_passed_time.write_row(current_time, last_time)
 
 
     def close_passed_times(self, current_time: datetime.datetime):
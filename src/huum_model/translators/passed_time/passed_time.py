@@ -48,6 +48,7 @@ from ...events import base_event
 from ...util import base_data
 from ...util import date_parser
 from ...util import table_1d
+from ...util import tick_memo
 
 # external
 import datetime
@@ -73,6 +74,7 @@ class PassedTime(base_event.BaseEvent, base_data.BaseData):   # class to be exte
         # set
         self.__translators     = {}                 # translator object to get from time-since-date to probability (type:table_1d)
         # always needs entry 'default'
+        self.__lookup_step     = None               # step of the translators' lookup tables
 
         if (type(initial_time) == str):             # initial date & time to work from
             if (initial_time == '$model_t_start'):
@@ -119,6 +121,16 @@ class PassedTime(base_event.BaseEvent, base_data.BaseData):   # class to be exte
             self.__date = start_tp
 
 
+    def build_lookups(self, time_step: float):
+        """
+        Precomputes the translators' values for all multiples of the (model) timestep,
+        see Table1d.build_lookup.
+        """
+        self.__lookup_step = time_step
+        for translator in self.__translators.values():
+            translator.build_lookup(time_step)
+
+
     def check(self, current_tp: datetime.datetime):
         if ('default' not in self.__translators):
             print('\nError: passed_time.check:')
@@ -140,9 +152,14 @@ class PassedTime(base_event.BaseEvent, base_data.BaseData):   # class to be exte
         delta = current_tp - self.__date
 
         if (input_target in self.__translators):
-            return self.__translators[input_target].get_value(delta.total_seconds())
+            translator = self.__translators[input_target]
         else:
-            return self.__translators['default'].get_value(delta.total_seconds())
+            translator = self.__translators['default']
+
+        if (self.__lookup_step is not None):
+            return translator.get_value_at(delta.total_seconds(),
+                                           self.__lookup_step)
+        return translator.get_value(delta.total_seconds())
 
 
     def set_time(self, current_tp: datetime.datetime, datum=None):
@@ -151,6 +168,8 @@ class PassedTime(base_event.BaseEvent, base_data.BaseData):   # class to be exte
         else:
             self.__date = datum
 
+        tick_memo.invalidate(self)
+
 
     def _get_child_object(self, parts):
         """
@@ -58,7 +58,8 @@ class BaseStorage(object):   # class to be extended for each node
         self.__storages       = []
         self.__log_storages   = None
         self.__sw_storages    = None    # string de-duplicator for storage overview output
-        self.__array_storages = []
+        self.__bank           = None    # model-wide storage bank (see storage_bank)
+        self.__bank_indices   = None    # positions of the storages within the bank
 
 
     def load_storages(self, storages):
@@ -84,11 +85,19 @@ class BaseStorage(object):   # class to be extended for each node
         for store in self.__storages:
             store.register(self)
 
+        # hand the volumes over to the bank
+        self.__bank         = cds.get_storage_bank()
+        self.__bank_indices = np.array(
+            [store.bind_bank(self.__bank) for store in self.__storages],
+            dtype=np.int64)
+        if (cfg.lookup_tables):
+            for store in self.__storages:
+                store.build_lookups()
+
         # output
         self.__log_storages = cfg.get_log_storages
         if (len(self.__storages) > 0 and self.__log_storages()):
             header = []
-            self.__array_storages = [None] * len(self.__storages)
             for store in self.__storages:
                 header.append(store.get_node_name())
             self.__sw_storages = number_output.NumberOutput(
@@ -97,20 +106,18 @@ class BaseStorage(object):   # class to be extended for each node
                 self.get_full_node_id())
 
 
-    def update_storage_values(self, current_tp: datetime.datetime):
-        for store in self.__storages:
-            store.update(current_tp)
-
-
     def log_storages(self, current_time: datetime.datetime,
                      last_time: datetime.datetime):
         if (len(self.__storages) > 0 and self.__log_storages()):
 
-            for i, store in enumerate(self.__storages):
-                self.__array_storages[i] = store.get_volume()
+            if (self.__bank is not None):
+                self.__bank.get_volumes(self.__bank_indices,
+                                        out=self.__sw_storages.row)
+            else:
+                for i, store in enumerate(self.__storages):
+                    self.__sw_storages.row[i] = store.get_volume()
 
-            self.__sw_storages.write_record(np.array(self.__array_storages),
-                                            current_time, last_time)
+            self.__sw_storages.write_row(current_time, last_time)
 
 
     def close_storages(self, current_time: datetime.datetime):
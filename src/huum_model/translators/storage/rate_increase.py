@@ -148,6 +148,10 @@ class Rate(base_timed_effect.BaseTimedEffect):
                 exit(255)
 
 
+    def is_constant(self):
+        return self._typus == 'constant'
+
+
     def get_val(self):
         if (self._typus == 'constant'):
             return self._const_val
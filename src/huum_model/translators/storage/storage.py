@@ -40,12 +40,15 @@
 # Internal
 from ...events import base_event
 from ...util import base_data
+from ...util import expiry_list
 from ...util import table_1d
+from ...util import tick_memo
 from ...translators.storage import rate_increase
 from ...elements import probability_type
 
 # External
 import datetime
+import math
 
 # 1. Global vars ===============================================================
 
@@ -67,7 +70,11 @@ class Storage(base_event.BaseEvent, base_data.BaseData):   # class to be extende
         self.__volume      = initial_volume     # initial fill
 
         # internal vars
-        self.__rates      = []               # list of active volume increase rates
+        self.__rates      = expiry_list.ExpiryList()  # active volume increase rates
+        self.__bank       = None    # storage bank holding the volume, once bound
+        self.__bank_index = None    # position within the bank
+        self.__watchers   = {}      # callbacks on (external) volume changes
+        self.__lookup_step = None   # step of the translators' lookup tables
 
 
     @classmethod
@@ -88,7 +95,7 @@ class Storage(base_event.BaseEvent, base_data.BaseData):   # class to be extende
 
 
     def add_rate(self, rate):
-        self.__rates.append(rate)
+        self.__rates.append(rate, rate.get_time_end())
 
 
     def add_translator(self, key, translator):
@@ -99,6 +106,22 @@ class Storage(base_event.BaseEvent, base_data.BaseData):   # class to be extende
         self.register_tree_node(parent_obj)
 
 
+    def bind_bank(self, bank):
+        """
+        Hands the volume over to the (model-wide) storage bank, which updates it from
+        then on.
+
+        Returns:
+
+        index of the storage within the bank
+        """
+        self.__bank_index = bank.add_storage(self, self.__volume,
+                                             list(self.__rates))
+        self.__bank       = bank
+
+        return self.__bank_index
+
+
     def check(self):
         if ('default' not in self.__translators):
             print('\nError: storage.check:')
@@ -106,38 +129,134 @@ class Storage(base_event.BaseEvent, base_data.BaseData):   # class to be extende
             exit(255)
 
 
-    def update(self, current_tp: datetime.datetime):
+    def build_lookups(self):
+        """
+        Precomputes the translators' values for the volumes reachable by the (constant)
+        rate, see Table1d.build_lookup.
+        """
+        if (self.__bank is None):
+            return
+
+        rate = self.__bank.get_rate(self.__bank_index)
+        if (rate is None or rate <= 0.0):
+            return
+
+        self.__lookup_step = rate
+        for translator in self.__translators.values():
+            translator.build_lookup(rate)
+
+
+    def remove_expired_rates(self, current_tp: datetime.datetime):
+        self.__rates.remove_expired(current_tp)
 
-        # first remove the ones which are out of (time) bounds
-        rate_list = [elem for elem in self.__rates if elem.is_valid(current_tp)]
-        if (len(rate_list) != len(self.__rates)):     # saves unnecessary memory copying
-            self.__rates = rate_list.copy()
 
-        # get actual update value
+    def get_increase(self):
+        """
+        Gets the volume increase for one timestep (sum of all rates).
+        """
         increase = 0.0
         for rate in self.__rates:
             val = rate.get_val()
             increase += val
 
-        self.__volume += increase
+        return increase
 
 
     def get_volume(self):
+        if (self.__bank is not None):
+            return self.__bank.get_volume(self.__bank_index)
         return self.__volume
 
 
+    def set_volume(self, volume: float):
+        if (self.__bank is not None):
+            self.__bank.set_volume(self.__bank_index, volume)
+        else:
+            self.__volume = volume
+
+        tick_memo.invalidate(self)
+        for func in self.__watchers.values():
+            func()
+
+
+    def add_watcher(self, key, func):
+        """
+        Adds a callback for changes of the volume other than by the rates (i.e. the
+        predictions of get_constant_until becoming invalid).
+
+        key  - identifies the watcher, a new callback with the same key replaces the old
+        func - callback without arguments
+        """
+        self.__watchers[key] = func
+
+
+    def get_constant_until(self, current_tp: datetime.datetime,
+                           input='default'):
+        """
+        Predicts until when get_val stays the same, i.e. when the volume crosses the next
+        threshold of the translator. Only for constant rates, one timestep gets kept as
+        safety margin.
+
+        Returns:
+
+        until - timepoint before which the value is constant. Returns 'None' if it
+                isn't known in advance.
+        """
+        if (self.__bank is None):
+            return None
+
+        rate = self.__bank.get_rate(self.__bank_index)
+        if (rate is None):
+            return None
+
+        if (input in self.__translators):
+            translator = self.__translators[input]
+        else:
+            translator = self.__translators['default']
+
+        volume = self.get_volume()
+        bounds = translator.get_constant_range(volume)
+        if (bounds is None):
+            return None
+
+        # number of timesteps before reaching the threshold
+        if (rate > 0.0 and bounds[1] != math.inf):
+            num_steps = math.ceil((bounds[1] - volume) / rate) - 2
+        elif (rate < 0.0 and bounds[0] != -math.inf):
+            num_steps = math.ceil((bounds[0] - volume) / rate) - 2
+        else:
+            num_steps = None
+
+        if (num_steps is not None and num_steps < 1):
+            return None
+
+        # the rates change once one of them expires
+        until = datetime.datetime.max
+        if (num_steps is not None):
+            until = current_tp + (num_steps + 1) * self.__bank.time_step
+        for item in self.__rates:
+            if (item.get_time_end() is not None):
+                until = min(until, item.get_time_end())
+
+        return until
+
+
     def get_val(self, input='default'):
         if (input in self.__translators):
-            return self.__translators[input].get_value(self.__volume)
+            translator = self.__translators[input]
         else:
-            return self.__translators['default'].get_value(self.__volume)
+            translator = self.__translators['default']
+
+        if (self.__lookup_step is not None):
+            return translator.get_value_at(self.get_volume(), self.__lookup_step)
+        return translator.get_value(self.get_volume())
 
 
     def empty_volume(self, amount=None):
         if (amount is None):
-            self.__volume = 0.0
+            self.set_volume(0.0)
         else:
-            self.__volume += amount
+            self.set_volume(self.get_volume() + amount)
 
 
     def _get_child_object(self, parts):
@@ -184,14 +303,15 @@ class Storage(base_event.BaseEvent, base_data.BaseData):   # class to be extende
 
             elif (action[1] == 'add_volume'):
                 if (isinstance(effect, probability_type.ProbabilityType)):
-                    self.__volume += effect.get_probability_value(
-                        kwargs["current_tp"])
+                    self.set_volume(self.get_volume() +
+                                    effect.get_probability_value(
+                                        kwargs["current_tp"]))
                 elif isinstance(effect, int):
-                    self.__volume += effect
+                    self.set_volume(self.get_volume() + effect)
 
             elif (action[1] == 'set_random'):
-                self.__volume = effect.get_probability_value(
-                    kwargs["current_tp"])
+                self.set_volume(effect.get_probability_value(
+                    kwargs["current_tp"]))
 
             else:
                 print('storage.exec_event:')
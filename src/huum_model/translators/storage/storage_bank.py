@@ -0,0 +1,195 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Model-wide bank of all storage volumes. The volumes and the (summed up)
+# constant rates of all storages are held in arrays, so that a timestep is a
+# single vector addition. Storages with non-constant rates get their increase
+# added separately. The Storage objects become views onto the bank once bound.
+#
+# Same logic as Storage.update: expired rates get removed first, the increase
+# is the sum of the remaining rates (in the same order).
+#
+# Lazy mode (setting 'lazy_storages'): the volumes of storages with constant
+# rates are not updated every timestep, but computed from the volume at the
+# last change and the number of timesteps since then, when asked for. As this
+# multiplies instead of adding up, the values can differ in the last digits.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import heapq
+
+import numpy as np
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class StorageBank:
+
+    def __init__(self, time_step: datetime.timedelta = None,
+                 lazy: bool = False):
+        """
+        time_step - model timestep
+        lazy      - compute the volumes only when asked for
+        """
+        self.time_step = time_step
+        self.lazy      = lazy
+
+        # lists while setting up, arrays once finalised
+        self.storages = []
+        self.volumes  = []              # current volume per storage (lazy: at 'since')
+        self.rates    = []              # constant increase per timestep
+        self.since    = []              # lazy: timestep of the last change
+        self.dynamic  = []              # whether the storage has non-constant rates
+        self.step     = 0               # number of timesteps done
+        self._dynamic = []              # indices of the storages with non-constant rates
+        self._expiry  = []              # heap of (rate expiry timepoint, counter, storage index)
+        self._counter = 0               # tie breaker for the heap
+
+
+    def add_storage(self, store, volume: float, rates: list):
+        """
+        Adds a storage to the bank (before finalise).
+
+        store  - the storage object
+        volume - its current volume
+        rates  - its rates
+
+        Returns:
+
+        index of the storage within the bank
+        """
+        index = len(self.storages)
+        self.storages.append(store)
+        self.volumes.append(volume)
+        self.rates.append(0.0)
+        self.since.append(self.step)
+        self.dynamic.append(False)
+
+        for rate in rates:
+            if (rate.get_time_end() is not None):
+                self._counter += 1
+                heapq.heappush(self._expiry,
+                               (rate.get_time_end(), self._counter, index))
+
+        if (all(rate.is_constant() for rate in rates)):
+            self.rates[index] = store.get_increase()
+        else:
+            self.dynamic[index] = True
+            self._dynamic.append(index)
+
+        return index
+
+
+    def finalise(self):
+        """
+        Turns the collected storages into the arrays, after all got added.
+        """
+        self.volumes = np.array(self.volumes, dtype=float)
+        self.rates   = np.array(self.rates, dtype=float)
+        self.since   = np.array(self.since, dtype=np.int64)
+        self.dynamic = np.array(self.dynamic, dtype=bool)
+
+
+    def get_volume(self, index: int):
+        if (self.lazy):
+            return float(self.volumes[index] +
+                         self.rates[index] * (self.step - self.since[index]))
+        return float(self.volumes[index])
+
+
+    def set_volume(self, index: int, volume: float):
+        self.volumes[index] = volume
+        self.since[index]   = self.step
+
+
+    def get_volumes(self, indices: np.ndarray, out: np.ndarray = None):
+        """
+        Volumes of the given storages.
+
+        out - array to write the volumes into. If not given, a new one gets returned.
+        """
+        if (out is None):
+            out = np.zeros(len(indices))
+
+        if (self.lazy):
+            np.copyto(out, self.volumes[indices] + self.rates[indices] *
+                      (self.step - self.since[indices]))
+        else:
+            np.take(self.volumes, indices, out=out)
+
+        return out
+
+
+    def get_rate(self, index: int):
+        """
+        Gets the (constant) increase per timestep of the storage. 'None' if not constant.
+        """
+        if (self.dynamic[index]):
+            return None
+        return float(self.rates[index])
+
+
+    def update(self, current_tp: datetime.datetime):
+        """
+        Updates the volumes of all storages for the timestep.
+        """
+
+        # first remove the rates which are out of (time) bounds
+        if (self._expiry and self._expiry[0][0] < current_tp):
+            changed = set()
+            while self._expiry and self._expiry[0][0] < current_tp:
+                changed.add(heapq.heappop(self._expiry)[2])
+
+            for index in changed:
+                self.storages[index].remove_expired_rates(current_tp)
+                if not (self.dynamic[index]):
+                    if (self.lazy):
+                        self.set_volume(index, self.get_volume(index))
+                    self.rates[index] = self.storages[index].get_increase()
+
+        # the actual update
+        self.step += 1
+        if not (self.lazy):
+            self.volumes += self.rates
+        for index in self._dynamic:
+            self.volumes[index] += self.storages[index].get_increase()
+
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
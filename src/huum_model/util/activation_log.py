@@ -0,0 +1,170 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Compact log of appliance activations, see setting 'activation_format'.
+# Instead of a CSV line per timestep, only the timesteps (ticks since the
+# model start) with an activation are kept:
+#   - 'packed': one bit per timestep (np.packbits layout)
+#   - 'sparse': the list of activation ticks
+# Written as .npz at the end of the run, 'load' expands it to a time series.
+# Not used in headless runs (like the CSV activation output).
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import os
+
+import numpy as np
+import pandas as pd
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ActivationLog:
+
+    def __init__(self, filename: str, log_format: str,
+                 t_start: datetime.datetime, time_step: datetime.timedelta):
+        """
+        filename   - file to write to
+        log_format - 'packed' or 'sparse'
+        t_start    - timepoint of tick 0
+        time_step  - model timestep
+        """
+        self._filename  = filename
+        self._format    = log_format
+        self._t_start   = t_start
+        self._time_step = time_step
+        self._num_ticks = 0                     # ticks covered (last recorded one + 1)
+
+        self._bits      = np.zeros(0, dtype=np.uint8)   # 'packed', grows with the activations
+        self._ticks     = []                            # 'sparse'
+
+
+    def record(self, current_tp: datetime.datetime):
+        """
+        Marks an activation at the timestep.
+        """
+        tick = (current_tp - self._t_start) // self._time_step
+        self._num_ticks = max(self._num_ticks, tick + 1)
+
+        if (self._format == 'packed'):
+            self._reserve(tick + 1)
+            self._bits[tick >> 3] |= 0x80 >> (tick & 7)
+
+        else:
+            self._ticks.append(tick)
+
+
+    def get_ticks(self):
+        """
+        Returns:
+
+        ticks - the timesteps (since t_start) with an activation
+        """
+        if (self._format == 'packed'):
+            return np.flatnonzero(
+                np.unpackbits(self._bits, count=self._num_ticks))
+        return np.array(self._ticks, dtype=np.int64)
+
+
+    def close(self, current_tp: datetime.datetime):
+        self._num_ticks = max(
+            self._num_ticks, (current_tp - self._t_start) // self._time_step + 1)
+
+        if (self._format == 'packed'):
+            self._reserve(self._num_ticks)
+            data = self._bits[:(self._num_ticks + 7) // 8]
+        else:
+            data = self.get_ticks()
+
+        directory = os.path.dirname(self._filename)
+        if not os.path.exists(directory):
+            os.makedirs(directory)
+
+        with open(self._filename, 'wb') as f:
+            np.savez(f,
+                     format=self._format,
+                     t_start=self._t_start.isoformat(' '),
+                     time_step=self._time_step.total_seconds(),
+                     num_ticks=self._num_ticks,
+                     data=data)
+
+
+    def _reserve(self, num_ticks: int):
+        # grows the bit array to hold num_ticks
+        num_bytes = (num_ticks + 7) // 8
+        if (num_bytes > self._bits.size):
+            self._bits = np.append(
+                self._bits,
+                np.zeros(max(self._bits.size, num_bytes - self._bits.size),
+                         dtype=np.uint8))
+
+
+# 2. Functions =================================================================
+def load(filename: str):
+    """
+    Loads an activation log.
+
+    filename - .npz file written by ActivationLog
+
+    Returns:
+
+    series - 1.0 for the timesteps with an activation, otherwise 0.0 (index: time)
+    """
+    with np.load(filename) as content:
+        log_format = str(content['format'])
+        t_start    = datetime.datetime.fromisoformat(str(content['t_start']))
+        time_step  = datetime.timedelta(seconds=float(content['time_step']))
+        num_ticks  = int(content['num_ticks'])
+        data       = content['data']
+
+    if (log_format == 'packed'):
+        values = np.unpackbits(data, count=num_ticks).astype(float)
+
+    elif (log_format == 'sparse'):
+        values = np.zeros(num_ticks)
+        values[data] = 1.0
+
+    else:
+        print('\nError: activation_log.load:')
+        print(f'Unsupported format #{log_format}# in file {filename}')
+        exit(255)
+
+    index = pd.date_range(t_start, periods=num_ticks, freq=time_step)
+    return pd.Series(values, index=index, name='Appliance_Activation')
+
+
+# 3. Main Exec =================================================================
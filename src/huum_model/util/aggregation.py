@@ -0,0 +1,220 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Aggregated appliance output, see setting 'aggregations'. The appliances add
+# their output values into the row of each aggregation while recording, one
+# column per (group, output data type). The row gets written once per
+# timestep by a NumberOutput (same filters as all other outputs), so only the
+# totals are stored. Combined with 'log_TS_outputs' off, no per appliance
+# output is written at all.
+#
+# Groups ('group_by'):
+#   - 'level':           the node of the appliance at the given tree level
+#                        ('level': 'model', 'holding', 'cu' or 'room')
+#   - 'appliance_class': the class of the appliance
+#   - 'data_type':       only the output data type (i.e. model totals)
+#   - 'tag':             user given tags ('tags': {tag: [names]}). The first
+#                        tag with the appliance's class or the name of any of
+#                        its nodes listed is used, others are not aggregated.
+#                        Names are compared case-insensitively.
+#
+# Optionally, the totals get resampled ('resample': seconds, 'how': 'sum',
+# 'mean', 'max' or 'count'), otherwise the general output settings apply.
+# Not available together with 'log_as_single' (except when headless).
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+
+import numpy as np
+
+# internal
+from . import number_output
+
+# 1. Global vars ===============================================================
+_group_types = ['level', 'appliance_class', 'data_type', 'tag']
+_levels      = ['model', 'holding', 'cu', 'room']
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class Aggregation:
+
+    def __init__(self, name: str, group_by: str, level: str = None,
+                 tags: dict = None, resample: int = None, how: str = None):
+        """
+        name     - name of the aggregation (used for the output file)
+        group_by - what to group the appliances by, see above
+        level    - for 'level': tree level to aggregate at
+        tags     - for 'tag': tag -> list of appliance classes / node names
+        resample - seconds to resample the totals to
+        how      - how to resample
+        """
+        self.name     = name
+        self.group_by = group_by.lower()
+        self.level    = level.lower() if level is not None else None
+        self.tags     = {}
+        self.resample = resample
+        self.how      = how
+
+        self._columns = {}          # (group, data type) -> column index
+        self._output  = None        # NumberOutput, set by open
+
+        # node names & appliance classes are lower case
+        if (tags is not None):
+            for tag, members in tags.items():
+                self.tags[tag] = set(member.lower() for member in members)
+
+        if not (self.group_by in _group_types):
+            print('\nError: aggregation.Aggregation:')
+            print(f'Unsupported group_by #{self.group_by}# for aggregation {name}')
+            print('Supported:', _group_types)
+            exit(255)
+
+        if (self.group_by == 'level' and not (self.level in _levels)):
+            print('\nError: aggregation.Aggregation:')
+            print(f'Unsupported level #{self.level}# for aggregation {name}')
+            print('Supported:', _levels)
+            exit(255)
+
+
+    @classmethod
+    def fromDict(cls, data: dict):
+        return Aggregation(data['name'], data['group_by'],
+                           level=data.get('level'), tags=data.get('tags'),
+                           resample=data.get('resample'), how=data.get('how'))
+
+
+    def get_group(self, appliance):
+        """
+        Returns:
+
+        group - the group of the appliance, 'None' if it isn't aggregated
+        """
+        if (self.group_by == 'data_type'):
+            return 'total'
+
+        elif (self.group_by == 'appliance_class'):
+            return appliance.get_class_name()
+
+        # nodes of the appliance, e.g. '$model_root.$holding_h0.$cu_cu0...'
+        node_id = appliance.get_full_node_id()
+        parts   = node_id.split('.')
+
+        if (self.group_by == 'level'):
+            prefix = '$' + self.level + '_'
+            for i, part in enumerate(parts):
+                if (part.startswith(prefix)):
+                    return '.'.join(parts[:i + 1])
+            return None
+
+        else:
+            names = set(part.split('_', 1)[-1] for part in parts)
+            names.add(appliance.get_class_name())
+            for tag, members in self.tags.items():
+                if (names.intersection(members)):
+                    return tag
+            return None
+
+
+    def register(self, appliance, data_types: list):
+        """
+        Adds the columns for the appliance's output data types.
+
+        Returns:
+
+        columns - column index per data type, 'None' if not aggregated
+        """
+        group = self.get_group(appliance)
+        if (group is None):
+            return None
+
+        columns = []
+        for data_type in data_types:
+            key = (group, data_type)
+            if not (key in self._columns):
+                self._columns[key] = len(self._columns)
+            columns.append(self._columns[key])
+
+        return np.array(columns, dtype=np.intp)
+
+
+    def open(self, prefix: str, should_log: bool,
+             resample: datetime.timedelta = None, how: str = 'sum'):
+        """
+        Sets up the output, after all appliances are registered.
+
+        prefix   - output directory
+        resample - general resampling of the usage outputs, unless set for this one
+        how      - general way to resample
+        """
+        header = [f'{group}#{data_type}' for group, data_type in self._columns]
+        if (self.resample):
+            resample = datetime.timedelta(seconds=self.resample)
+        if (self.how is not None):
+            how = self.how
+
+        self._output = number_output.NumberOutput(
+            prefix + 'aggregation_' + self.name + '.csv', len(header), header,
+            should_log, None, None, resample=resample, resample_how=how)
+
+
+    def add(self, columns: np.ndarray, values: np.ndarray):
+        """
+        Adds the values of an appliance for the current timestep.
+        """
+        self._output.row[columns] += values
+
+
+    def write(self, current_tp: datetime.datetime,
+              last_tp: datetime.datetime):
+        """
+        Writes the totals of the timestep & resets them.
+        """
+        self._output.write_row(current_tp, last_tp)
+        self._output.row[:] = 0.0
+
+
+    def close(self, current_tp: datetime.datetime):
+        self._output.close(current_tp)
+
+
+    def get_results(self):
+        return self._output.get_results()
+
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
@@ -0,0 +1,76 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Implements a cache for computed numpy arrays, which are shared (read-only)
+# between all users.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import numpy as np
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ArrayCache:
+
+    def __init__(self):
+        self._data = {}     # key -> tuple of arrays
+
+    def __len__(self):
+        return len(self._data)
+
+    def get(self, key):
+        """ Returns the stored arrays for key, 'None' if not present."""
+        return self._data.get(key)
+
+    def put(self, key, *arrays: np.ndarray):
+        """
+        Stores the given arrays under key. The arrays are set to read-only.
+
+        Returns:
+
+        arrays - tuple of the stored arrays.
+        """
+        for arr in arrays:
+            arr.flags.writeable = False
+
+        self._data[key] = arrays
+        return arrays
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
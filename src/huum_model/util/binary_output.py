@@ -0,0 +1,299 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Binary files as target of the number outputs (incl. aggregations), see
+# settings 'output_binary' & 'output_binary_dtype'. Instead of '<name>.csv',
+# each output writes:
+#
+#   'npy':   '<name>.npy'      - the rows as 2D array (float32 or float64),
+#                                appended while running, readable by np.load
+#            '<name>.time.npy' - the timepoint of each row (datetime64[us])
+#   'arrow': '<name>.arrow'    - Arrow IPC file with a 'Time' column and one
+#                                column per output column (needs pyarrow)
+#
+# plus the sidecar '<name>.json' holding the format, data type, column names,
+# number of rows and the name of the time axis file / column.
+#
+# The shape within the .npy headers gets set when the output is closed; files
+# of an aborted run read as empty.
+#
+# Can't be combined with 'output_sqlite', 'output_compression' or
+# 'output_partition' (see settings.Config).
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+# 1. Global vars ===============================================================
+_formats     = ['npy', 'arrow']
+_dtypes      = ['float32', 'float64']
+
+_format      = None     # 'npy' or 'arrow', 'None': not used
+_dtype       = 'float64'
+_batch_rows  = 10000    # rows per record batch (arrow)
+
+_header_size = 128      # bytes reserved for the .npy header (incl. magic)
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class NpyAppender:  # .npy file the rows get appended to
+
+    def __init__(self, filename: str, dtype: str, nr_columns: int = None):
+        """
+        filename   - file to write to
+        dtype      - numpy data type of the values
+        nr_columns - number of columns, 'None': 1D array
+        """
+        self._descr      = np.lib.format.dtype_to_descr(np.dtype(dtype))
+        self._nr_columns = nr_columns
+        self.rows        = 0
+
+        self._file = open(filename, 'wb')
+        self._write_header()
+
+
+    def append(self, data: bytes):
+        self._file.write(data)
+        self.rows += 1
+
+
+    def close(self):
+        self._file.seek(0)
+        self._write_header()
+        self._file.close()
+
+
+    def _write_header(self):
+        # fixed size header, so that it can be rewritten with the final shape
+        if (self._nr_columns is None):
+            shape = f'({self.rows},)'
+        else:
+            shape = f'({self.rows}, {self._nr_columns})'
+        header = (f"{{'descr': '{self._descr}', 'fortran_order': False, "
+                  f"'shape': {shape}, }}")
+        header = header.ljust(_header_size - 10 - 1) + '\n'
+        self._file.write(b'\x93NUMPY\x01\x00'
+                         + len(header).to_bytes(2, 'little')
+                         + header.encode('latin1'))
+
+
+class BinaryFile:  # binary output of one NumberOutput
+
+    def __init__(self, filename: str, column_names: list):
+        """
+        filename     - file name of the output (any '.csv' gets replaced)
+        column_names - names of the columns
+        """
+        base = filename[:-4] if filename.endswith('.csv') else filename
+
+        self._format  = _format
+        self._dtype   = np.dtype(_dtype)
+        self._columns = list(column_names)
+        self._sidecar = base + '.json'
+        self._meta    = {'format': _format, 'dtype': _dtype,
+                         'columns': self._columns}
+
+        if (self._format == 'npy'):
+            self._data = NpyAppender(base + '.npy', _dtype, len(self._columns))
+            self._time = NpyAppender(base + '.time.npy', 'datetime64[us]')
+            self._meta['data'] = os.path.basename(base + '.npy')
+            self._meta['time'] = os.path.basename(base + '.time.npy')
+
+        else:
+            import pyarrow as pa
+            self._schema = pa.schema(
+                [pa.field('Time', pa.timestamp('us'))]
+                + [pa.field(name, pa.from_numpy_dtype(self._dtype))
+                   for name in self._columns])
+            self._writer = pa.ipc.new_file(base + '.arrow', self._schema)
+            self._block  = np.zeros((_batch_rows, len(self._columns)),
+                                    dtype=self._dtype)
+            self._tps    = []
+            self._rows   = 0
+            self._meta['data'] = os.path.basename(base + '.arrow')
+            self._meta['time'] = 'Time'
+
+
+    def write_row(self, tp: datetime.datetime, np_array: np.array):
+        """
+        Appends the values of a row (for the timepoint).
+        """
+        if (self._format == 'npy'):
+            self._data.append(np_array.astype(self._dtype, copy=False).tobytes())
+            self._time.append(np.datetime64(tp, 'us').tobytes())
+
+        else:
+            self._block[len(self._tps)] = np_array
+            self._tps.append(tp)
+            if (len(self._tps) == _batch_rows):
+                self._write_batch()
+
+
+    def close(self):
+        if (self._format == 'npy'):
+            self._data.close()
+            self._time.close()
+            self._meta['rows'] = self._data.rows
+
+        else:
+            self._write_batch()
+            self._writer.close()
+            self._meta['rows'] = self._rows
+
+        with open(self._sidecar, 'w') as f:
+            json.dump(self._meta, f, indent=1)
+
+
+    def _write_batch(self):
+        # writes the collected rows as record batch
+        import pyarrow as pa
+        if not (self._tps):
+            return
+        nr     = len(self._tps)
+        arrays = [pa.array(np.array(self._tps, dtype='datetime64[us]'))]
+        arrays.extend(pa.array(self._block[:nr, i])
+                      for i in range(len(self._columns)))
+        self._writer.write_batch(pa.record_batch(arrays, schema=self._schema))
+        self._rows += nr
+        self._tps   = []
+
+
+# 2. Functions =================================================================
+def setup(fmt: str = None, dtype: str = 'float64'):
+    """
+    fmt   - 'npy' or 'arrow', 'None': write text files
+    dtype - 'float32' or 'float64'
+    """
+    global _format, _dtype
+
+    if not (fmt is None or fmt in _formats):
+        print('\nError: binary_output.setup:')
+        print(f'Unsupported format #{fmt}#, supported:', _formats)
+        exit(255)
+
+    if not (dtype in _dtypes):
+        print('\nError: binary_output.setup:')
+        print(f'Unsupported data type #{dtype}#, supported:', _dtypes)
+        exit(255)
+
+    if (fmt == 'arrow'):
+        try:
+            import pyarrow      # noqa: F401
+        except ImportError:
+            print('\nError: binary_output.setup:')
+            print("Format 'arrow' needs pyarrow to be installed, use 'npy' instead")
+            exit(255)
+
+    _format = fmt
+    _dtype  = dtype
+
+
+def is_used():
+    return _format is not None
+
+
+def open_output(filename: str, column_names: list):
+    """
+    Returns:
+
+    file - binary output (write_row & close)
+    """
+    return BinaryFile(filename, column_names)
+
+
+def read_array(filename: str, mmap: bool = True):
+    """
+    Reads a binary output as arrays.
+
+    filename - sidecar ('<name>.json') or data file of the output
+    mmap     - memory map the .npy files instead of reading them
+
+    Returns:
+
+    values  - 2D array of the values (rows x columns)
+    times   - timepoint of each row (datetime64[us])
+    columns - column names
+    """
+    meta, directory = _read_sidecar(filename)
+
+    if (meta['format'] == 'npy'):
+        mode   = 'r' if mmap else None
+        values = np.load(os.path.join(directory, meta['data']), mmap_mode=mode)
+        times  = np.load(os.path.join(directory, meta['time']), mmap_mode=mode)
+
+    else:
+        import pyarrow as pa
+        with pa.memory_map(os.path.join(directory, meta['data'])) as source:
+            table = pa.ipc.open_file(source).read_all()
+        times  = table.column('Time').to_numpy()
+        values = np.column_stack(
+            [table.column(name).to_numpy() for name in meta['columns']]) \
+            if meta['columns'] else np.zeros((len(times), 0), dtype=meta['dtype'])
+
+    return values, times, meta['columns']
+
+
+def read_frame(filename: str, mmap: bool = True):
+    """
+    Reads a binary output as dataframe (same layout as when reading the CSV file).
+
+    Returns:
+
+    data - dataframe (index: time)
+    """
+    values, times, columns = read_array(filename, mmap)
+    return pd.DataFrame(values, index=pd.DatetimeIndex(times, name='Time'),
+                        columns=columns, copy=False)
+
+
+def _read_sidecar(filename: str):
+    # the sidecar's content & the directory of the files
+    base = filename
+    for suffix in ['.json', '.time.npy', '.npy', '.arrow', '.csv']:
+        if (base.endswith(suffix)):
+            base = base[:-len(suffix)]
+            break
+
+    with open(base + '.json') as f:
+        meta = json.load(f)
+    return meta, os.path.dirname(base)
+
+
+# 3. Main Exec =================================================================
@@ -0,0 +1,132 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Precomputed calendar for the model run period (weekday, month, public holiday,
+# season), indexed by day number. Each day gets a bitmask of its calendar
+# properties, so that conditions can be compiled into a mask and evaluated with
+# a single lookup.
+#
+# Bits: 0-6 weekday (Monday=0), 7-18 month (January=7), 19 public holiday,
+#       20-23 season (meteorological, northern hemisphere: winter, spring,
+#       summer, autumn)
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+
+import numpy as np
+
+# 1. Global vars ===============================================================
+_BIT_WEEKDAY = 0
+_BIT_MONTH   = 7
+_BIT_HOLIDAY = 19
+_BIT_SEASON  = 20
+
+SEASONS = ['winter', 'spring', 'summer', 'autumn']
+_MONTH_SEASON = [0, 0, 1, 1, 1, 2, 2, 2, 3, 3, 3, 0]   # season index for month 1-12
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class CalendarTable:
+
+    def __init__(self, t_start: datetime.datetime, t_end: datetime.datetime,
+                 holidays: list = None):
+        """
+        t_start  - start of the model run
+        t_end    - end of the model run
+        holidays - public holidays, as dates or ISO date strings
+        """
+        self._first_day = t_start.date()
+        num_days        = (t_end.date() - self._first_day).days + 1
+
+        self._holidays = set()
+        for day in (holidays or []):
+            if (isinstance(day, str)):
+                day = datetime.date.fromisoformat(day)
+            elif (isinstance(day, datetime.datetime)):
+                day = day.date()
+            self._holidays.add(day)
+
+        # the table
+        self.flags = np.zeros(num_days, dtype=np.int64)
+        for i in range(num_days):
+            self.flags[i] = self._compute_flags(self._first_day
+                                                + datetime.timedelta(days=i))
+
+
+    def get_flags(self, day):
+        """
+        Gets the bitmask of calendar properties of the given day (date or datetime).
+        """
+        if (isinstance(day, datetime.datetime)):
+            day = day.date()
+
+        index = (day - self._first_day).days
+        if (0 <= index < self.flags.size):
+            return int(self.flags[index])
+
+        return self._compute_flags(day)   # outside of the run period
+
+
+    def _compute_flags(self, day: datetime.date):
+        flags  = 1 << (_BIT_WEEKDAY + day.weekday())
+        flags |= 1 << (_BIT_MONTH + day.month - 1)
+        flags |= 1 << (_BIT_SEASON + _MONTH_SEASON[day.month - 1])
+        if (day in self._holidays):
+            flags |= 1 << _BIT_HOLIDAY
+
+        return flags
+
+
+# 2. Functions =================================================================
+def get_weekday_mask(weekday: int):
+    """ weekday - Monday=0 """
+    return 1 << (_BIT_WEEKDAY + weekday)
+
+
+def get_month_mask(month: int):
+    """ month - January=1 """
+    return 1 << (_BIT_MONTH + month - 1)
+
+
+def get_holiday_mask():
+    return 1 << _BIT_HOLIDAY
+
+
+def get_season_mask(season: str):
+    return 1 << (_BIT_SEASON + SEASONS.index(season))
+
+
+# 3. Main Exec =================================================================
@@ -41,7 +41,10 @@
 # 0. Imports ===================================================================
 
 # internal
+from . import calendar_table
 from . import date_parser
+from . import wake_calendar
+from ..translators.storage import storage_bank
 
 # external
 import datetime
@@ -57,7 +60,9 @@ class CentralDataStore:  # central data store structure
                  t_end: datetime.datetime,
                  time_step: int = 1,
                  log_passed_time: bool = False,
-                 log_storages: bool = False):
+                 log_storages: bool = False,
+                 holidays: list = None,
+                 lazy_storages: bool = False):
 
         self.__model_start_time        = t_start
         self.__model_end_time          = t_end
@@ -72,6 +77,18 @@ class CentralDataStore:  # central data store structure
         self.__log_storages            = log_storages
 
         self.__single_file_output      = None
+        self.__aggregations            = []     # aggregation.Aggregation
+
+        # scheduling
+        self.__wake_calendar           = wake_calendar.WakeCalendar()
+        self.__storage_bank            = storage_bank.StorageBank(
+            self.__compute_interval, lazy_storages)
+
+        # calendar
+        self.__calendar                = calendar_table.CalendarTable(t_start, t_end,
+                                                                      holidays)
+        self.__calendar_day            = None   # day the flags below are for
+        self.__calendar_flags          = 0
 
     # Time stuff ---------------------------------------------------------------
     def set_current_model_time(self, time):
@@ -116,6 +133,21 @@ class CentralDataStore:  # central data store structure
         return self.__compute_interval.total_seconds()
 
 
+    def get_calendar(self):
+        return self.__calendar
+
+
+    def get_calendar_flags(self):
+        """
+        Calendar properties (bitmask, see calendar_table) of the current model day.
+        """
+        if (self.__calendar_day != self.__current_model_day):
+            self.__calendar_day   = self.__current_model_day
+            self.__calendar_flags = self.__calendar.get_flags(self.__current_model_day)
+
+        return self.__calendar_flags
+
+
     def parse_time_strings(self, string):
         """
         Parses and works on 
@@ -138,6 +170,14 @@ class CentralDataStore:  # central data store structure
 
         return obj
 
+    # Scheduling stuff ---------------------------------------------------------
+    def get_wake_calendar(self):
+        return self.__wake_calendar
+
+
+    def get_storage_bank(self):
+        return self.__storage_bank
+
     # Logging stuff ------------------------------------------------------------
 
     def set_single_file_ts(self, file_link):
@@ -148,6 +188,14 @@ class CentralDataStore:  # central data store structure
         return self.__single_file_output
 
 
+    def set_aggregations(self, aggregations: list):
+        self.__aggregations = aggregations
+
+
+    def get_aggregations(self):
+        return self.__aggregations
+
+
     def get_single_file_storages(self):
         return None
 
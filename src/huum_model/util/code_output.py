@@ -0,0 +1,161 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# De-duplicating CSV-output of integer coded (categorical) records, see setting
+# 'log_categorical'. The values of a row get set in an integer array ('row'),
+# changes are detected by comparing it with the last written one. Text is only
+# created for the rows actually written.
+#
+# Columns listed as time columns hold timepoints as microseconds since the model
+# start ('NEVER': None), they get written as ISO timestamps.
+#
+# Same filter types & file layout as string_output.StringOutput.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+
+import numpy as np
+
+# internal
+from . import string_output
+
+# 1. Global vars ===============================================================
+NEVER = np.iinfo(np.int64).max          # time code for 'not set'
+
+_TIME_RESOLUTION = datetime.timedelta(microseconds=1)
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class CodeOutput(string_output.StringOutput):
+
+    def __init__(self, filename: str, should_log: bool, num_columns: int,
+                 t_start: datetime.datetime = None, time_columns: list = (),
+                 source_id: str = None):
+        """
+        filename     - file to write to
+        should_log   - whether this output is wanted
+        num_columns  - number of values per row
+        t_start      - reference for the time columns
+        time_columns - indices of the columns holding time codes
+        source_id    - full node id of the owner (for the output selection)
+        """
+        string_output.StringOutput.__init__(self, filename, should_log,
+                                            source_id)
+
+        self._t_start      = t_start
+        self._time_columns = set(time_columns)
+
+        self.row           = np.zeros(num_columns, dtype=np.int64)  # to be filled by the caller
+        self._last_row     = None
+
+
+    def to_code(self, tp: datetime.datetime):
+        if (tp is None):
+            return NEVER
+        return (tp - self._t_start) // _TIME_RESOLUTION
+
+
+    def write(self, current_tp: datetime.datetime, last_tp: datetime.datetime):
+        """
+        Writes the current content of 'row'.
+        """
+        self._write_func(self.row, current_tp, last_tp)
+
+
+    def _finish(self, current_tp: datetime.datetime):
+        """
+        Overriden part of the StringOutput method.
+        """
+        if (self._last_tp_written != current_tp and self._last_row is not None):
+            self._write_row(self._last_row, current_tp)
+
+
+    def _restart(self):
+        self._last_row = None
+
+
+    def _write_full(self, row: np.ndarray, current_tp: datetime.datetime,
+                    last_tp: datetime.datetime):
+        """
+        Writes the row to file.
+        """
+        self._write_row(row, current_tp)
+
+
+    def _write_simple_filter(self, row: np.ndarray,
+                             current_tp: datetime.datetime,
+                             last_tp: datetime.datetime):
+        """
+        Writes the row to file while removing rows with duplicate entries.
+        """
+        if (self._last_row is None):
+            self._write_row(row, current_tp)
+            self._last_row = row.copy()
+
+        elif not (np.array_equal(row, self._last_row)):
+
+            # write last status. if needed, to get the form correct
+            if (last_tp > self._last_tp_written):
+                self._write_row(self._last_row, last_tp)
+
+            # write new status
+            self._write_row(row, current_tp)
+            self._last_row[:] = row
+
+
+    def _write_nothing(self, row: np.ndarray, current_tp: datetime.datetime,
+                       last_tp: datetime.datetime):
+        pass
+
+
+    def _write_row(self, row: np.ndarray, tp: datetime.datetime):
+        values = row.tolist()
+        for i in self._time_columns:
+            if (values[i] == NEVER):
+                values[i] = 'None'
+            else:
+                values[i] = (self._t_start + datetime.timedelta(
+                    microseconds=values[i])).isoformat(' ')
+
+        self._file.write(tp.isoformat(' ') + ';')
+        self._file.write(''.join(f'{value};' for value in values) + '\n')
+        self._last_tp_written = tp
+
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
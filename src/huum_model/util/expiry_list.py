@@ -0,0 +1,107 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Implements a list of time-limited items (e.g. usage habits, storage rates).
+# The expiry timepoints are kept in a min-heap, so the list only needs to be
+# rebuilt once the earliest expiry has been passed. Keeps the insertion order
+# of the remaining items.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import heapq
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ExpiryList:
+
+    def __init__(self):
+        self._data    = []   # items, in order of insertion
+        self._heap    = []   # entries: (expiry timepoint, counter, item)
+        self._counter = 0    # tie breaker, so that items never get compared
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def append(self, item, expiry_tp: datetime.datetime = None):
+        """ Adds the item. It expires once expiry_tp < current timepoint. 'None': never."""
+        self._data.append(item)
+        if (expiry_tp is not None):
+            self._counter += 1
+            heapq.heappush(self._heap, (expiry_tp, self._counter, item))
+
+    def insert_after(self, previous, item, expiry_tp: datetime.datetime = None):
+        """ Like append, but places the item directly after previous, if present."""
+        self.append(item, expiry_tp)
+        for pos, elem in enumerate(self._data):
+            if (elem is previous):
+                self._data.insert(pos + 1, self._data.pop())
+                break
+
+    def remove_expired(self, current_tp: datetime.datetime):
+        """
+        Removes all items which expired before current_tp.
+
+        Returns 'True' if any item got removed, 'False' otherwise.
+        """
+        if not (self._heap and self._heap[0][0] < current_tp):
+            return False
+
+        expired = set()
+        while self._heap and self._heap[0][0] < current_tp:
+            expired.add(id(heapq.heappop(self._heap)[2]))
+
+        num_items  = len(self._data)
+        self._data = [item for item in self._data if id(item) not in expired]
+
+        return len(self._data) != num_items
+
+    def filter(self, func):
+        """ Keeps only the items for which func(item) is 'True'."""
+        self._data = [item for item in self._data if func(item)]
+
+        kept       = set(id(item) for item in self._data)
+        self._heap = [entry for entry in self._heap if id(entry[2]) in kept]
+        heapq.heapify(self._heap)
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
@@ -0,0 +1,103 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Load-time interning of immutable model data (templates, tables, arrays, ...).
+# Objects with the same content get replaced by one shared instance, so that
+# households loaded from the same archetype don't hold copies of the same data.
+# Only objects without per-instance (runtime) state may be shared!
+# Shared instances are only referenced weakly here, so unused ones get freed.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import hashlib
+import weakref
+
+import numpy as np
+
+# 1. Global vars ===============================================================
+_SHARED = weakref.WeakValueDictionary()  # content key -> shared instance
+
+
+# 1.1 Classes ------------------------------------------------------------------
+
+# 2. Functions =================================================================
+def share(obj, key):
+    """
+    Returns the shared instance with the same content as obj. If there is none yet,
+    obj becomes the shared one.
+
+    obj - object to share
+    key - hashable description of the object's content. Objects with equal keys
+          (and of the same class) are assumed to be interchangeable.
+    """
+    try:
+        full_key = (type(obj), key)
+        shared   = _SHARED.get(full_key)
+    except TypeError:   # unhashable content: can't be shared
+        return obj
+
+    if (shared is None):
+        _SHARED[full_key] = obj
+        shared = obj
+
+    return shared
+
+
+def share_array(arr: np.ndarray):
+    """
+    Returns a shared, read-only array with the same content as arr. Keyed by a digest
+    of the data, so that it isn't held twice; the content is compared on a hit.
+    """
+    digest = hashlib.blake2b(np.ascontiguousarray(arr).data).digest()
+    shared = share(arr, (arr.dtype.str, arr.shape, digest))
+    if (shared is not arr and not np.array_equal(shared, arr)):
+        return arr     # digest collision: keep the own copy
+
+    shared.flags.writeable = False
+
+    return shared
+
+
+def content_key(values):
+    """
+    Turns a list or array of values into a hashable key.
+    """
+    if (values is None):
+        return None
+
+    return tuple(np.asarray(values).tolist())
+
+
+# 3. Main Exec =================================================================
@@ -50,8 +50,15 @@ import numpy as np
 import pandas as pd
 import os
 
+# internal
+from . import binary_output
+from . import output_file
+from . import output_selection
+from . import sqlite_sink
+
 # 1. Global vars ===============================================================
 _filter_types = ['none', 'all', 'simple', 'complex']
+_resample_types = ['sum', 'mean', 'max', 'count']
 
 
 # ------------------------------------------------------------------------------
@@ -61,10 +68,20 @@ class NumberOutput:  # removes identical content lines as well as lines with con
     _headless = None
     _filter_type = None
     _single_file = False
+    _block_size = 0     # rows filtered at once (simple & complex filters), 0: row by row
 
     # class object specific stuff
     def __init__(self, filename: str, nr_entries: int, column_names: list,
-                 should_log: bool, file_single_output, source_id: str):
+                 should_log: bool, file_single_output, source_id: str,
+                 resample: datetime.timedelta = None,
+                 resample_how: str = None):
+        """
+        resample     - interval to resample the rows to before filtering/writing,
+                       'None': off
+        resample_how - how the rows of an interval are combined: 'sum' (default),
+                       'mean', 'max' or 'count' (number of non-zero values)
+        """
+        should_log = should_log and output_selection.is_selected(source_id)
 
         # header
         if (NumberOutput._single_file()):
@@ -84,6 +101,15 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         self.set_array_delta = False
         self.last_tp_written = datetime.datetime(year=1, month=1, day=1)
 
+        # preallocated buffers, see write_row
+        self.row              = np.zeros(nr_entries)    # to be filled by the caller
+        self._last_row        = np.full(nr_entries, np.NaN)
+        self._delta_rows      = [np.zeros(nr_entries), np.zeros(nr_entries)]
+        self._delta_pos       = 0
+        self._diff_row        = np.zeros(nr_entries)
+        self._tol_row         = np.zeros(nr_entries)
+        self._close_row       = np.zeros(nr_entries, dtype=bool)
+
         # headless or not
         if (NumberOutput._headless() or NumberOutput._filter_type() == 'none'
                 or not should_log):
@@ -99,11 +125,22 @@ class NumberOutput:  # removes identical content lines as well as lines with con
                     header += f'{source_id}#{item};'
                 self._file.write(header)
 
+        elif (sqlite_sink.is_used()):
+            self._file = sqlite_sink.open_table(self._filename, column_names)
+            self._write_line = self._file.write_row
+
+        elif (binary_output.is_used()):
+            directory = os.path.dirname(self._filename)
+            if not os.path.exists(directory):
+                os.makedirs(directory)
+            self._file = binary_output.open_output(self._filename, column_names)
+            self._write_line = self._file.write_row
+
         else:
             directory = os.path.dirname(self._filename)
             if not os.path.exists(directory):
                 os.makedirs(directory)
-            self._file = open(self._filename, 'w')
+            self._file = output_file.open_output(self._filename)
             header = ''
             for item in self._header:
                 header += item + ';'
@@ -139,18 +176,80 @@ class NumberOutput:  # removes identical content lines as well as lines with con
             elif (NumberOutput._filter_type() == 'complex'):
                 self._write_func = self._write_complex_filter
 
+        # block-wise filtering
+        self._block = None
+        if (NumberOutput._block_size > 0 and should_log
+                and NumberOutput._filter_type() in ['simple', 'complex']
+                and not NumberOutput._single_file()):
+            self._block = np.zeros((NumberOutput._block_size, nr_entries))
+            self._block_tps = []
+            self._block_last_tps = []
+            self._write_func = self._write_block
+
+        # resampling (before filtering)
+        self._bin_row = None
+        if (resample_how is None):
+            resample_how = 'sum'
+
+        if (resample is not None and should_log
+                and NumberOutput._filter_type() != 'none'
+                and not NumberOutput._single_file()):
+
+            if not (resample_how in _resample_types):
+                print('\nError: number_output.NumberOutput:')
+                print(f'Unsupported resampling #{resample_how}#, supported:',
+                      _resample_types)
+                exit(255)
+
+            self._bin_width = resample
+            self._bin_how = resample_how
+            self._bin_start = None          # start of the current interval
+            self._bin_last = None           # start of the previous interval
+            self._bin_count = 0             # rows within the current interval
+            self._bin_acc = np.zeros(nr_entries)
+            self._bin_row = np.zeros(nr_entries)
+            self._bin_func = self._write_func
+            self._write_func = self._write_resampled
+            self._reset_bin()
+
+        # time windows (the single file needs a value per timestep)
+        self._window_func = None
+        if (output_selection.has_windows() and should_log
+                and not NumberOutput._single_file()):
+            self._window_func = self._write_func
+            self._write_func = self._write_windowed
+            self._window_open = False       # whether the last row was within a window
+            self._window_start = None       # first timepoint within the current window
+            self._window_last = None        # last timepoint within the current window
+
     def write_record(self, string: str, current_tp: datetime.datetime,
                      last_tp: datetime.datetime):
         self._write_func(string, current_tp, last_tp)
 
+    def write_row(self, current_tp: datetime.datetime,
+                  last_tp: datetime.datetime):
+        """
+        Like write_record, for the values filled into 'row'. The row stays owned by the
+        caller (can be kept & changed in place), the writer works on its own copies, so
+        that nothing gets allocated unless a row gets stored.
+        """
+        self._write_func(self.row, current_tp, last_tp)
+
     def get_results(self, prefix=''):
         if (NumberOutput._headless()):
+            self._flush_block()
 
+            # the time is the index
+            header = [x for x in self._header if x != 'Time']
             if prefix != '':
-                cols = [f'{prefix}_{x}' for x in self._header]
+                cols = [f'{prefix}_{x}' for x in header]
 
             else:
-                cols = self._header
+                cols = header
+
+            # nothing stored, e.g. outside all time windows
+            if (self._dict is None):
+                self._dict = {}
 
             self._df = pd.DataFrame.from_dict(self._dict,
                                               orient='index',
@@ -163,22 +262,116 @@ class NumberOutput:  # removes identical content lines as well as lines with con
             exit(255)
 
     def close(self, current_tp: datetime.datetime):
-        # check to see whether a last write is needed
-        if (self.last_tp_written != current_tp
-                and not NumberOutput._filter_type() == 'none'):
+        if (self._window_func is None):
+            self._finish(current_tp)
+        elif (self._window_open):
+            self._finish(self._window_last, self._window_start)
+
+        if not (self._file is None or self._single_file()):
+            self._file.close()
+
+    def _finish(self, current_tp: datetime.datetime,
+                window_start: datetime.datetime = None):
+        """
+        Writes what is still pending at the end of the run or of a time window: the
+        last (partial) interval & the last row.
+
+        current_tp   - timepoint of the last row
+        window_start - timepoint of the first row within the window, 'None': end of run
+        """
+        first = current_tp == window_start
+        own_row = window_start is not None
+
+        # the last (partial) interval, ends at the interval start
+        if (self._bin_row is not None and self._bin_start is not None):
+            self._flush_block()
+            first = not self.set_array
+            if (self._bin_count > 0):
+                self._write_bin()
+            current_tp = self._bin_start
+            own_row = True
+
+        self._flush_block()
+
+        # within a window / for intervals the last row itself is needed. Files get the
+        # row before a change, so it is still missing (unless it was the first one,
+        # written directly). Unfiltered, all rows are written by now
+        if (NumberOutput._filter_type() == 'none'):
+            final_write = False
+        elif not (own_row):
+            final_write = self.last_tp_written != current_tp
+        elif (NumberOutput._filter_type() == 'all'):
+            final_write = False
+        elif (NumberOutput._headless()):
+            final_write = not (self._dict is None
+                               or current_tp.isoformat(' ') in self._dict)
+        else:
+            final_write = not first
+
+        if (final_write):
             if (NumberOutput._headless() and not (self._dict is None)):
-                self._dict[current_tp.isoformat(' ')] = self.last_array
+                self._dict[current_tp.isoformat(' ')] = self._keep(
+                    self.last_array)
 
             else:
                 if not (self._file is None):
                     if not (self._single_file()):
-                        self._file.write(current_tp.isoformat(' ') + ';')
-                        self._file.write(';'.join(
-                            [str(x) for x in self.last_array]))
-                        self._file.write(';\n')
+                        self._write_line(current_tp, self.last_array)
+            self.last_tp_written = current_tp
 
-        if not (self._file is None or self._single_file()):
-            self._file.close()
+    def _restart(self):
+        # starts the filters & intervals over, so that nothing from before a time
+        # window gets written
+        self.set_array = False
+        self.set_array_delta = False
+        if (self._bin_row is not None):
+            self._bin_start = None
+            self._bin_last = None
+            self._reset_bin()
+
+    def _set_last(self, np_array: np.array):
+        # remembers the array. Rows are copied into the own buffer (double buffering)
+        if (np_array is self.row or np_array is self._bin_row):
+            np.copyto(self._last_row, np_array)
+            self.last_array = self._last_row
+        else:
+            self.last_array = np_array
+
+    def _get_delta(self, np_array: np.array):
+        # np_array - last_array. For rows into alternating buffers
+        if (np_array is self.row or np_array is self._bin_row):
+            delta = self._delta_rows[self._delta_pos]
+            self._delta_pos = 1 - self._delta_pos
+            return np.subtract(np_array, self.last_array, out=delta)
+
+        return np_array - self.last_array
+
+    def _keep(self, np_array: np.array):
+        # array to be stored (headless). Rows get changed by the caller, so are copied
+        if (np_array is self.row or np_array is self._last_row
+                or np_array is self._bin_row):
+            return np_array.copy()
+        return np_array
+
+    def _is_close(self, arr_a: np.array, arr_b: np.array, rtol: float,
+                  atol: float):
+        """
+        np.allclose, without temporary arrays if both have the row's shape.
+        """
+        if (arr_a.shape != self.row.shape or arr_b.shape != self.row.shape):
+            return np.allclose(arr_a, arr_b, rtol, atol)
+
+        # |a - b| <= atol + rtol * |b|
+        diff = np.subtract(arr_a, arr_b, out=self._diff_row)
+        np.abs(diff, out=diff)
+        tol = np.abs(arr_b, out=self._tol_row)
+        np.multiply(tol, rtol, out=tol)
+        np.add(tol, atol, out=tol)
+        if (np.less_equal(diff, tol, out=self._close_row).all()):
+            return True
+
+        # not close: confirm (infinite values are handled differently)
+        return np.allclose(arr_a, arr_b, rtol, atol)
 
     def _write_nothing(self, np_array: np.array, current_tp: datetime.datetime,
                        last_tp: datetime.datetime):
@@ -198,15 +391,12 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         """
         if not (self.set_array):
 
-            self._file.write(current_tp.isoformat(' ') + ';')
-            self._file.write(';'.join([str(x) for x in np_array]) + ';\n')
+            self._write_line(current_tp, np_array)
 
             self.set_array = True
 
         else:
-            self._file.write(last_tp.isoformat(' ') + ';')
-            self._file.write(';'.join([str(x)
-                                       for x in self.last_array]) + ';\n')
+            self._write_line(last_tp, self.last_array)
 
     def _write_full_headless(self, np_array: np.array,
                              current_tp: datetime.datetime,
@@ -217,10 +407,11 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         array  - data array to output to file
         """
         if not (self.set_array):
-            self._dict = {}
+            if (self._dict is None):     # kept over time windows
+                self._dict = {}
             self.set_array = True
 
-        self._dict[current_tp.isoformat(' ')] = np_array
+        self._dict[current_tp.isoformat(' ')] = self._keep(np_array)
 
     def _write_simple_filter(self, np_array: np.array,
                              current_tp: datetime.datetime,
@@ -246,24 +437,20 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         # decide what to do
         if not (self.set_array):
 
-            self._file.write(current_tp.isoformat(' ') + ';')
-            self._file.write(';'.join([str(x) for x in np_array]) + ';\n')
+            self._write_line(current_tp, np_array)
 
-            self.last_array = np_array
+            self._set_last(np_array)
             self.set_array = True
             self.last_tp_written = current_tp
 
         else:
-            if not (np.allclose(
-                    self.last_array, np_array, rtol=0.0, atol=1e-15)):
+            if not (self._is_close(self.last_array, np_array, 0.0, 1e-15)):
 
-                self._file.write(last_tp.isoformat(' ') + ';')
-                self._file.write(';'.join([str(x)
-                                           for x in self.last_array]) + ';\n')
+                self._write_line(last_tp, self.last_array)
 
                 self.last_tp_written = current_tp
 
-            self.last_array = np_array
+            self._set_last(np_array)
 
     def _write_simple_filter_headless(self, np_array: np.array,
                                       current_tp: datetime.datetime,
@@ -289,22 +476,22 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         # decide what to do
         if not (self.set_array):
 
-            self.last_array = np_array
+            self._set_last(np_array)
             self.set_array = True
             self.last_tp_written = current_tp
 
-            self._dict = {}
-            self._dict[current_tp.isoformat(' ')] = np_array
+            if (self._dict is None):     # kept over time windows
+                self._dict = {}
+            self._dict[current_tp.isoformat(' ')] = self._keep(np_array)
 
         else:
-            if not (np.allclose(
-                    self.last_array, np_array, rtol=0.0, atol=1e-15)):
+            if not (self._is_close(self.last_array, np_array, 0.0, 1e-15)):
 
-                self._dict[current_tp.isoformat(' ')] = np_array
+                self._dict[current_tp.isoformat(' ')] = self._keep(np_array)
 
                 self.last_tp_written = current_tp
 
-            self.last_array = np_array
+            self._set_last(np_array)
 
     def _write_complex_filter(self, np_array: np.array,
                               current_tp: datetime.datetime,
@@ -330,35 +517,29 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         # decide what to do
         if (not self.set_array and not self.set_array_delta):
 
-            self._file.write(current_tp.isoformat(' ') + ';')
-            self._file.write(';'.join([str(x) for x in np_array]) + ';\n')
+            self._write_line(current_tp, np_array)
 
-            self.last_array = np_array
+            self._set_last(np_array)
             self.set_array = True
             self.last_tp_written = current_tp
 
         elif (self.set_array and not self.set_array_delta):
-            self.last_array_delta = np_array - self.last_array
+            # whether the row is kept gets decided with the next one (forward check)
+            self.last_array_delta = self._get_delta(np_array)
             self.set_array_delta = True
-
-            # only output for distinct lines (only backwards check, forward is still todo)
-            if (not np.allclose(np_array, self.last_array, 1e-05, 1e-08)):
-                self.last_array = np_array
-                self.last_tp_written = current_tp
+            self._set_last(np_array)
 
         elif (self.set_array and self.set_array_delta):
-            delta = np_array - self.last_array
+            delta = self._get_delta(np_array)
 
-            if (not np.allclose(
-                    delta, self.last_array_delta, rtol=0.0, atol=1e-15)):
+            # the last row is kept, if the increase changes after it
+            if (not self._is_close(delta, self.last_array_delta, 0.0, 1e-15)):
 
-                self._file.write(last_tp.isoformat(' ') + ';')
-                self._file.write(';'.join([str(x)
-                                           for x in self.last_array]) + ';\n')
+                self._write_line(last_tp, self.last_array)
 
-                self.last_tp_written = current_tp
+                self.last_tp_written = last_tp
 
-            self.last_array = np_array
+            self._set_last(np_array)
             self.last_array_delta = delta
 
         else:
@@ -392,33 +573,31 @@ class NumberOutput:  # removes identical content lines as well as lines with con
         # decide what to do
         if (not self.set_array and not self.set_array_delta):
 
-            self._dict = {}
-            self._dict[current_tp.isoformat(' ')] = np_array
+            if (self._dict is None):     # kept over time windows
+                self._dict = {}
+            self._dict[current_tp.isoformat(' ')] = self._keep(np_array)
 
-            self.last_array = np_array
+            self._set_last(np_array)
             self.set_array = True
             self.last_tp_written = current_tp
 
         elif (self.set_array and not self.set_array_delta):
-            self.last_array_delta = np_array - self.last_array
+            # whether the row is kept gets decided with the next one (forward check)
+            self.last_array_delta = self._get_delta(np_array)
             self.set_array_delta = True
-
-            # only output for distinct lines (only backwards check, forward is still todo)
-            if (not np.allclose(np_array, self.last_array, 1e-05, 1e-08)):
-                self.last_array = np_array
-                self.last_tp_written = current_tp
+            self._set_last(np_array)
 
         elif (self.set_array and self.set_array_delta):
-            delta = np_array - self.last_array
+            delta = self._get_delta(np_array)
 
-            if (not np.allclose(
-                    delta, self.last_array_delta, rtol=0.0, atol=1e-15)):
+            # the last row is kept, if the increase changes after it
+            if (not self._is_close(delta, self.last_array_delta, 0.0, 1e-15)):
 
-                self._dict[current_tp.isoformat(' ')] = np_array
+                self._dict[last_tp.isoformat(' ')] = self._keep(self.last_array)
 
-                self.last_tp_written = current_tp
+                self.last_tp_written = last_tp
 
-            self.last_array = np_array
+            self._set_last(np_array)
             self.last_array_delta = delta
 
         else:
@@ -428,6 +607,164 @@ class NumberOutput:  # removes identical content lines as well as lines with con
             print('set_delta: ', self.set_array_delta)
             exit(255)
 
+    def _write_windowed(self, np_array: np.array,
+                        current_tp: datetime.datetime,
+                        last_tp: datetime.datetime):
+        """
+        Only passes the row on within the output time windows. Each window gets written
+        like a run of its own.
+
+        array  - data array to output to file
+        """
+        if (output_selection.is_open()):
+            if not (self._window_open):
+                self._restart()
+                self._window_open = True
+                self._window_start = current_tp
+                last_tp = current_tp
+            self._window_func(np_array, current_tp, last_tp)
+            self._window_last = current_tp
+
+        elif (self._window_open):
+            self._finish(self._window_last, self._window_start)
+            self._window_open = False
+
+    def _write_resampled(self, np_array: np.array,
+                         current_tp: datetime.datetime,
+                         last_tp: datetime.datetime):
+        """
+        Adds the row to the current interval. Once an interval is done, its values
+        get written (timepoint: start of the interval).
+
+        array  - data array to output to file
+        """
+        if (self._bin_start is None):
+            self._bin_start = current_tp
+
+        elif (current_tp >= self._bin_start + self._bin_width):
+            self._write_bin()
+            self._reset_bin()
+            self._bin_last = self._bin_start
+            self._bin_start += ((current_tp - self._bin_start) //
+                                self._bin_width) * self._bin_width
+
+        if (self._bin_how == 'max'):
+            np.maximum(self._bin_acc, np_array, out=self._bin_acc)
+        elif (self._bin_how == 'count'):
+            self._bin_acc += (np_array != 0.0)
+        else:
+            self._bin_acc += np_array
+        self._bin_count += 1
+
+    def _write_bin(self):
+        # passes the values of the current interval on
+        if (self._bin_how == 'mean'):
+            np.divide(self._bin_acc, self._bin_count, out=self._bin_row)
+        else:
+            np.copyto(self._bin_row, self._bin_acc)
+
+        last_tp = self._bin_last if self._bin_last is not None else self._bin_start
+        self._bin_func(self._bin_row, self._bin_start, last_tp)
+
+    def _reset_bin(self):
+        self._bin_count = 0
+        if (self._bin_how == 'max'):
+            self._bin_acc.fill(-np.inf)
+        else:
+            self._bin_acc.fill(0.0)
+
+    def _write_block(self, np_array: np.array, current_tp: datetime.datetime,
+                     last_tp: datetime.datetime):
+        """
+        Collects the row, the rows get filtered once the block is full.
+
+        array  - data array to output to file
+        """
+        pos = len(self._block_tps)
+        self._block[pos] = np_array
+        self._block_tps.append(current_tp)
+        self._block_last_tps.append(last_tp)
+
+        if (pos + 1 == len(self._block)):
+            self._flush_block()
+
+    def _flush_block(self):
+        """
+        Filters the collected rows at once, same output as the row by row filters.
+        A row changes if it isn't close to the previous one (simple), or its increase
+        isn't close to the previous increase (complex). Simple: for files, the last row
+        before a change gets written, headless the changed row gets stored. Complex:
+        the last row before a change is kept (at its own timepoint) for both.
+        """
+        if (self._block is None or not self._block_tps):
+            return
+
+        rows = self._block[:len(self._block_tps)]
+        tps = self._block_tps
+        start = 0
+
+        # first rows: nothing to compare with yet
+        if not (self.set_array):
+            self._emit(rows[0], tps[0])
+            self.last_tp_written = tps[0]
+            self.last_array = self._last_row
+            np.copyto(self.last_array, rows[0])
+            self.set_array = True
+            start = 1
+
+        if (NumberOutput._filter_type() == 'complex'
+                and not self.set_array_delta and start < len(rows)):
+            # whether the row is kept gets decided with the next one (forward check)
+            self.last_array_delta = rows[start] - self.last_array
+            self.set_array_delta = True
+            np.copyto(self.last_array, rows[start])
+            start += 1
+
+        if (start < len(rows)):
+            # previous row of each row
+            stack = np.concatenate((self.last_array[np.newaxis], rows[start:]))
+
+            if (NumberOutput._filter_type() == 'simple'):
+                same = np.isclose(stack[:-1], stack[1:], 0.0, 1e-15).all(axis=1)
+
+            else:
+                deltas = np.diff(stack, axis=0)
+                before = np.concatenate((self.last_array_delta[np.newaxis],
+                                         deltas[:-1]))
+                same = np.isclose(deltas, before, 0.0, 1e-15).all(axis=1)
+                self.last_array_delta = deltas[-1].copy()
+
+            for pos in np.flatnonzero(~same):
+                if (NumberOutput._filter_type() == 'complex'):
+                    self._emit(stack[pos], self._block_last_tps[start + pos])
+                    self.last_tp_written = self._block_last_tps[start + pos]
+                elif (NumberOutput._headless()):
+                    self._emit(rows[start + pos], tps[start + pos])
+                    self.last_tp_written = tps[start + pos]
+                else:
+                    self._emit(stack[pos], self._block_last_tps[start + pos])
+                    self.last_tp_written = tps[start + pos]
+
+            np.copyto(self.last_array, rows[-1])
+
+        self._block_tps = []
+        self._block_last_tps = []
+
+    def _emit(self, np_array: np.array, tp: datetime.datetime):
+        # writes/stores a row of the block
+        if (NumberOutput._headless()):
+            if (self._dict is None):
+                self._dict = {}
+            self._dict[tp.isoformat(' ')] = np_array.copy()
+
+        else:
+            self._write_line(tp, np_array)
+
+    def _write_line(self, tp: datetime.datetime, np_array: np.array):
+        # writes a row to the output file
+        self._file.write(tp.isoformat(' ') + ';')
+        self._file.write(';'.join([str(x) for x in np_array]) + ';\n')
+
     def _write_single_file(self, np_array: np.array,
                            current_tp: datetime.datetime,
                            last_tp: datetime.datetime):
@@ -442,10 +779,12 @@ class NumberOutput:  # removes identical content lines as well as lines with con
 # 2. Functions =================================================================
 
 
-def setup_class_vars(headless: bool, output_filter: str, single_file: bool):
+def setup_class_vars(headless: bool, output_filter: str, single_file: bool,
+                     block_size: int = 0):
     NumberOutput._headless = headless
     NumberOutput._filter_type = output_filter
     NumberOutput._single_file = single_file
+    NumberOutput._block_size = block_size
 
     if not (NumberOutput._filter_type() in _filter_types):
         print('\nError: number_output.initialise:')
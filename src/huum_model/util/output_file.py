@@ -0,0 +1,421 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Opens the output files, compressed if set (settings 'output_compression',
+# 'output_compression_level', 'output_chunk_lines'). Supported are the stdlib
+# codecs 'gzip', 'lzma' (.xz) and 'bz2'; the file name gets their suffix.
+#
+# Chunked mode: the lines are compressed in chunks of the given number of
+# lines, each as a complete stream of its own (concatenated they are still a
+# valid file of the codec). A sidecar index ('<file>.idx') lists the first
+# timepoint and the position of each chunk, so 'read_range' only needs to
+# decompress the chunks of the wanted time range. The header line is a chunk
+# of its own.
+#
+# Partitioned mode (setting 'output_partition': 'month', 'week' or a number of
+# timesteps): each output is split into files per time period
+# ('<name>.<period>.csv'), each starting with the header line. Whenever a
+# partition is finished, it gets listed in the run's 'manifest.csv' (file,
+# period, first & last timepoint, number of lines), so it can be processed
+# while the model is still running.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import bz2
+import datetime
+import gzip
+import io
+import lzma
+import os
+
+import pandas as pd
+
+# 1. Global vars ===============================================================
+_codecs = {
+    'gzip': ('.gz', gzip),
+    'lzma': ('.xz', lzma),
+    'bz2':  ('.bz2', bz2),
+}
+
+_compression = None     # codec name, 'None': plain text
+_level       = None     # compression level, 'None': the codec's default
+_chunk_lines = 0        # lines per chunk, 0: single stream
+
+_partition   = None     # 'month', 'week' or number of timesteps, 'None': single file
+_t_start     = None     # for partitions by timesteps: model start & timestep
+_time_step   = None
+_manifest_fn = None     # manifest file name
+_manifest    = None     # manifest file, opened with the first entry
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class ChunkedFile:  # text file compressed in independent, indexed chunks
+
+    def __init__(self, filename: str, codec: str, level: int, chunk_lines: int):
+        """
+        filename    - file to write to (incl. suffix)
+        codec       - codec name
+        level       - compression level, 'None': default
+        chunk_lines - lines per chunk
+        """
+        self._codec       = codec
+        self._level       = level
+        self._chunk_lines = chunk_lines
+
+        self._file        = open(filename, 'wb')
+        self._index       = open(filename + '.idx', 'w')
+        self._index.write('Time;Offset;\n')
+
+        self._parts       = []      # text not yet compressed
+        self._lines       = 0       # complete lines within _parts
+        self._header      = True    # first line not yet done
+
+
+    def write(self, string: str):
+        self._parts.append(string)
+        lines = string.count('\n')
+        if (lines == 0):
+            return
+
+        self._lines += lines
+        if (self._header or self._lines >= self._chunk_lines):
+            self._flush(False)
+
+
+    def close(self):
+        self._flush(True)
+        self._file.close()
+        self._index.close()
+
+
+    def _flush(self, final: bool):
+        # compresses all complete lines (on close: everything) as a chunk
+        text = ''.join(self._parts)
+        if (final):
+            rest = ''
+        else:
+            end  = text.find('\n') + 1 if self._header else text.rfind('\n') + 1
+            rest = text[end:]
+            text = text[:end]
+
+        self._parts = [rest] if rest else []
+        self._lines = rest.count('\n')
+
+        if (text):
+            key = '' if self._header else text[:text.find(';')]
+            self._index.write(f'{key};{self._file.tell()};\n')
+            self._file.write(_compress(self._codec, text.encode(), self._level))
+            self._header = False
+
+        # a rest with more lines than a chunk (header chunk was split off)
+        if (not final and self._lines >= self._chunk_lines):
+            self._flush(False)
+
+
+class PartitionedFile:  # text file split into files per time period
+
+    def __init__(self, filename: str):
+        """
+        filename - file name of the whole output (gets the period inserted)
+        """
+        self._base, self._ext = os.path.splitext(filename)
+
+        self._file        = None    # file of the current partition
+        self._header      = ''      # first line, repeated in each partition
+        self._in_header   = True
+        self._line_start  = False   # next write starts a line
+        self._key         = None    # current period
+        self._name        = None    # file name of the current partition
+        self._first       = None    # first & last timepoint (text) within it
+        self._last        = None
+        self._lines       = 0
+        self._day         = None    # last date seen & its week (cache)
+        self._week        = None
+
+
+    def write(self, string: str):
+        if (self._in_header):
+            pos = string.find('\n')
+            if (pos < 0):
+                self._header += string
+                return
+            self._header    += string[:pos + 1]
+            self._in_header  = False
+            self._line_start = True
+            string           = string[pos + 1:]
+            if not (string):
+                return
+
+        if (self._line_start):
+            timepoint = string[:string.find(';')]
+            key       = self._get_key(timepoint)
+            if (key is not None):
+                if (key != self._key):
+                    self._open_partition(key)
+                self._last = timepoint
+                if (self._first is None):
+                    self._first = timepoint
+
+        if (self._file is None):
+            self._open_partition(None)
+
+        self._file.write(string)
+        lines = string.count('\n')
+        self._lines += lines
+        self._line_start = string.endswith('\n')
+
+
+    def close(self):
+        if (self._file is None):
+            self._open_partition(None)
+        self._close_partition()
+
+
+    def _get_key(self, timepoint: str):
+        # period of the timepoint, 'None' if it isn't one
+        try:
+            if (_partition == 'month'):
+                datetime.date(int(timepoint[:4]), int(timepoint[5:7]), 1)
+                return timepoint[:7]
+
+            elif (_partition == 'week'):
+                if (timepoint[:10] != self._day):
+                    year, week, _ = datetime.date.fromisoformat(
+                        timepoint[:10]).isocalendar()
+                    self._day  = timepoint[:10]
+                    self._week = f'{year}-W{week:02d}'
+                return self._week
+
+            else:
+                tick = ((datetime.datetime.fromisoformat(timepoint) - _t_start)
+                        // _time_step)
+                return f'part{tick // _partition:06d}'
+
+        except ValueError:
+            return None
+
+
+    def _open_partition(self, key: str):
+        self._close_partition()
+        self._key   = key
+        self._name  = f'{self._base}.{key}{self._ext}' if key is not None \
+            else self._base + self._ext
+        self._file  = _open_file(self._name)
+        self._first = None
+        self._lines = 0
+        self._file.write(self._header)
+
+
+    def _close_partition(self):
+        if (self._file is None):
+            return
+        self._file.close()
+        _add_to_manifest(self._name, self._key, self._first, self._last,
+                         self._lines)
+        self._file = None
+
+
+# 2. Functions =================================================================
+def setup(compression: str = None, level: int = None, chunk_lines: int = 0,
+          partition=None, t_start: datetime.datetime = None,
+          time_step: datetime.timedelta = None, manifest: str = None):
+    """
+    compression - codec name, 'None': plain text
+    level       - compression level
+    chunk_lines - lines per compressed chunk, 0: single stream
+    partition   - 'month', 'week' or number of timesteps per file, 'None': single file
+    t_start     - model start (for partitions by timesteps)
+    time_step   - model timestep (for partitions by timesteps)
+    manifest    - manifest file name (for partitions)
+    """
+    global _compression, _level, _chunk_lines
+    global _partition, _t_start, _time_step, _manifest_fn, _manifest
+
+    if not (compression is None or compression in _codecs):
+        print('\nError: output_file.setup:')
+        print(f'Unsupported compression #{compression}#, supported:',
+              list(_codecs))
+        exit(255)
+
+    if not (partition is None or partition in ['month', 'week']
+            or (isinstance(partition, int) and partition > 0)):
+        print('\nError: output_file.setup:')
+        print(f'Unsupported partition #{partition}#, supported:',
+              "'month', 'week' or a number of timesteps")
+        exit(255)
+
+    _compression = compression
+    _level       = level
+    _chunk_lines = chunk_lines
+
+    _partition   = partition
+    _t_start     = t_start
+    _time_step   = time_step
+    _manifest_fn = manifest
+    _manifest    = None
+
+
+def close():
+    """
+    Closes the manifest (all outputs need to be closed before).
+    """
+    global _manifest
+    if (_manifest is not None):
+        _manifest.close()
+        _manifest = None
+
+
+def open_output(filename: str):
+    """
+    Opens an output file for writing text, as set up.
+
+    Returns:
+
+    file - file object (write & close)
+    """
+    if (_partition is not None):
+        return PartitionedFile(filename)
+    return _open_file(filename)
+
+
+def read_manifest(filename: str):
+    """
+    Returns:
+
+    manifest - the partitions listed in the manifest (as dataframe)
+    """
+    return pd.read_csv(filename, sep=';', usecols=range(5),
+                       keep_default_na=False, dtype={'Period': str})
+
+
+def _add_to_manifest(name: str, key: str, first: str, last: str, lines: int):
+    global _manifest
+    if (_manifest_fn is None):
+        return
+
+    if (_manifest is None):
+        os.makedirs(os.path.dirname(_manifest_fn), exist_ok=True)
+        _manifest = open(_manifest_fn, 'w')
+        _manifest.write('File;Period;Start;End;Lines;\n')
+
+    if (_compression is not None):
+        name += _codecs[_compression][0]
+    _manifest.write(f'{name};{key or ""};{first or ""};{last or ""};{lines};\n')
+    _manifest.flush()
+
+
+def _open_file(filename: str):
+    # opens a single file, compressed if set
+    if (_compression is None):
+        return open(filename, 'w')
+
+    suffix, module = _codecs[_compression]
+    if (_chunk_lines > 0):
+        return ChunkedFile(filename + suffix, _compression, _level,
+                           _chunk_lines)
+
+    if (_compression == 'lzma'):
+        return lzma.open(filename + suffix, 'wt', preset=_level)
+    elif (_level is not None):
+        return module.open(filename + suffix, 'wt', compresslevel=_level)
+    return module.open(filename + suffix, 'wt')
+
+
+def read_range(filename: str, t_start: datetime.datetime = None,
+               t_end: datetime.datetime = None):
+    """
+    Reads the lines of a chunked output file within a time range, only decompressing
+    the chunks needed.
+
+    filename - file written in chunked mode (incl. suffix)
+    t_start  - first timepoint wanted, 'None': from the beginning
+    t_end    - last timepoint wanted, 'None': until the end
+
+    Returns:
+
+    data - the lines as dataframe (index: time)
+    """
+    codec = None
+    for name, (suffix, module) in _codecs.items():
+        if (filename.endswith(suffix)):
+            codec = name
+    if (codec is None):
+        print('\nError: output_file.read_range:')
+        print(f'Unknown compression of file {filename}')
+        exit(255)
+
+    index = pd.read_csv(filename + '.idx', sep=';', usecols=[0, 1],
+                        keep_default_na=False, dtype={'Time': str})
+    start = t_start.isoformat(' ') if t_start is not None else None
+    end   = t_end.isoformat(' ') if t_end is not None else None
+
+    offsets = list(index['Offset']) + [None]
+    times   = list(index['Time'])
+    text    = []
+    with open(filename, 'rb') as f:
+        for i, key in enumerate(times):
+
+            # the header, and chunks which may hold timepoints within the range
+            if (i > 0):
+                if (end is not None and key > end):
+                    break
+                if (start is not None and i + 1 < len(times)
+                        and times[i + 1] <= start):
+                    continue
+
+            f.seek(offsets[i])
+            size = None if offsets[i + 1] is None else offsets[i + 1] - offsets[i]
+            data = f.read() if size is None else f.read(size)
+            text.append(_codecs[codec][1].decompress(data).decode())
+
+    data = pd.read_csv(io.StringIO(''.join(text)), sep=';', index_col=0,
+                       parse_dates=True)
+    data = data.loc[:, ~data.columns.str.startswith('Unnamed')]
+    if (t_start is not None):
+        data = data[data.index >= t_start]
+    if (t_end is not None):
+        data = data[data.index <= t_end]
+    return data
+
+
+def _compress(codec: str, data: bytes, level: int):
+    if (codec == 'lzma'):
+        return lzma.compress(data, preset=level)
+    elif (level is not None):
+        return _codecs[codec][1].compress(data, level)
+    return _codecs[codec][1].compress(data)
+
+
+# 3. Main Exec =================================================================
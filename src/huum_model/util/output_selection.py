@@ -0,0 +1,117 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Selection of what gets written, on top of 'logging_type' & the 'log_*'
+# switches (settings 'output_windows', 'output_entities', 'output_sample'):
+#   - time windows: outputs only write for timepoints within one of them
+#   - entities:     only outputs of the listed nodes (and the nodes below them)
+#                   are created. Listed are node names (e.g. 'h0', 'kettle') or
+#                   full node ids. A share of the holdings can be sampled.
+# Outputs not belonging to a node (e.g. aggregations) are always selected.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import random
+
+# 1. Global vars ===============================================================
+_windows  = None     # list of (start, end) timepoints, 'None': always write
+_entities = None     # set of selected node names / ids, 'None': all
+_open     = True     # whether the current timepoint is within a window
+
+
+# 2. Functions =================================================================
+def setup(windows: list = None, entities: list = None):
+    """
+    windows  - list of (start, end) timepoints (both included)
+    entities - node names / ids to write outputs for
+    """
+    global _windows, _entities, _open
+    _windows  = list(windows) if windows else None
+    _entities = set(entities) if entities is not None else None
+    _open     = True
+
+
+def sample_holdings(holdings: list, share: float, seed):
+    """
+    Adds a random share of the holdings to the selected entities. Uses its own random
+    generator, so that the model's random numbers stay the same.
+    """
+    global _entities
+    if (_entities is None):
+        _entities = set()
+
+    names  = sorted(hold.get_node_name() for hold in holdings)
+    number = int(round(share * len(names)))
+    _entities.update(random.Random(seed).sample(names, number))
+
+
+def has_windows():
+    return _windows is not None
+
+
+def is_open():
+    return _open
+
+
+def update(current_tp: datetime.datetime):
+    """
+    Sets whether outputs write for the timepoint.
+    """
+    global _open
+    if (_windows is not None):
+        _open = any(start <= current_tp <= end for start, end in _windows)
+
+
+def is_selected(source_id: str):
+    """
+    Checks whether outputs of the node should be created.
+
+    source_id - full node id, e.g. '$model_root.$holding_h0.$cu_cu0'
+    """
+    if (_entities is None or source_id is None):
+        return True
+
+    if (source_id in _entities):
+        return True
+
+    for part in source_id.split('.'):
+        if (part.split('_', 1)[-1] in _entities):
+            return True
+
+    return False
+
+
+# 3. Main Exec =================================================================
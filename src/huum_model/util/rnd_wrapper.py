@@ -12,6 +12,7 @@
 # 2019.06.10 - SBerendsen - start
 # 2020.04.26 - SBerendsen - Replaced branches by callbacks for easier testing
 # 2020.07.28 - SBerendsen - extracted into separate file and renamed
+# 2026.10.19 - SBerendsen - numpy generator for vectorised draws
 #
 # ------------------------------------------------------------------------------
 #
@@ -42,7 +43,10 @@
 # external
 import random
 
+import numpy as np
+
 # 1. Global vars ===============================================================
+_np_rng = np.random.default_rng()   # for vectorised draws. Seeded together with 'random'
 
 
 # ------------------------------------------------------------------------------
@@ -51,7 +55,14 @@ import random
 
 # 2. Functions =================================================================
 def rnd_set_seed(seed):
+    """
+    Seeds both generators. The numpy one takes integer seeds (incl. strings of digits,
+    e.g. from the settings file) directly; other seeds are used as the integer of
+    their UTF-8 bytes (little endian).
+    """
+    global _np_rng
     random.seed(seed)
+    _np_rng = np.random.default_rng(_to_int_seed(seed))
     # global logfile
     # logfile = open('rnd.log', 'w')
     # logfile.write(f'Seed: {seed}\n\n')
@@ -79,4 +90,21 @@ def rnd_get_random_number():
     return val
 
 
+def rnd_get_gauss_dist_array(mu, sigma, size: int):
+    return _np_rng.normal(mu, sigma, size)
+
+
+def rnd_get_uniform_dist_array(a, b, size: int):
+    return _np_rng.uniform(a, b, size)
+
+
+def _to_int_seed(seed):
+    # integer seed for the numpy generator, see rnd_set_seed
+    if (isinstance(seed, int)):
+        return seed
+    if (str(seed).isdigit()):
+        return int(seed)
+    return int.from_bytes(str(seed).encode(), 'little')
+
+
 # 3. Main Exec =================================================================
@@ -44,6 +44,8 @@ import dateutil.parser
 from huum_io import settings as io_settings
 
 # 1. Global vars ===============================================================
+_engine_types = ['objects', 'arrays']
+_activation_formats = ['csv', 'packed', 'sparse']
 
 
 # 1.1 Classes ------------------------------------------------------------------
@@ -68,6 +70,30 @@ class Config:  # holds config data
                  log_wants: bool = False,
                  log_probability: bool = False,
                  log_TS_outputs: bool = True,
+                 log_categorical: bool = False,
+                 output_block_size: int = 0,
+                 output_resample: int = 0,
+                 output_resample_how: str = 'sum',
+                 output_compression: str = None,
+                 output_compression_level: int = None,
+                 output_chunk_lines: int = 0,
+                 output_partition=None,
+                 output_sqlite: bool = False,
+                 output_sqlite_batch: int = 100000,
+                 output_binary: str = None,
+                 output_binary_dtype: str = 'float64',
+                 activation_format: str = 'csv',
+                 aggregations: list = None,
+                 output_windows: list = None,
+                 output_entities: list = None,
+                 output_sample: float = None,
+                 sample_next_use: bool = False,
+                 engine: str = 'objects',
+                 batch_transitions: bool = False,
+                 holidays: list = None,
+                 lazy_storages: bool = False,
+                 lookup_tables: bool = False,
+                 memo_functions: bool = False,
                  seed: str = None,
                  name: str = None):
 
@@ -81,6 +107,7 @@ class Config:  # holds config data
         self.t_step_min = t_step_min
         self.t_step_max = t_step_max
         self.seed = seed
+        self.holidays = holidays    # public holidays (dates or ISO date strings)
 
         # logging stuff
         self.headless = headless
@@ -97,11 +124,82 @@ class Config:  # holds config data
         self.log_wants = log_wants
         self.log_probability = log_probability
         self.log_TS_outputs = log_TS_outputs
+        self.log_categorical = log_categorical  # lifecycle/wants/blocking logs as integer codes (see LegendInfo files)
+        self.output_block_size = output_block_size  # rows filtered at once by the number outputs, 0: row by row
+        self.output_resample = output_resample  # seconds to resample the usage outputs (appliances & aggregations) to, 0: model timestep
+        self.output_resample_how = output_resample_how.lower()  # 'sum', 'mean', 'max' or 'count' (non-zero values)
+        self.output_compression = output_compression  # 'gzip', 'lzma' or 'bz2' for compressed output files, 'None': plain
+        self.output_compression_level = output_compression_level  # 'None': the codec's default
+        self.output_chunk_lines = output_chunk_lines  # compress in indexed chunks of lines (seekable by time), 0: off
+        self.output_partition = output_partition  # files per 'month', 'week' or number of timesteps (see manifest.csv)
+        self.output_sqlite = output_sqlite  # number outputs into '<output_prefix>/results.sqlite' instead of CSV files
+        self.output_sqlite_batch = output_sqlite_batch  # rows per insert transaction
+        self.output_binary = output_binary  # number outputs as 'npy' or 'arrow' (pyarrow) files instead of CSV, 'None': off
+        self.output_binary_dtype = output_binary_dtype  # 'float32' or 'float64'
+        self.activation_format = activation_format.lower()  # 'csv', or as activation ticks: 'packed' (bits), 'sparse' (list)
+        self.aggregations = aggregations    # appliance output totals, list of dicts (see util/aggregation)
+        self.output_windows = None          # list of (start, end): only write outputs within those
+        self.output_entities = output_entities  # node names/ids to write outputs for, 'None': all
+        self.output_sample = output_sample  # share of holdings (randomly chosen) to write outputs for
+
+        if (output_windows is not None):
+            self.output_windows = [
+                tuple(dateutil.parser.isoparse(tp) if isinstance(tp, str) else tp
+                      for tp in window)
+                for window in output_windows
+            ]
+
+        # performance stuff
+        self.sample_next_use = sample_next_use  # pre-sample appliance uses & event starts for constant probabilities
+        self.engine = engine.lower()            # 'objects': object model; 'arrays': struct-of-arrays population state
+        self.batch_transitions = batch_transitions  # do all status changes of a timestep at once (needs engine 'arrays')
+        self.lazy_storages = lazy_storages      # compute storage volumes with constant rates only when asked for
+        self.lookup_tables = lookup_tables      # precomputed translator values for storages & passed times
+        self.memo_functions = memo_functions    # evaluate 'function' probabilities once per timestep & argument
 
         # derived data
         self.nr_timesteps = datetime.timedelta.total_seconds(endDate -
                                                              startDate)
 
+        if not (self.engine in _engine_types):
+            print('\nsettings.Config: Error:')
+            print(f'Unsupported engine #{self.engine}#, supported:', _engine_types)
+            exit(255)
+
+        if not (self.activation_format in _activation_formats):
+            print('\nsettings.Config: Error:')
+            print(f'Unsupported activation format #{self.activation_format}#, supported:',
+                  _activation_formats)
+            exit(255)
+
+        if (self.batch_transitions and self.engine != 'arrays'):
+            print('\nsettings.Config: Error:')
+            print("Batched transitions need the engine 'arrays'")
+            exit(255)
+
+        if (self.output_sqlite and self.output_binary is not None):
+            print('\nsettings.Config: Error:')
+            print("Only one of 'output_sqlite' & 'output_binary' can be set")
+            exit(255)
+
+        if ((self.output_sqlite or self.output_binary is not None)
+                and self.output_compression is not None):
+            print('\nsettings.Config: Error:')
+            print("'output_compression' is not supported by the sqlite & binary outputs")
+            exit(255)
+
+        if ((self.output_sqlite or self.output_binary is not None)
+                and self.output_partition is not None):
+            print('\nsettings.Config: Error:')
+            print("'output_partition' is not supported by the sqlite & binary outputs")
+            exit(255)
+
+        if (self.aggregations and self.log_as_single and not self.headless):
+            print('\nsettings.Config: Error:')
+            print('Aggregations are not written to the single output file, '
+                  "disable 'log_as_single'")
+            exit(255)
+
         if (t_step_max != t_step_min):
             print('\nsettings.Config: Error:')
             print(
@@ -144,8 +242,55 @@ class Config:  # holds config data
                      log_wants=settings_data.log_wants,
                      log_probability=settings_data.log_probability,
                      log_TS_outputs=settings_data.log_TS_outputs,
+                     log_categorical=getattr(settings_data, 'log_categorical',
+                                             False),
+                     output_block_size=getattr(settings_data,
+                                               'output_block_size', 0),
+                     output_resample=getattr(settings_data, 'output_resample',
+                                             0),
+                     output_resample_how=getattr(settings_data,
+                                                 'output_resample_how', 'sum'),
+                     output_compression=getattr(settings_data,
+                                                'output_compression', None),
+                     output_compression_level=getattr(
+                         settings_data, 'output_compression_level', None),
+                     output_chunk_lines=getattr(settings_data,
+                                                'output_chunk_lines', 0),
+                     output_partition=getattr(settings_data,
+                                              'output_partition', None),
+                     output_sqlite=getattr(settings_data, 'output_sqlite',
+                                           False),
+                     output_sqlite_batch=getattr(settings_data,
+                                                 'output_sqlite_batch', 100000),
+                     output_binary=getattr(settings_data, 'output_binary',
+                                           None),
+                     output_binary_dtype=getattr(settings_data,
+                                                 'output_binary_dtype',
+                                                 'float64'),
+                     activation_format=getattr(settings_data,
+                                               'activation_format', 'csv'),
+                     aggregations=getattr(settings_data, 'aggregations',
+                                          None),
+                     output_windows=getattr(settings_data, 'output_windows',
+                                            None),
+                     output_entities=getattr(settings_data, 'output_entities',
+                                             None),
+                     output_sample=getattr(settings_data, 'output_sample',
+                                           None),
                      t_step_min=settings_data.t_step_min,
                      t_step_max=settings_data.t_step_max,
+                     sample_next_use=getattr(settings_data, 'sample_next_use',
+                                             False),
+                     engine=getattr(settings_data, 'engine', 'objects'),
+                     batch_transitions=getattr(settings_data,
+                                               'batch_transitions', False),
+                     holidays=getattr(settings_data, 'holidays', None),
+                     lazy_storages=getattr(settings_data, 'lazy_storages',
+                                           False),
+                     lookup_tables=getattr(settings_data, 'lookup_tables',
+                                           False),
+                     memo_functions=getattr(settings_data, 'memo_functions',
+                                            False),
                      seed=settings_data.seed)
 
         # TODO Checks for all settings
@@ -166,6 +311,11 @@ class Config:  # holds config data
     def get_logging_type(self):
         return self.logging_type
 
+    def get_output_resample(self):
+        if (self.output_resample):
+            return datetime.timedelta(seconds=self.output_resample)
+        return None
+
     def get_log_passed_time(self):
         return self.log_passed_time
 
@@ -49,6 +49,7 @@ import numpy as np
 
 
 # internal
+from . import flyweight
 
 
 # 1. Global vars ===============================================================
@@ -87,11 +88,39 @@ class SpacedArray:   # holds config data
         arr_size     = 1 + (arr_x[-1] // time_step)
         time_span    = time_step * arr_size     # length of the timespan the array is active for
         get_x_arr    = np.arange(0, arr_size * time_step, time_step)
-        self.__array = np.interp(get_x_arr, arr_x, arr_y)
+        self.__array = flyweight.share_array(np.interp(get_x_arr, arr_x, arr_y))
 
         # other data
         self.__time_span = datetime.timedelta(seconds=time_span)
 
+        # struct-of-arrays engine: if set, holds the runtime data instead
+        self.__population = None
+        self.__pop_index  = -1
+
+
+    def bind_population(self, population, index: int):
+        """
+        Hands the runtime data over to the population state (engine 'arrays').
+        """
+        population.activate_pattern(index, self.__t_start, self.__t_end)
+        population.pattern_pos[index] = self.__n
+
+        self.__population = population
+        self.__pop_index  = index
+
+
+    def remove_from_population(self):
+        """
+        Stops the pattern from contributing to the output of the population state.
+        """
+        if (self.__population is not None):
+            self.__population.remove_pattern(self.__pop_index)
+            self.__population = None
+
+
+    def get_array(self):
+        return self.__array
+
 
     def get_timespan(self):
         return self.__time_span
@@ -106,12 +135,20 @@ class SpacedArray:   # holds config data
 
 
     def activate(self, t_start: datetime.datetime, set_end: datetime.datetime):
+        if (self.__population is not None):
+            self.__population.activate_pattern(self.__pop_index, t_start, set_end)
+            return
+
         self.__t_start = t_start
         self.__n       = -1
         self.__t_end   = set_end
 
 
     def update(self, t_current: datetime.datetime):
+        # done for all patterns at once by the population state
+        if (self.__population is not None):
+            return
+
         if (self.__t_start is None):
             pass
 
@@ -132,6 +169,9 @@ class SpacedArray:   # holds config data
         Todo
             Rebuild so that the first check isn't necessary.
         """
+        if (self.__population is not None):
+            return self.__population.get_pattern_value(self.__pop_index)
+
         if (self.__n >= len(self.__array)):
             return 0.0
 
@@ -143,6 +183,10 @@ class SpacedArray:   # holds config data
 
 
     def deactivate(self):
+        if (self.__population is not None):
+            self.__population.deactivate_pattern(self.__pop_index)
+            return
+
         self.__t_start = None
         self.__t_end   = None
         self.__n       = -1
@@ -0,0 +1,200 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# SQLite database as target of the number outputs (incl. aggregations), see
+# setting 'output_sqlite'. Instead of a CSV file per output, all rows go into
+# one long format table of the run's database:
+#
+#   records(tick, entity, col, value)   - tick: timesteps since the model start
+#   entities(id, name)                  - one per output (file name without
+#                                         output directory & '.csv')
+#   columns(id, entity, name)           - the columns of each output
+#   meta(key, value)                    - 't_start', 'time_step' (seconds)
+#   records_named                       - view with names & timepoints
+#
+# Rows are collected and inserted in batches with executemany, each batch in
+# one transaction; the database runs in WAL mode. The indexes get created at
+# the end of the run, after all rows are in.
+#
+# Can't be combined with 'output_binary', 'output_compression' or
+# 'output_partition' (see settings.Config).
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import itertools
+import os
+import sqlite3
+
+import numpy as np
+
+# 1. Global vars ===============================================================
+_db         = None      # connection, 'None': not used
+_prefix     = ''        # output directory (removed from the entity names)
+_t_start    = None
+_time_step  = None
+_batch_size = 100000    # rows per executemany/transaction
+_rows       = []        # rows not yet inserted
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class SinkTable:  # the part of the database belonging to one output
+
+    def __init__(self, name: str, column_names: list):
+        """
+        name         - name of the output
+        column_names - names of its columns
+        """
+        self.entity  = _db.execute('INSERT INTO entities (name) VALUES (?)',
+                                   (name, )).lastrowid
+        self.columns = []
+        for column in column_names:
+            self.columns.append(_db.execute(
+                'INSERT INTO columns (entity, name) VALUES (?, ?)',
+                (self.entity, column)).lastrowid)
+
+
+    def write_row(self, tp: datetime.datetime, np_array: np.array):
+        """
+        Adds the values of a row (for the timepoint).
+        """
+        tick = (tp - _t_start) // _time_step
+        _rows.extend(zip(itertools.repeat(tick), itertools.repeat(self.entity),
+                         self.columns, np_array.tolist()))
+        if (len(_rows) >= _batch_size):
+            _flush()
+
+
+    def close(self):
+        pass
+
+
+# 2. Functions =================================================================
+def setup(filename: str, prefix: str, t_start: datetime.datetime,
+          time_step: datetime.timedelta, batch_size: int = 100000):
+    """
+    Creates the database.
+
+    filename   - database file, 'None': not used
+    prefix     - output directory
+    t_start    - model start (tick 0)
+    time_step  - model timestep
+    batch_size - rows per insert
+    """
+    global _db, _prefix, _t_start, _time_step, _batch_size
+
+    _db = None
+    _rows.clear()
+    if (filename is None):
+        return
+
+    _prefix     = prefix
+    _t_start    = t_start
+    _time_step  = time_step
+    _batch_size = batch_size
+
+    os.makedirs(os.path.dirname(filename) or '.', exist_ok=True)
+    if (os.path.exists(filename)):
+        os.remove(filename)
+
+    _db = sqlite3.connect(filename, isolation_level=None)
+    _db.execute('PRAGMA journal_mode=WAL')
+    _db.execute('PRAGMA synchronous=NORMAL')
+    _db.execute('CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT)')
+    _db.execute('CREATE TABLE entities (id INTEGER PRIMARY KEY, name TEXT)')
+    _db.execute('CREATE TABLE columns (id INTEGER PRIMARY KEY, entity INTEGER, '
+                'name TEXT)')
+    _db.execute('CREATE TABLE records (tick INTEGER, entity INTEGER, '
+                'col INTEGER, value REAL)')
+    _db.execute(
+        'CREATE VIEW records_named AS SELECT '
+        "datetime((SELECT value FROM meta WHERE key = 't_start'), "
+        "'+' || (r.tick * (SELECT value FROM meta WHERE key = 'time_step')) "
+        "|| ' seconds') AS time, "
+        'e.name AS entity, c.name AS col, r.value AS value '
+        'FROM records r JOIN entities e ON e.id = r.entity '
+        'JOIN columns c ON c.id = r.col')
+    _db.executemany('INSERT INTO meta VALUES (?, ?)',
+                    [('t_start', t_start.isoformat(' ')),
+                     ('time_step', str(time_step.total_seconds()))])
+
+
+def is_used():
+    return _db is not None
+
+
+def open_table(filename: str, column_names: list):
+    """
+    Returns:
+
+    table - the sink for an output, named after its file name
+    """
+    name = filename
+    if (_prefix and name.startswith(_prefix)):
+        name = name[len(_prefix):]
+    if (name.endswith('.csv')):
+        name = name[:-4]
+    return SinkTable(os.path.normpath(name).lstrip('/'), column_names)
+
+
+def close():
+    """
+    Inserts the remaining rows, creates the indexes and closes the database. All
+    outputs need to be closed before.
+    """
+    global _db
+    if (_db is None):
+        return
+
+    _flush()
+    _db.execute('CREATE INDEX records_entity ON records (entity, col, tick)')
+    _db.execute('CREATE INDEX records_tick ON records (tick)')
+    _db.execute('CREATE INDEX columns_entity ON columns (entity)')
+    _db.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+    _db.close()
+    _db = None
+
+
+def _flush():
+    # inserts the collected rows as one transaction
+    if not (_rows):
+        return
+    _db.execute('BEGIN')
+    _db.executemany('INSERT INTO records VALUES (?, ?, ?, ?)', _rows)
+    _db.execute('COMMIT')
+    _rows.clear()
+
+
+# 3. Main Exec =================================================================
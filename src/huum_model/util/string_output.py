@@ -49,6 +49,10 @@
 import datetime
 import os
 
+# internal
+from . import output_file
+from . import output_selection
+
 # 1. Global vars ===============================================================
 _filter_types = ['none', 'all', 'simple', 'complex']
 
@@ -62,15 +66,22 @@ class StringOutput:  # class to de-duplicate string output (datetime different,
     _single_file = False
 
     # class object specific stuff
-    def __init__(self, filename: str, should_log: bool):
+    def __init__(self, filename: str, should_log: bool, source_id: str = None):
+        """
+        source_id - full node id of the owner (for the output selection)
+        """
+        should_log = should_log and output_selection.is_selected(source_id)
 
         # setup variables
         self._file = None
 
         self._write_func      = None        # function call back to the actually used write function
+        self._window_func     = None        # with time windows: the write function used within them
         self._fn              = filename
         self._last_string     = ""
         self._last_tp_written = datetime.datetime(year=1, month=1, day=1)
+        self._window_open     = False       # whether the last write was within a time window
+        self._window_last     = None        # last timepoint written within the current window
 
         # do the work
         if (self._headless() or StringOutput._filter_type() == 'none'
@@ -82,7 +93,7 @@ class StringOutput:  # class to de-duplicate string output (datetime different,
             directory = os.path.dirname(self._fn)
             if not os.path.exists(directory):
                 os.makedirs(directory)
-            self._file = open(self._fn, 'w')
+            self._file = output_file.open_output(self._fn)
 
             if (StringOutput._filter_type() == 'all'):
                 self._write_func = self._write_full
@@ -90,6 +101,11 @@ class StringOutput:  # class to de-duplicate string output (datetime different,
             elif (StringOutput._filter_type() in ['simple', 'complex']):
                 self._write_func = self._write_simple_filter
 
+            # time windows
+            if (output_selection.has_windows()):
+                self._window_func = self._write_func
+                self._write_func  = self._write_windowed
+
 
     def get_file(self):
         return self._file
@@ -116,13 +132,29 @@ class StringOutput:  # class to de-duplicate string output (datetime different,
             pass
 
         else:
-            if (self._last_tp_written != current_tp):
-                self._file.write(current_tp.isoformat(' ') + ';')
-                self._file.write(self._last_string + '\n')
+            if (self._window_func is None):
+                self._finish(current_tp)
+            elif (self._window_open):
+                self._finish(self._window_last)
 
             self._file.close()
 
 
+    def _finish(self, current_tp: datetime.datetime):
+        """
+        Writes the last status, if needed (end of the run or of a time window).
+        """
+        if (self._last_tp_written != current_tp and self._last_string is not None):
+            self._file.write(current_tp.isoformat(' ') + ';')
+            self._file.write(self._last_string + '\n')
+            self._last_tp_written = current_tp
+
+
+    def _restart(self):
+        # forgets the last status, so that nothing from before a time window gets written
+        self._last_string = None
+
+
     def _write_full(self, string: str, current_tp: datetime.datetime,
                     last_tp: datetime.datetime):
         """
@@ -155,6 +187,24 @@ class StringOutput:  # class to de-duplicate string output (datetime different,
                 self._last_tp_written = current_tp
 
 
+    def _write_windowed(self, string: str, current_tp: datetime.datetime,
+                        last_tp: datetime.datetime):
+        """
+        Only writes within the output time windows. Each window gets written like a run
+        of its own.
+        """
+        if (output_selection.is_open()):
+            if not (self._window_open):
+                self._restart()
+                self._window_open = True
+            self._window_func(string, current_tp, last_tp)
+            self._window_last = current_tp
+
+        elif (self._window_open):
+            self._finish(self._window_last)
+            self._window_open = False
+
+
     def _write_nothing(self, string: str, current_tp: datetime.datetime,
                        last_tp: datetime.datetime):
         """
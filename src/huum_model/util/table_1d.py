@@ -38,7 +38,10 @@
 # 0. Imports ===================================================================
 import numpy as np
 
+from . import flyweight
+
 # 1. Global vars ===============================================================
+_MAX_LOOKUP_ENTRIES = 1000000     # largest lookup table built, see build_lookup
 
 
 # 1.1 Classes ------------------------------------------------------------------
@@ -60,6 +63,8 @@ class Table1d:  # class for dealing with when there is a list to choose from
         self._arr_y        = arr_y
         self._return_above = _decode_return(return_above, arr_y)
         self._return_below = _decode_return(return_below, arr_y)
+        self._pieces       = None   # see get_constant_range
+        self._lookups      = {}     # step -> lookup table, see build_lookup
 
 
     @classmethod
@@ -70,7 +75,10 @@ class Table1d:  # class for dealing with when there is a list to choose from
                       return_above=file_data.return_above,
                       return_below=file_data.return_below)
 
-        return cls
+        return flyweight.share(cls, (flyweight.content_key(file_data.table_x),
+                                     flyweight.content_key(file_data.table_y),
+                                     file_data.return_above,
+                                     file_data.return_below))
 
     def get_value(self, x):
         if (self._arr_x[0] > x):
@@ -90,7 +98,136 @@ class Table1d:  # class for dealing with when there is a list to choose from
                                                  self._arr_y[pos - 1])
 
 
+    def get_values(self, arr):
+        """
+        Vectorised get_value for an array of x-values. Same results as get_value, with
+        'None' returns as NaN.
+        """
+        arr_x = np.asarray(self._arr_x, dtype=float)
+        arr_y = np.asarray(self._arr_y, dtype=float)
+        arr   = np.asarray(arr, dtype=float)
+
+        pos = np.clip(np.searchsorted(arr_x, arr, side='right'), 1,
+                      arr_x.size - 1)
+        with np.errstate(divide='ignore', invalid='ignore'):  # single x-value tables
+            rat    = (arr - arr_x[pos - 1]) / (arr_x[pos] - arr_x[pos - 1])
+            values = arr_y[pos - 1] + rat * (arr_y[pos] - arr_y[pos - 1])
+
+        values[arr == arr_x[-1]] = arr_y[-1]
+        values[arr < arr_x[0]]   = _to_float(self._return_below)
+        values[arr > arr_x[-1]]  = _to_float(self._return_above)
+
+        return values
+
+
+    def build_lookup(self, step: float):
+        """
+        Precomputes the values for all multiples of step from 0 up to the last x-value
+        (e.g. step: model timestep for passed times), see get_value_at.
+
+        Returns:
+
+        'True' if the lookup table exists, 'False' if it would be too large.
+        """
+        if (step in self._lookups):
+            return True
+
+        num_entries = int(self._arr_x[-1] // step) + 1
+        if (step <= 0.0 or not (0 < num_entries <= _MAX_LOOKUP_ENTRIES)):
+            return False
+
+        # same arithmetic as get_value, so that the values are exactly the same
+        x_values = np.arange(num_entries) * step
+        lookup   = self.get_values(x_values).tolist()
+        if (self._return_below is None):
+            for i in np.flatnonzero(x_values < self._arr_x[0]).tolist():
+                lookup[i] = None
+
+        self._lookups[step] = lookup
+        return True
+
+
+    def get_value_at(self, x, step: float):
+        """
+        Like get_value, but uses the lookup table for step (see build_lookup), if x is
+        one of its entries.
+        """
+        lookup = self._lookups.get(step)
+        if (lookup is not None):
+            pos = x / step
+            i   = int(pos)
+            if (i == pos and 0 <= i < len(lookup)):
+                return lookup[i]
+
+        return self.get_value(x)
+
+
+    def get_constant_range(self, x):
+        """
+        Gets the range of x-values around x within which the value stays the same as
+        for x.
+
+        Returns:
+
+        (lower, upper) - the value is the same for lower < x < upper (can be -inf/inf).
+                         Returns 'None' if the value changes with x.
+        """
+        if (self._pieces is None):
+            self._pieces = _get_pieces(self._arr_x, self._arr_y,
+                                       self._return_below, self._return_above)
+
+        # piece containing x. On a breakpoint: not handled (conservative)
+        pos = None
+        for i, (start, end, value, flat) in enumerate(self._pieces):
+            if (start < x < end):
+                pos = i
+                break
+
+        if (pos is None or not self._pieces[pos][3]):
+            return None
+
+        # extend over neighbouring pieces with the same value
+        value = self._pieces[pos][2]
+        low   = pos
+        while (low > 0 and self._pieces[low - 1][3]
+               and self._pieces[low - 1][2] == value
+               and self._arr_y[low - 1] == value):
+            low -= 1
+
+        high = pos
+        while (high < len(self._pieces) - 1 and self._pieces[high + 1][3]
+               and self._pieces[high + 1][2] == value
+               and self._arr_y[high] == value):
+            high += 1
+
+        return self._pieces[low][0], self._pieces[high][1]
+
+
 # 2. Functions =================================================================
+def _get_pieces(arr_x, arr_y, return_below, return_above):
+    """
+    Splits a table into its pieces (below, between each two x-values, above).
+
+    Returns:
+
+    list of (start, end, value, flat) - flat: the value is the same within the piece
+    """
+    pieces = [(-np.inf, arr_x[0], return_below, True)]
+    for i in range(len(arr_x) - 1):
+        flat = (arr_y[i] == arr_y[i + 1])
+        pieces.append((arr_x[i], arr_x[i + 1], arr_y[i], flat))
+    pieces.append((arr_x[-1], np.inf, return_above, True))
+
+    return pieces
+
+
+def _to_float(value):
+    # 'None' return values as NaN
+    if (value is None):
+        return np.nan
+    return value
+
+
 def _decode_return(return_type, arr_y):
     if (return_type is None or return_type == 'None'):
         return None
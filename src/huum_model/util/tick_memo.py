@@ -0,0 +1,87 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Per-timestep memo for the callbacks of 'function' typed probabilities (e.g.
+# Storage.get_val, PassedTime.get_val), see setting 'memo_functions'. Results
+# are kept per (callback, argument) until the model state they depend on
+# changes: every timestep (new_tick), or when an event changes the object the
+# callback belongs to (invalidate).
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# 1. Global vars ===============================================================
+_enabled = False
+_memo    = {}       # id(owner of the callback) -> {(function, argument): result}
+
+
+# 2. Functions =================================================================
+def setup(enabled: bool):
+    global _enabled
+    _enabled = enabled
+    _memo.clear()
+
+
+def call(func, arg):
+    """
+    Calls func(arg), or returns the result of the same call earlier in this timestep.
+    """
+    if not (_enabled):
+        return func(arg)
+
+    owner   = getattr(func, '__self__', None)
+    entries = _memo.get(id(owner))
+    if (entries is None):
+        entries = {}
+        _memo[id(owner)] = entries
+
+    key = (getattr(func, '__func__', func), arg)
+    if (key in entries):
+        return entries[key]
+
+    result       = func(arg)
+    entries[key] = result
+    return result
+
+
+def new_tick():
+    """ Drops all results (the model state changed)."""
+    _memo.clear()
+
+
+def invalidate(owner):
+    """ Drops the results of the callbacks belonging to owner (its state changed)."""
+    _memo.pop(id(owner), None)
+
+
+# 3. Main Exec =================================================================
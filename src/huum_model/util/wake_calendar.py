@@ -0,0 +1,90 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Implements a model-wide calendar of wake-up timepoints, so that items (e.g.
+# agents) with nothing to do can be skipped until they are due again.
+# Uses a min-heap; rescheduled or cancelled entries are left in the heap and
+# ignored when popped.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# general
+import datetime
+import heapq
+
+# 1. Global vars ===============================================================
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class WakeCalendar:
+
+    def __init__(self):
+        self._heap     = []   # entries: (timepoint, counter, item)
+        self._wake_tps = {}   # currently valid wake-up timepoint per sleeping item
+        self._counter  = 0    # tie breaker, so that items never get compared
+
+    def schedule(self, item, wake_tp: datetime.datetime):
+        """ Lets the item sleep until wake_tp. Replaces any previous wake-up time."""
+        self._wake_tps[item] = wake_tp
+        self._counter += 1
+        heapq.heappush(self._heap, (wake_tp, self._counter, item))
+
+    def cancel(self, item):
+        """ Wakes the item up immediately, if it is sleeping."""
+        self._wake_tps.pop(item, None)
+
+    def is_sleeping(self, item):
+        return item in self._wake_tps
+
+    def wake_due(self, current_tp: datetime.datetime):
+        """
+        Wakes up all items due at or before current_tp.
+
+        Returns:
+
+        woken - list of the items woken up.
+        """
+        woken = []
+        while self._heap and self._heap[0][0] <= current_tp:
+            wake_tp, _, item = heapq.heappop(self._heap)
+            if (self._wake_tps.get(item) == wake_tp):
+                del self._wake_tps[item]
+                woken.append(item)
+
+        return woken
+
+# 2. Functions =================================================================
+
+
+# 3. Main Exec =================================================================
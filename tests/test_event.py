@@ -0,0 +1,118 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests for the pre-sampled (geometric) start of probability events.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# Internal
+from huum_model.events import event
+from huum_model.util import rnd_wrapper
+
+# External
+import datetime
+
+import pytest
+
+# 1. Global vars ===============================================================
+_T0        = datetime.datetime(2020, 1, 1)
+_TIME_STEP = datetime.timedelta(minutes=1)
+
+
+# 1.1 Classes ------------------------------------------------------------------
+class _StepProbability:
+    # probability 'before' until switch_tp, 'after' from then on
+
+    def __init__(self, switch_tp: datetime.datetime, before: float, after: float):
+        self.switch_tp = switch_tp
+        self.before    = before
+        self.after     = after
+
+    def get_constant_until(self, current_tp: datetime.datetime):
+        if (current_tp < self.switch_tp):
+            return self.switch_tp
+        return datetime.datetime.max
+
+    def get_probability_value(self, current_tp: datetime.datetime):
+        if (current_tp < self.switch_tp):
+            return self.before
+        return self.after
+
+
+# 2. Functions =================================================================
+@pytest.fixture(autouse=True)
+def _sampled():
+    rnd_wrapper.rnd_set_seed(1)
+    event.Event.setup_class_vars(_TIME_STEP)
+    yield
+    event.Event.setup_class_vars(None)
+
+
+def _get_starts(probability, num_steps: int):
+    obj = event.Event('event', 'Probability', probability=probability)
+    return [step for step in range(num_steps)
+            if obj.check_start(_T0 + step * _TIME_STEP)]
+
+
+def test_start_rate_matches_probability():
+    num_steps = 40000
+    starts    = _get_starts(_StepProbability(datetime.datetime.max, 0.25, 0.25),
+                            num_steps)
+
+    assert len(starts) / num_steps == pytest.approx(0.25, abs=0.01)
+
+
+def test_sampled_starts_stay_within_constant_period():
+    # a start sampled beyond the switch must not be used afterwards
+    starts = _get_starts(_StepProbability(_T0 + 50 * _TIME_STEP, 0.05, 0.0), 500)
+
+    assert starts
+    assert max(starts) < 50
+
+
+def test_starts_once_probability_becomes_certain():
+    starts = _get_starts(_StepProbability(_T0 + 100 * _TIME_STEP, 0.0, 1.0), 200)
+
+    assert starts == list(range(100, 200))
+
+
+def test_same_seed_same_starts():
+    probability = _StepProbability(datetime.datetime.max, 0.1, 0.1)
+    starts      = _get_starts(probability, 1000)
+
+    rnd_wrapper.rnd_set_seed(1)
+    assert _get_starts(probability, 1000) == starts
+
+
+# 3. Main Exec =================================================================
@@ -0,0 +1,97 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests for the list of time-limited items.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# Internal
+from huum_model.util import expiry_list
+
+# External
+import datetime
+
+# 1. Global vars ===============================================================
+_T0 = datetime.datetime(2020, 1, 1)
+
+
+# 2. Functions =================================================================
+def _tp(minutes: int):
+    return _T0 + datetime.timedelta(minutes=minutes)
+
+
+def test_keeps_insertion_order():
+    items = expiry_list.ExpiryList()
+    items.append('a', _tp(5))
+    items.append('b')
+    items.append('c', _tp(1))
+    items.insert_after('a', 'd', _tp(3))
+
+    assert list(items) == ['a', 'd', 'b', 'c']
+    assert len(items) == 4
+
+
+def test_remove_expired():
+    items = expiry_list.ExpiryList()
+    items.append('a', _tp(5))
+    items.append('b')
+    items.append('c', _tp(1))
+    items.append('d', _tp(3))
+
+    # expiry timepoint itself is still valid
+    assert not items.remove_expired(_tp(1))
+    assert list(items) == ['a', 'b', 'c', 'd']
+
+    assert items.remove_expired(_tp(4))
+    assert list(items) == ['a', 'b']
+
+    assert not items.remove_expired(_tp(5))
+    assert items.remove_expired(_tp(100))
+    assert list(items) == ['b']
+
+
+def test_filter_drops_expiry():
+    items = expiry_list.ExpiryList()
+    items.append('a', _tp(1))
+    items.append('b', _tp(2))
+    items.filter(lambda item: item != 'a')
+
+    assert list(items) == ['b']
+
+    # the filtered out item does not count as removed later on
+    assert items.remove_expired(_tp(3))
+    assert list(items) == []
+
+
+# 3. Main Exec =================================================================
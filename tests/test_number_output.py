@@ -0,0 +1,153 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests for the number outputs: closing of resample bins and output time
+# windows, and the rows kept by the complex filter. Files and headless runs
+# (with and without writing in blocks) have to give the same rows.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# Internal
+from huum_model.util import number_output
+from huum_model.util import output_selection
+
+# External
+import datetime
+import functools
+
+import numpy as np
+import pytest
+
+# 1. Global vars ===============================================================
+_T0    = datetime.datetime(2020, 1, 1)
+_MODES = [(False, 0), (False, 3), (True, 0), (True, 3)]   # (headless, block size)
+
+
+# 2. Functions =================================================================
+@pytest.fixture(autouse=True)
+def _selection():
+    output_selection.setup()
+    yield
+    output_selection.setup()
+
+
+def _tp(seconds: int):
+    return _T0 + datetime.timedelta(seconds=seconds)
+
+
+def _run(tmp_path, output_filter: str, headless: bool, block_size: int,
+         rows: list, tps: list, resample: datetime.timedelta = None):
+    """
+    Writes the rows at the timepoints tps and returns the kept ones.
+
+    Returns:
+
+    list of (seconds since _T0, row values)
+    """
+    number_output.setup_class_vars(functools.partial(bool, headless),
+                                   functools.partial(str, output_filter),
+                                   functools.partial(bool, False),
+                                   block_size)
+
+    filename = str(tmp_path / 'output.csv')
+    obj      = number_output.NumberOutput(filename, len(rows[0]),
+                                          ['v' + str(i) for i in range(len(rows[0]))],
+                                          True, None, None, resample=resample)
+    last_tp = tps[0]
+    for tp, row in zip(tps, rows):
+        output_selection.update(tp)
+        obj.row[:] = row
+        obj.write_row(tp, last_tp)
+        last_tp = tp
+    obj.close(tps[-1])
+
+    if (headless):
+        results = obj.get_results()
+        return [((index - _T0).total_seconds(), list(values))
+                for index, values in zip(results.index, results.values)]
+
+    with open(filename) as f:
+        lines = [line.split(';') for line in f.read().split('\n')[1:] if line]
+    return [((datetime.datetime.fromisoformat(line[0]) - _T0).total_seconds(),
+             [float(val) for val in line[1:len(rows[0]) + 1]])
+            for line in lines]
+
+
+@pytest.mark.parametrize('headless, block_size', _MODES)
+def test_resample_closes_last_bin(tmp_path, headless, block_size):
+    tps  = [_tp(i + 1) for i in range(12)]
+    kept = _run(tmp_path, 'complex', headless, block_size, [[1.0]] * 12, tps,
+                resample=datetime.timedelta(seconds=5))
+
+    # two full bins of 5 s and the partial last one
+    assert kept == [(1.0, [5.0]), (6.0, [5.0]), (11.0, [2.0])]
+
+
+@pytest.mark.parametrize('headless, block_size', _MODES)
+def test_windows_close(tmp_path, headless, block_size):
+    output_selection.setup([(_tp(2), _tp(4)), (_tp(8), _tp(10))])
+    values = [0, 1, 1, 2, 2, 2, 3, 4, 4, 5, 5, 5, 6]   # value at second i
+    tps    = [_tp(i) for i in range(1, 13)]
+    kept   = _run(tmp_path, 'complex', headless, block_size,
+                  [[float(values[i])] for i in range(1, 13)], tps)
+
+    # each window gets written like a run of its own
+    assert kept == [(2.0, [1.0]), (3.0, [2.0]), (4.0, [2.0]),
+                    (8.0, [4.0]), (9.0, [5.0]), (10.0, [5.0])]
+
+
+@pytest.mark.parametrize('headless, block_size', _MODES)
+def test_complex_filter_keeps_knots(tmp_path, headless, block_size):
+    rng = np.random.default_rng(1)
+    for _ in range(20):
+        # piecewise linear, with some flat pieces
+        increases = rng.integers(-2, 3, size=(8, 2))
+        rows      = np.cumsum(np.repeat(increases, rng.integers(1, 5, 8), axis=0),
+                              axis=0).astype(float)
+        tps       = [_tp(i) for i in range(len(rows))]
+        kept      = _run(tmp_path, 'complex', headless, block_size, rows.tolist(), tps)
+
+        seconds = np.array([item[0] for item in kept])
+        values  = np.array([item[1] for item in kept])
+        assert seconds[0] == 0.0
+        assert seconds[-1] == len(rows) - 1
+        assert np.all(np.diff(seconds) > 0)
+
+        # the kept rows reproduce all rows
+        for col in range(2):
+            assert np.allclose(np.interp(np.arange(len(rows)), seconds, values[:, col]),
+                               rows[:, col])
+
+
+# 3. Main Exec =================================================================
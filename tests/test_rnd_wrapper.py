@@ -0,0 +1,78 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests for the seeding of the random number generators.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# Internal
+from huum_model.util import rnd_wrapper
+
+# External
+import numpy as np
+
+# 1. Global vars ===============================================================
+
+
+# 2. Functions =================================================================
+def _draw(seed):
+    rnd_wrapper.rnd_set_seed(seed)
+    return (rnd_wrapper.rnd_get_random_number(),
+            rnd_wrapper.rnd_get_uniform_dist_array(0.0, 1.0, 5))
+
+
+def test_same_seed_same_numbers():
+    for seed in [42, 'huum']:
+        first, first_array = _draw(seed)
+        again, again_array = _draw(seed)
+
+        assert first == again
+        assert np.array_equal(first_array, again_array)
+
+
+def test_digit_string_seeds_numpy_as_integer():
+    _, from_string = _draw('42')
+    _, from_int    = _draw(42)
+
+    assert np.array_equal(from_string, from_int)
+
+
+def test_different_seeds_differ():
+    _, first  = _draw('huum')
+    _, second = _draw('huum2')
+
+    assert not np.array_equal(first, second)
+
+
+# 3. Main Exec =================================================================
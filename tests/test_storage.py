@@ -0,0 +1,132 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests for the storages held in the storage bank, mainly the prediction of
+# until when their value stays constant.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# Internal
+from huum_model.translators.storage import rate_increase
+from huum_model.translators.storage import storage
+from huum_model.translators.storage import storage_bank
+from huum_model.util import table_1d
+
+# External
+import datetime
+
+import pytest
+
+# 1. Global vars ===============================================================
+_T0        = datetime.datetime(2020, 1, 1)
+_TIME_STEP = datetime.timedelta(minutes=1)
+
+
+# 2. Functions =================================================================
+def _make_storage(volume: float, rates: list):
+    # step from 0 to 1 just above a volume of 10
+    store = storage.Storage('store', initial_volume=volume)
+    store.add_translator('default', table_1d.Table1d([0.0, 10.0, 10.0001, 20.0],
+                                                     [0.0, 0.0, 1.0, 1.0]))
+    for rate in rates:
+        store.add_rate(rate)
+    return store
+
+
+def _constant_rate(val: float, time_end: datetime.datetime = None):
+    return rate_increase.Rate('rate', typus='constant', time_end=time_end,
+                              const_val=val)
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_value_constant_until_predicted(lazy):
+    bank  = storage_bank.StorageBank(_TIME_STEP, lazy=lazy)
+    store = _make_storage(1.0, [_constant_rate(1.0)])
+    store.bind_bank(bank)
+    bank.finalise()
+
+    until = store.get_constant_until(_T0)
+    assert until is not None
+    assert until < _T0 + 9 * _TIME_STEP   # volume crosses 10 after 9 timesteps
+
+    value = store.get_val()
+    tp    = _T0
+    while (tp + _TIME_STEP < until):
+        tp += _TIME_STEP
+        bank.update(tp)
+        assert store.get_val() == value
+
+    # keeps going until the threshold
+    for _ in range(20):
+        tp += _TIME_STEP
+        bank.update(tp)
+    assert store.get_val() != value
+
+
+def test_constant_until_capped_by_rate_expiry():
+    time_end = _T0 + 3 * _TIME_STEP
+    bank     = storage_bank.StorageBank(_TIME_STEP)
+    store    = _make_storage(1.0, [_constant_rate(0.5, time_end)])
+    store.bind_bank(bank)
+    bank.finalise()
+
+    assert store.get_constant_until(_T0) == time_end
+
+
+def test_constant_until_unknown():
+    # not bound to a bank
+    store = _make_storage(1.0, [_constant_rate(1.0)])
+    assert store.get_constant_until(_T0) is None
+
+    # non-constant rate
+    bank  = storage_bank.StorageBank(_TIME_STEP)
+    store = _make_storage(1.0, [rate_increase.Rate('rate', typus='target',
+                                                   target='num_people_in_consumer_unit')])
+    store.bind_bank(bank)
+    bank.finalise()
+    assert bank.get_rate(0) is None
+    assert store.get_constant_until(_T0) is None
+
+
+def test_constant_until_never_changes():
+    # no rate towards the threshold: constant for good
+    bank  = storage_bank.StorageBank(_TIME_STEP)
+    store = _make_storage(1.0, [_constant_rate(0.0)])
+    store.bind_bank(bank)
+    bank.finalise()
+
+    assert store.get_constant_until(_T0) == datetime.datetime.max
+
+
+# 3. Main Exec =================================================================
@@ -0,0 +1,100 @@
+#
+# ------------------------------------------------------------------------------
+# HUUM - Household Utilities Usage Model (Prototype)
+# Demonstrator for the full model
+# ------------------------------------------------------------------------------
+#
+# Author: Sven Berendsen
+# Date:   2026.10.19
+#
+# Changelog:
+#
+# 2026.10.19 - SBerendsen - start
+#
+# ------------------------------------------------------------------------------
+#
+# Copyright 2026, Sven Berendsen
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+#
+# ------------------------------------------------------------------------------
+#
+# Tests for the model-wide calendar of wake-up timepoints.
+#
+# ------------------------------------------------------------------------------
+#
+
+# 0. Imports ===================================================================
+
+# Internal
+from huum_model.util import wake_calendar
+
+# External
+import datetime
+
+# 1. Global vars ===============================================================
+_T0 = datetime.datetime(2020, 1, 1)
+
+
+# 2. Functions =================================================================
+def _tp(minutes: int):
+    return _T0 + datetime.timedelta(minutes=minutes)
+
+
+def test_wakes_items_when_due():
+    calendar = wake_calendar.WakeCalendar()
+    calendar.schedule('a', _tp(3))
+    calendar.schedule('b', _tp(1))
+    calendar.schedule('c', _tp(1))
+
+    assert calendar.wake_due(_tp(0)) == []
+    assert calendar.wake_due(_tp(1)) == ['b', 'c']
+    assert calendar.is_sleeping('a')
+    assert not calendar.is_sleeping('b')
+
+    # later than due still wakes up
+    assert calendar.wake_due(_tp(10)) == ['a']
+    assert calendar.wake_due(_tp(20)) == []
+
+
+def test_reschedule_replaces_wake_tp():
+    calendar = wake_calendar.WakeCalendar()
+    calendar.schedule('a', _tp(1))
+    calendar.schedule('a', _tp(5))
+
+    assert calendar.wake_due(_tp(2)) == []
+    assert calendar.is_sleeping('a')
+    assert calendar.wake_due(_tp(5)) == ['a']
+
+    # earlier than before
+    calendar.schedule('b', _tp(9))
+    calendar.schedule('b', _tp(7))
+    assert calendar.wake_due(_tp(7)) == ['b']
+    assert calendar.wake_due(_tp(9)) == []
+
+
+def test_cancel():
+    calendar = wake_calendar.WakeCalendar()
+    calendar.schedule('a', _tp(1))
+    calendar.cancel('a')
+    calendar.cancel('b')   # not sleeping: nothing happens
+
+    assert not calendar.is_sleeping('a')
+    assert calendar.wake_due(_tp(1)) == []
+
+    # can sleep again after being cancelled
+    calendar.schedule('a', _tp(2))
+    assert calendar.wake_due(_tp(2)) == ['a']
+
+
+# 3. Main Exec =================================================================